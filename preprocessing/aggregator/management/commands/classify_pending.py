@@ -0,0 +1,89 @@
+"""
+Management command to classify articles saved with deferred classification.
+Drains the pending backlog in batches and writes results back to PreprocessingArticle.
+"""
+from django.core.management.base import BaseCommand
+from aggregator.services import ClassificationBacklog, build_classifier
+from classify_pool import ClassificationPool
+from sentiment import SENTIMENT_BACKENDS
+from functools import partial
+import time
+
+
+class Command(BaseCommand):
+    help = 'Classify articles waiting in the classification backlog'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Articles read and written per batch (default: 200)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Classification worker processes (default: 1, in-process)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=50,
+            help='Articles sent to a worker at a time (default: 50)',
+        )
+        parser.add_argument(
+            '--sentiment-backend',
+            choices=sorted(SENTIMENT_BACKENDS),
+            help='Sentiment analysis backend (default: settings.SENTIMENT_BACKEND)',
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Reclassify every article instead of using the classification cache',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll for new pending articles',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=30,
+            help='Seconds between polls with --loop (default: 30)',
+        )
+
+    def handle(self, *args, **options):
+        classifier_factory = partial(
+            build_classifier,
+            sentiment_backend=options['sentiment_backend'],
+            use_cache=not options['no_cache'],
+        )
+
+        with ClassificationPool(
+            classifier_factory,
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+        ) as pool:
+            backlog = ClassificationBacklog(pool, batch_size=options['batch_size'])
+
+            try:
+                while True:
+                    pending = backlog.pending_count()
+                    if pending:
+                        self.stdout.write(f'{pending} articles pending classification')
+                        started = time.perf_counter()
+                        classified = backlog.drain()
+                        elapsed = time.perf_counter() - started
+                        self.stdout.write(self.style.SUCCESS(
+                            f'✓ Classified {classified} articles in {elapsed:.2f}s'
+                        ))
+                    elif not options['loop']:
+                        self.stdout.write('No articles pending classification')
+
+                    if not options['loop']:
+                        break
+                    time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                self.stdout.write(self.style.WARNING('Stopped'))
@@ -2,13 +2,16 @@
 Management command to fetch articles from RSS feeds.
 Integrated Django version - writes directly to PreprocessingArticle.
 """
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from articles.models import PreprocessingArticle
-from aggregator.services import FeedParser, NewsClassifier
-import logging
-
-logger = logging.getLogger(__name__)
+from articles import stats as article_stats
+from aggregator.services import (
+    DjangoArticleSink, FeedModelSource, RelatedArticleIndex, StoryGroupSuggester, build_classifier
+)
+from ingestion import IngestionPipeline
+from sentiment import SENTIMENT_BACKENDS
+from trends import TrendTracker
+from functools import partial
 
 
 class Command(BaseCommand):
@@ -25,36 +28,87 @@ class Command(BaseCommand):
             type=str,
             help='Fetch from specific source only',
         )
+        parser.add_argument(
+            '--sentiment-backend',
+            choices=sorted(SENTIMENT_BACKENDS),
+            help='Sentiment analysis backend (default: settings.SENTIMENT_BACKEND)',
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Reclassify every article instead of using the classification cache',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Classification worker processes (default: 1, in-process)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=50,
+            help='Articles sent to a worker at a time (default: 50)',
+        )
+        parser.add_argument(
+            '--defer-classification',
+            action='store_true',
+            help='Save articles as pending and leave classification to classify_pending',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting RSS feed aggregation...'))
 
         try:
             # Initialize services
-            feed_parser = FeedParser()
-            classifier = NewsClassifier()
+            classifier_factory = partial(
+                build_classifier,
+                sentiment_backend=options['sentiment_backend'],
+                use_cache=not options['no_cache'],
+            )
+            pipeline = IngestionPipeline(
+                FeedModelSource(),
+                DjangoArticleSink(),
+                classifier_factory,
+                workers=options['workers'],
+                chunk_size=options['chunk_size'],
+                defer_classification=options['defer_classification'],
+                observers=[
+                    TrendTracker(settings.TRENDS_STATE_PATH),
+                    StoryGroupSuggester(),
+                    RelatedArticleIndex(),
+                ],
+            )
+
+            if options['defer_classification']:
+                # Saved as pending; classify_pending fills in classifications later
+                self.stdout.write('Deferring classification - articles will be saved as pending')
+            else:
+                self.stdout.write(
+                    f"Classifying with {options['workers']} worker(s), chunks of {options['chunk_size']}"
+                )
+
+            def report_progress(done, total):
+                self.stdout.write(f'Classified {done}/{total}')
 
-            # Parse feeds
+            # Fetch, classify and store in one pass
             self.stdout.write('Parsing RSS feeds...')
-            articles = feed_parser.parse_all_feeds()
+            articles = pipeline.run(options['source'], dry_run=options['dry_run'], progress=report_progress)
+            stats = pipeline.last_run
 
             if not articles:
                 self.stdout.write(self.style.WARNING('No articles found'))
                 return
 
-            self.stdout.write(f'Parsed {len(articles)} articles')
-
-            # Classify articles
-            self.stdout.write('Classifying articles...')
-            classified_count = 0
+            self.stdout.write(f"Parsed {stats['articles']} articles from {stats['feeds']} feeds")
 
-            for article in articles:
-                classification = classifier.classify_article(article)
-                article['classification'] = classification
-                classified_count += 1
-
-                if classified_count % 50 == 0:
-                    self.stdout.write(f'Classified {classified_count}/{len(articles)}')
+            run = stats['classification']
+            if run:
+                self.stdout.write(
+                    f"Classified {run['articles']} articles in {run['seconds']:.2f}s "
+                    f"({run['articles_per_second']:.0f} articles/s, {run['errors']} errors, "
+                    f"{run['cache_hits']} cache hits)"
+                )
 
             if options['dry_run']:
                 self.stdout.write(self.style.WARNING('DRY RUN - No articles saved'))
@@ -62,52 +116,17 @@ class Command(BaseCommand):
                 for i, article in enumerate(articles[:3], 1):
                     self.stdout.write(f"{i}. {article.get('title')}")
                     self.stdout.write(f"   Source: {article.get('source')}")
-                    self.stdout.write(f"   Topics: {article['classification']['topics']}")
+                    self.stdout.write(f"   Topics: {article['classification'].get('topics', [])}")
                 return
 
-            # Save to database
-            self.stdout.write('Saving articles to database...')
-            new_count = 0
-            duplicate_count = 0
-
-            with transaction.atomic():
-                for article in articles:
-                    # Check for duplicates
-                    exists = PreprocessingArticle.objects.filter(
-                        title=article['title'],
-                        source=article['source'],
-                        published=article['published']
-                    ).exists()
-
-                    if exists:
-                        duplicate_count += 1
-                        continue
-
-                    # Create new article
-                    PreprocessingArticle.objects.create(
-                        title=article['title'],
-                        link=article['link'],
-                        description=article.get('description', ''),
-                        summary=article.get('summary', ''),
-                        source=article['source'],
-                        category=article.get('category', ''),
-                        feed_url=article.get('feed_url', ''),
-                        guid=article.get('guid', ''),
-                        author=article.get('author', ''),
-                        published=article['published'],
-                        fetched_at=article['fetched_at'],
-                        added_by='SYSTEM',
-                        outcome='NEW',
-                    )
-                    new_count += 1
-
             # Summary
-            total = PreprocessingArticle.objects.count()
+            total = article_stats.total()
             self.stdout.write(
                 self.style.SUCCESS(
                     f'\n✓ Aggregation complete!\n'
-                    f'  New articles: {new_count}\n'
-                    f'  Duplicates skipped: {duplicate_count}\n'
+                    f"  New articles: {stats['new']}\n"
+                    f"  Duplicates skipped: {stats['duplicates']}\n"
+                    f"  Near-duplicates linked: {stats['near_duplicates']}\n"
                     f'  Total in database: {total}'
                 )
             )
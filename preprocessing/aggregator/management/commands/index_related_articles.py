@@ -0,0 +1,59 @@
+"""
+Management command to add stored articles to the related-articles index.
+Indexes articles without terms in publication order, exactly as fetch_articles
+indexes new articles.
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from articles.models import ArticleTerm, PreprocessingArticle
+from aggregator.services import RelatedArticleIndex
+from state_store import state_lock, update_state
+from text_vectors import TermVectorizer
+
+
+class Command(BaseCommand):
+    help = 'Index article terms for the related-articles panel'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Articles indexed per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Drop the index and document frequencies first and index every article again',
+        )
+
+    def handle(self, *args, **options):
+        index = RelatedArticleIndex()
+
+        if options['rebuild']:
+            with state_lock(index.state_path):
+                ArticleTerm.objects.all().delete()
+                Path(index.state_path).unlink(missing_ok=True)
+            self.stdout.write(self.style.WARNING('⊘ Cleared the related-articles index'))
+
+        article_ids = list(
+            PreprocessingArticle.objects.filter(~Exists(ArticleTerm.objects.filter(article=OuterRef('pk'))))
+            .order_by('published', 'id').values_list('id', flat=True)
+        )
+        self.stdout.write(f'{len(article_ids)} articles to index')
+
+        indexed = 0
+        batch_size = options['batch_size']
+        for i in range(0, len(article_ids), batch_size):
+            batch = PreprocessingArticle.objects.filter(id__in=article_ids[i:i + batch_size]).only(
+                'id', 'title', 'description'
+            ).order_by('published', 'id')
+            # The state is locked per batch, so fetch runs can index in between
+            with update_state(index.state_path, TermVectorizer) as vectorizer, transaction.atomic():
+                indexed += index.index(batch, vectorizer)
+            self.stdout.write(f'Indexed {indexed} articles')
+
+        self.stdout.write(self.style.SUCCESS(f'✓ Indexed {indexed} articles'))
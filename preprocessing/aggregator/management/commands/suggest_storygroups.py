@@ -0,0 +1,53 @@
+"""
+Management command to rebuild story clusters from recently published articles.
+Discards the clustering state and replays the articles in publication order,
+exactly as fetch_articles clusters new articles, refreshing suggested_storygroup.
+"""
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from articles.models import PreprocessingArticle
+from aggregator.services import StoryGroupSuggester
+
+
+class Command(BaseCommand):
+    help = 'Rebuild story clusters from recent articles and refresh suggested story groups'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=3,
+            help='Cluster articles published in the last N days (default: 3)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Articles clustered per batch (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        Path(settings.STORY_CLUSTERS_STATE_PATH).unlink(missing_ok=True)
+        suggester = StoryGroupSuggester()
+
+        since = timezone.now() - timedelta(days=options['days'])
+        articles = PreprocessingArticle.objects.filter(published__gte=since).order_by('published', 'id')
+        self.stdout.write(f'{articles.count()} articles to cluster')
+
+        PreprocessingArticle.objects.filter(published__gte=since).update(suggested_storygroup='')
+
+        batch = []
+        suggested = 0
+        for article in articles.values('id', 'title', 'description', 'published').iterator():
+            batch.append(article)
+            if len(batch) >= options['batch_size']:
+                suggested += suggester(batch)
+                batch = []
+        if batch:
+            suggested += suggester(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'✓ Wrote {suggested} story group suggestions'))
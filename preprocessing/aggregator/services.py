@@ -1,184 +1,482 @@
 """
-RSS Feed parsing and article classification services.
-Integrated Django version - writes directly to PreprocessingArticle model.
+Django side of the shared ingestion pipeline (src/ingestion).
+Reads feeds from the Feed model and writes directly to the PreprocessingArticle model.
 """
-import feedparser
-import requests
+import heapq
 import logging
-import time
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
-from textblob import TextBlob
+from datetime import timedelta
+from collections import Counter
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 
+from django.conf import settings
+from django.utils import timezone as django_timezone
 
-logger = logging.getLogger(__name__)
-
+from classification_cache import ClassificationCache
+from classifier import NewsClassifier
+from ingestion import FeedSpec
+from near_duplicates import MinHasher, NearDuplicateIndex, StoredSignature
+from state_store import load_state, update_state
+from story_clusters import StoryClusterTracker
+from taxonomy import DEFAULT_TAXONOMY_PATH
+from text_vectors import TermVector, TermVectorizer
 
-class FeedParser:
-    """RSS feed parser integrated with Django - reads feeds from database."""
-
-    def __init__(self):
-        """Initialize the RSS feed parser."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-
-    def parse_feed(self, feed_url: str, source_name: str, category: str) -> List[Dict]:
-        """Parse a single RSS feed and return articles."""
-        articles = []
-
-        try:
-            logger.info(f"Parsing feed: {feed_url}")
-
-            feed = feedparser.parse(feed_url)
-
-            if feed.status != 200:
-                logger.warning(f"HTTP {feed.status} for feed {feed_url}")
-                return articles
-
-            for entry in feed.entries:
-                article = self._extract_article_data(entry, source_name, category, feed_url)
-                if article:
-                    articles.append(article)
-
-        except Exception as e:
-            logger.error(f"Error parsing feed {feed_url}: {str(e)}")
-
-        return articles
-
-    def _extract_article_data(self, entry, source_name: str, category: str, feed_url: str) -> Optional[Dict]:
-        """Extract article data from a feed entry."""
-        try:
-            article = {
-                'title': getattr(entry, 'title', ''),
-                'link': getattr(entry, 'link', ''),
-                'description': getattr(entry, 'description', ''),
-                'summary': getattr(entry, 'summary', ''),
-                'source': source_name,
-                'category': category,
-                'feed_url': feed_url,
-                'guid': getattr(entry, 'id', getattr(entry, 'link', '')),
-            }
-
-            # Extract publication date
-            published_time = getattr(entry, 'published_parsed', None)
-            if published_time:
-                article['published'] = datetime(*published_time[:6], tzinfo=timezone.utc)
-            else:
-                article['published'] = datetime.now(timezone.utc)
 
-            # Extract author
-            author = getattr(entry, 'author', '')
-            if hasattr(entry, 'authors') and entry.authors:
-                author = ', '.join([a.get('name', '') for a in entry.authors if a.get('name')])
-            article['author'] = author
+logger = logging.getLogger(__name__)
 
-            # Extract tags
-            tags = []
-            if hasattr(entry, 'tags'):
-                tags = [tag.term for tag in entry.tags if hasattr(tag, 'term')]
-            article['tags'] = tags
 
-            article['fetched_at'] = datetime.now(timezone.utc)
+def get_classification_cache() -> Optional[ClassificationCache]:
+    """Return the configured classification cache, or None when disabled."""
+    path = getattr(settings, 'CLASSIFICATION_CACHE_PATH', None)
+    if not path:
+        return None
+    return ClassificationCache(
+        str(path),
+        max_entries=getattr(settings, 'CLASSIFICATION_CACHE_MAX_ENTRIES', 200000)
+    )
 
-            return article
 
-        except Exception as e:
-            logger.error(f"Error extracting article data: {str(e)}")
-            return None
+class FeedModelSource:
+    """Ingestion source reading active feeds from the Feed model."""
 
-    def parse_all_feeds(self) -> List[Dict]:
-        """Parse all active RSS feeds from database and return all articles."""
+    def feeds(self, source: Optional[str] = None) -> List[FeedSpec]:
+        """Return active feeds, optionally only those of one source."""
         from feeds.models import Feed
 
-        all_articles = []
-
-        # Get all active feeds from database
-        active_feeds = Feed.objects.filter(active=True).order_by('source_name', 'category')
-
-        if not active_feeds.exists():
-            logger.warning("No active feeds found in database")
-            return all_articles
-
-        logger.info(f"Processing {active_feeds.count()} active feeds")
-
-        for feed in active_feeds:
-            articles = self.parse_feed(feed.url, feed.source_name, feed.category)
-            all_articles.extend(articles)
-            time.sleep(1)  # Be respectful to servers
-
-        logger.info(f"Total articles parsed: {len(all_articles)}")
-        return all_articles
-
-
-class NewsClassifier:
-    """Article classification using keyword matching and sentiment analysis."""
+        active_feeds = Feed.objects.filter(active=True)
+        if source:
+            active_feeds = active_feeds.filter(source_name=source)
+
+        return [
+            FeedSpec(url, source_name, category)
+            for url, source_name, category in active_feeds.order_by('source_name', 'category')
+            .values_list('url', 'source_name', 'category')
+        ]
+
+
+class DjangoArticleSink:
+    """
+    Ingestion sink writing new articles to PreprocessingArticle.
+
+    Articles already stored (same title + source + published) are skipped. Existing
+    keys are looked up in batches, new rows are bulk inserted and their topic and
+    geography links written in the same transaction.
+    """
+
+    lookup_batch_size = 500
+
+    def __init__(self, added_by: str = 'SYSTEM'):
+        self.added_by = added_by
+        self.writer = ClassificationWriter()
+        self.linker = NearDuplicateLinker()
+
+    def _existing_keys(self, articles: List[Dict]) -> set:
+        """(title, source, published) keys among ``articles`` that are already stored."""
+        from articles.models import PreprocessingArticle
+
+        published = sorted({article['published'] for article in articles})
+        sources = {article['source'] for article in articles}
+        existing = set()
+        for i in range(0, len(published), self.lookup_batch_size):
+            existing.update(
+                PreprocessingArticle.objects.filter(
+                    source__in=sources,
+                    published__in=published[i:i + self.lookup_batch_size]
+                ).values_list('title', 'source', 'published')
+            )
+        return existing
+
+    def save(self, articles: List[Dict]) -> List[Dict]:
+        """Insert articles that are not already stored. Returns the inserted articles."""
+        from articles import facets as article_facets
+        from articles.models import PreprocessingArticle, make_snippet
+        from django.db import transaction
+
+        now = django_timezone.now()
+        with transaction.atomic():
+            seen = self._existing_keys(articles)
+            rows = []
+            new_articles = []
+            for article in articles:
+                key = (article['title'], article['source'], article['published'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_articles.append(article)
+
+                status = article.get('classification_status', 'pending')
+                signature = self.linker.hasher.signature(article['title'], article.get('description', ''))
+                rows.append(PreprocessingArticle(
+                    title=article['title'],
+                    link=article['link'],
+                    description=article.get('description', ''),
+                    summary=article.get('summary', ''),
+                    snippet=make_snippet(article.get('description', ''), article.get('summary', '')),
+                    source=article['source'],
+                    category=article.get('category', ''),
+                    feed_url=article.get('feed_url', ''),
+                    guid=article.get('guid', ''),
+                    author=article.get('author', ''),
+                    published=article['published'],
+                    fetched_at=article['fetched_at'],
+                    added_by=self.added_by,
+                    outcome='NEW',
+                    classification=article.get('classification') or {},
+                    classification_status=status,
+                    classified_at=None if status == 'pending' else now,
+                    minhash=self.linker.hasher.pack(signature) if signature else b'',
+                ))
+
+            PreprocessingArticle.objects.bulk_create(rows, batch_size=500)
+
+            # Topic/geography links for the whole batch in one pass
+            self.writer.write([(row.pk, row.classification) for row in rows if row.classification])
+            self.linker.link(rows)
+
+        # bulk_create sends no post_save, so the cached filter facets are refreshed here
+        if rows:
+            article_facets.invalidate()
+
+        for article, row in zip(new_articles, rows):
+            article['id'] = row.pk
+            if row.duplicate_of_id:
+                article['duplicate_of'] = row.duplicate_of_id
+
+        return new_articles
+
+
+class NearDuplicateLinker:
+    """
+    Links new articles to earlier near-duplicates using their stored MinHash signatures.
+
+    Candidates come from ArticleSignatureBand key lookups, so the cost of a batch
+    depends on the batch size, not on how many articles are stored.
+    """
+
+    lookup_batch_size = 500
+
+    def __init__(self, hasher: Optional[MinHasher] = None):
+        self.hasher = hasher or MinHasher()
+        self.index = NearDuplicateIndex(
+            self._candidates_for,
+            self._load,
+            self.hasher,
+            threshold=getattr(settings, 'NEAR_DUPLICATE_THRESHOLD', 0.6),
+            window=timedelta(days=getattr(settings, 'NEAR_DUPLICATE_WINDOW_DAYS', 3)),
+        )
+
+    def _candidates_for(self, keys: List[int]) -> Dict[int, Set[int]]:
+        from articles.models import ArticleSignatureBand
+
+        candidates: Dict[int, Set[int]] = {}
+        for i in range(0, len(keys), self.lookup_batch_size):
+            rows = ArticleSignatureBand.objects.filter(
+                key__in=keys[i:i + self.lookup_batch_size]
+            ).values_list('key', 'article_id')
+            for key, article_id in rows:
+                candidates.setdefault(key, set()).add(article_id)
+        return candidates
+
+    def _load(self, article_ids: Iterable[int]) -> Dict[int, StoredSignature]:
+        from articles.models import PreprocessingArticle
+
+        article_ids = list(article_ids)
+        stored = {}
+        for i in range(0, len(article_ids), self.lookup_batch_size):
+            rows = PreprocessingArticle.objects.filter(
+                id__in=article_ids[i:i + self.lookup_batch_size], minhash__isnull=False
+            ).values_list('id', 'minhash', 'published', 'duplicate_of_id')
+            for article_id, minhash, published, duplicate_of in rows:
+                stored[article_id] = StoredSignature(self.hasher.unpack(minhash), published, duplicate_of)
+        return stored
+
+    def link(self, articles: List) -> int:
+        """
+        Index saved PreprocessingArticles that have a ``minhash`` and set ``duplicate_of``
+        on those matching an earlier article. Returns the number linked.
+        """
+        from articles.models import ArticleSignatureBand, PreprocessingArticle
+
+        entries = [
+            (article.pk, self.hasher.unpack(article.minhash), article.published)
+            for article in articles if article.minhash
+        ]
+        if not entries:
+            return 0
+
+        matches = self.index.match(entries)
+        linked = []
+        for article in articles:
+            if matches.get(article.pk):
+                article.duplicate_of_id = matches[article.pk]
+                linked.append(article)
+
+        PreprocessingArticle.objects.bulk_update(linked, ['duplicate_of'], batch_size=500)
+        ArticleSignatureBand.objects.bulk_create([
+            ArticleSignatureBand(article_id=article_id, key=key)
+            for article_id, signature, _ in entries for key in self.hasher.band_keys(signature)
+        ], batch_size=1000)
+        return len(linked)
+
+
+class StoryGroupSuggester:
+    """
+    Ingestion observer filling in ``suggested_storygroup`` from online story clustering.
+
+    Each run clusters only its new articles (src/story_clusters.py). A suggestion is
+    written once a cluster has two or more articles, including the earlier members
+    that opened it. When reviewers have already grouped some members, their most
+    common storygroup is suggested instead of the generated label. Articles with a
+    storygroup are never changed.
+    """
+
+    def __init__(self, state_path=None):
+        self.tracker = StoryClusterTracker(
+            str(state_path or settings.STORY_CLUSTERS_STATE_PATH),
+            threshold=getattr(settings, 'STORY_CLUSTER_THRESHOLD', 0.35),
+            window_hours=getattr(settings, 'STORY_CLUSTER_WINDOW_HOURS', 72),
+        )
+
+    def __call__(self, articles: List[Dict]) -> int:
+        """Cluster newly stored articles (with ``id`` set). Returns the number of suggestions written."""
+        from articles.models import PreprocessingArticle
+
+        assigned = self.tracker.assign(article for article in articles if article.get('id'))
+        clusters = {cluster.id: cluster for cluster in assigned.values() if cluster.size > 1}
+        if not clusters:
+            return 0
+
+        member_ids = {article_id for cluster in clusters.values() for article_id in cluster.members}
+        reviewed = dict(
+            PreprocessingArticle.objects.filter(id__in=member_ids).exclude(storygroup='')
+            .values_list('id', 'storygroup')
+        )
+
+        by_label: Dict[str, List[int]] = {}
+        for cluster in clusters.values():
+            chosen = Counter(reviewed[i] for i in cluster.members if i in reviewed).most_common(1)
+            label = chosen[0][0] if chosen else cluster.label
+            by_label.setdefault(label, []).extend(i for i in cluster.members if i not in reviewed)
+
+        suggested = 0
+        for label, article_ids in by_label.items():
+            suggested += PreprocessingArticle.objects.filter(id__in=article_ids, storygroup='').update(
+                suggested_storygroup=label[:200]
+            )
+        return suggested
+
+
+class RelatedArticleIndex:
+    """
+    Inverted index of article terms for finding related coverage.
+
+    Each article is stored as its top TF-IDF terms (src/text_vectors.py) in
+    ArticleTerm, so the index grows by a fixed number of rows per article and
+    lives in the database rather than in memory. Document frequencies are kept
+    in a fixed-size sketch pickled at RELATED_ARTICLES_STATE_PATH. Related
+    articles are scored by cosine similarity over the newest postings of the
+    article's terms.
+    """
+
+    def __init__(self, state_path=None, max_postings: Optional[int] = None):
+        self.state_path = str(state_path or settings.RELATED_ARTICLES_STATE_PATH)
+        self.max_postings = max_postings or getattr(settings, 'RELATED_ARTICLES_MAX_POSTINGS', 2000)
+
+    def load_vectorizer(self) -> TermVectorizer:
+        return load_state(self.state_path, TermVectorizer)
+
+    def index(self, articles: Iterable, vectorizer: Optional[TermVectorizer] = None) -> int:
+        """
+        Add articles (PreprocessingArticles or dicts with id, title, description)
+        to the index. Returns the number indexed. Without a ``vectorizer``, the
+        saved one is loaded, updated and saved under the state lock; a caller
+        passing its own holds the lock itself.
+        """
+        from articles.models import ArticleTerm
+
+        if vectorizer is None:
+            # Locked so that overlapping fetch runs do not lose each other's updates
+            with update_state(self.state_path, TermVectorizer) as vectorizer:
+                return self.index(articles, vectorizer)
+
+        terms = []
+        indexed = 0
+        for article in articles:
+            if isinstance(article, dict):
+                article_id, title, description = article.get('id'), article.get('title'), article.get('description')
+            else:
+                article_id, title, description = article.pk, article.title, article.description
+            vector = vectorizer.vectorize(title, description) if article_id else None
+            if vector:
+                terms.extend(ArticleTerm(article_id=article_id, term=term[:100], weight=weight)
+                             for term, weight in vector.items())
+                indexed += 1
+
+        ArticleTerm.objects.bulk_create(terms, batch_size=1000)
+        return indexed
+
+    def __call__(self, articles: List[Dict]) -> int:
+        """Pipeline observer: index newly stored articles."""
+        return self.index(articles)
+
+    def vector_for(self, article) -> Optional[TermVector]:
+        """The article's stored terms, or a vector computed on the fly if it is not indexed yet."""
+        vector = dict(article.terms.values_list('term', 'weight'))
+        if vector:
+            return vector
+        return self.load_vectorizer().vectorize(article.title, article.description, update=False)
+
+    def related(self, article, limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        (article id, similarity) of the ``limit`` articles most similar to ``article``,
+        best first. The article's own near-duplicate group is left out.
+        """
+        from articles.models import ArticleTerm, PreprocessingArticle
+
+        vector = self.vector_for(article)
+        if not vector:
+            return []
+
+        # Only the newest postings of each term are read (a covering index scan),
+        # which bounds the cost of a lookup however common its terms are
+        scores: Dict[int, float] = {}
+        for term, query_weight in vector.items():
+            postings = ArticleTerm.objects.filter(term=term).order_by('-article_id').values_list(
+                'article_id', 'weight'
+            )[:self.max_postings]
+            for article_id, weight in postings:
+                scores[article_id] = scores.get(article_id, 0.0) + query_weight * weight
+
+        root = article.duplicate_of_id or article.pk
+        scores.pop(root, None)
+        for article_id in PreprocessingArticle.objects.filter(duplicate_of_id=root).values_list('id', flat=True):
+            scores.pop(article_id, None)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda x: (x[1], x[0]))
+
+
+def build_classifier(sentiment_backend: Optional[str] = None, use_cache: bool = True) -> NewsClassifier:
+    """Build the shared classifier from Django settings (also used by pool worker processes)."""
+    from django.apps import apps
+    if not apps.ready:
+        # Spawned workers start without Django configured
+        import django
+        django.setup()
+
+    return NewsClassifier(
+        sentiment_backend=sentiment_backend or getattr(settings, 'SENTIMENT_BACKEND', None),
+        cache=get_classification_cache() if use_cache else None,
+        taxonomy_path=str(getattr(settings, 'TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)),
+        taxonomy_cache_dir=getattr(settings, 'TAXONOMY_CACHE_DIR', None),
+    )
+
+
+class ClassificationWriter:
+    """
+    Persists classifier topics and geographies into the ArticleTopic/ArticleGeography tables.
+
+    Topic and geography ids are resolved once and kept in memory, so writing a batch
+    costs one delete and one bulk insert per table.
+    """
 
     def __init__(self):
-        self.topic_keywords = {
-            'Economics': ['economy', 'economic', 'gdp', 'growth', 'recession', 'inflation',
-                         'deflation', 'unemployment', 'jobs', 'fiscal', 'monetary', 'budget'],
-            'Central Banking': ['fed', 'federal reserve', 'central bank', 'interest rate',
-                               'monetary policy', 'ecb', 'boe'],
-            'Politics': ['government', 'political', 'politics', 'election', 'vote',
-                        'campaign', 'policy', 'legislation'],
-            'Geopolitics': ['international', 'diplomacy', 'foreign policy', 'sanctions',
-                           'trade war', 'conflict', 'nato', 'un'],
-            'Business': ['company', 'corporate', 'business', 'enterprise', 'ceo',
-                        'executive', 'shares', 'stock', 'revenue', 'profit'],
-            'Finance': ['market', 'trading', 'investment', 'investor', 'fund', 'bank',
-                       'banking', 'financial', 'credit', 'bond', 'equity'],
-            'Technology': ['tech', 'technology', 'digital', 'ai', 'blockchain',
-                          'cryptocurrency', 'software', 'innovation'],
-            'Energy': ['oil', 'gas', 'energy', 'renewable', 'solar', 'wind', 'nuclear',
-                      'coal', 'opec'],
-            'Climate': ['climate', 'environment', 'green', 'carbon', 'emissions',
-                       'sustainability', 'global warming'],
-            'Trade': ['trade', 'export', 'import', 'tariff', 'wto', 'free trade'],
-        }
-
-    def classify_article(self, article: Dict) -> Dict:
-        """Classify an article and return classification data."""
-        text = f"{article.get('title', '')} {article.get('description', '')} {article.get('summary', '')}".lower()
-
-        return {
-            'topics': self._extract_topics(text),
-            'sentiment': self._analyze_sentiment(text),
-        }
-
-    def _extract_topics(self, text: str) -> List[str]:
-        """Extract topics from text."""
-        matched_topics = []
-
-        for topic, keywords in self.topic_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                matched_topics.append((topic, score))
-
-        # Return top 3 topics
-        matched_topics.sort(key=lambda x: x[1], reverse=True)
-        return [topic for topic, score in matched_topics[:3]]
-
-    def _analyze_sentiment(self, text: str) -> Dict:
-        """Analyze sentiment of the text."""
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-
-            if polarity > 0.1:
-                sentiment_label = 'positive'
-            elif polarity < -0.1:
-                sentiment_label = 'negative'
-            else:
-                sentiment_label = 'neutral'
-
-            return {
-                'label': sentiment_label,
-                'polarity': polarity,
-            }
-        except:
-            return {
-                'label': 'neutral',
-                'polarity': 0.0,
-            }
+        self._topic_ids: Dict[str, int] = {}
+        self._geography_ids: Dict[str, int] = {}
+
+    @staticmethod
+    def _resolve_ids(model, names, cache: Dict[str, int]) -> Dict[str, int]:
+        """Map names to primary keys, creating unknown names."""
+        missing = [name for name in names if name not in cache]
+        if missing:
+            model.objects.bulk_create([model(name=name) for name in missing], ignore_conflicts=True)
+            cache.update(model.objects.filter(name__in=missing).values_list('name', 'id'))
+        return cache
+
+    def write(self, results: List[Tuple[int, Optional[Dict]]]):
+        """Replace the topic/geography links for each (article_id, classification) pair."""
+        from articles.models import ArticleGeography, ArticleTopic, Geography, Topic
+
+        results = [(article_id, classification or {}) for article_id, classification in results]
+        if not results:
+            return
+
+        topic_ids = self._resolve_ids(
+            Topic, {name for _, c in results for name, _ in c.get('topics', [])}, self._topic_ids
+        )
+        geography_ids = self._resolve_ids(
+            Geography, {name for _, c in results for name, _ in c.get('geographies', [])}, self._geography_ids
+        )
+
+        article_ids = [article_id for article_id, _ in results]
+        ArticleTopic.objects.filter(article_id__in=article_ids).delete()
+        ArticleGeography.objects.filter(article_id__in=article_ids).delete()
+
+        ArticleTopic.objects.bulk_create([
+            ArticleTopic(article_id=article_id, topic_id=topic_ids[name], confidence=confidence)
+            for article_id, c in results for name, confidence in c.get('topics', [])
+        ], batch_size=500)
+        ArticleGeography.objects.bulk_create([
+            ArticleGeography(article_id=article_id, geography_id=geography_ids[name], confidence=confidence)
+            for article_id, c in results for name, confidence in c.get('geographies', [])
+        ], batch_size=500)
+
+
+class ClassificationBacklog:
+    """Classifies articles saved with classification_status='pending' in batches."""
+
+    def __init__(self, pool, batch_size: int = 200):
+        """
+        Args:
+            pool: ClassificationPool used to classify each batch
+            batch_size: Articles read and written back per batch
+        """
+        self.pool = pool
+        self.batch_size = batch_size
+        self.writer = ClassificationWriter()
+
+    @staticmethod
+    def pending_count() -> int:
+        """Number of articles waiting for classification."""
+        from articles.models import PreprocessingArticle
+        return PreprocessingArticle.objects.filter(classification_status='pending').count()
+
+    def process_batch(self) -> int:
+        """Classify the oldest pending batch and write results back. Returns batch size."""
+        from articles.models import PreprocessingArticle
+        from django.db import transaction
+
+        batch = list(
+            PreprocessingArticle.objects.filter(classification_status='pending')
+            .order_by('id')
+            .only('id', 'title', 'description', 'summary')[:self.batch_size]
+        )
+        if not batch:
+            return 0
+
+        results = self.pool.classify([
+            {'title': a.title, 'description': a.description, 'summary': a.summary}
+            for a in batch
+        ])
+
+        now = django_timezone.now()
+        for article, (classification, error) in zip(batch, results):
+            if error:
+                logger.error(f"Error classifying article {article.pk}: {error}")
+            article.classification = classification or {}
+            article.classification_status = 'failed' if error else 'classified'
+            article.classified_at = now
+
+        with transaction.atomic():
+            PreprocessingArticle.objects.bulk_update(
+                batch, ['classification', 'classification_status', 'classified_at']
+            )
+            self.writer.write([(article.pk, article.classification) for article in batch])
+        return len(batch)
+
+    def drain(self) -> int:
+        """Process batches until the backlog is empty. Returns articles classified."""
+        total = 0
+        while True:
+            processed = self.process_batch()
+            if not processed:
+                return total
+            total += processed
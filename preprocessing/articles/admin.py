@@ -1,11 +1,40 @@
 from django.contrib import admin
-from .models import PreprocessingArticle
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Count
+from .models import ArticleGeography, ArticleTopic, Geography, PreprocessingArticle, Topic
+from .search import search_articles
+
+
+class ArticleTopicInline(admin.TabularInline):
+    """Classifier topics shown on the article page."""
+
+    model = ArticleTopic
+    extra = 0
+    autocomplete_fields = ['topic']
+
+
+class ArticleGeographyInline(admin.TabularInline):
+    """Classifier geographies shown on the article page."""
+
+    model = ArticleGeography
+    extra = 0
+    autocomplete_fields = ['geography']
+
+
+class ArticleChangeList(ChangeList):
+    """Changelist loading only the list columns; the change form still loads whole rows."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        return super().get_queryset(request, *args, **kwargs).for_list()
 
 
 @admin.register(PreprocessingArticle)
 class PreprocessingArticleAdmin(admin.ModelAdmin):
     """Admin interface for PreprocessingArticle."""
 
+    inlines = [ArticleTopicInline, ArticleGeographyInline]
+    raw_id_fields = ['duplicate_of']
+
     list_display = [
         'title_short',
         'source',
@@ -23,6 +52,7 @@ class PreprocessingArticleAdmin(admin.ModelAdmin):
         'time_added',
     ]
 
+    # Searched through the full-text index (articles/search.py), not these columns
     search_fields = [
         'title',
         'description',
@@ -42,7 +72,7 @@ class PreprocessingArticleAdmin(admin.ModelAdmin):
             'fields': ('title', 'link', 'description', 'summary', 'source', 'category', 'author', 'published')
         }),
         ('Preprocessing Info', {
-            'fields': ('outcome', 'storygroup', 'added_by', 'modified_by')
+            'fields': ('outcome', 'storygroup', 'suggested_storygroup', 'duplicate_of', 'added_by', 'modified_by')
         }),
         ('Metadata', {
             'fields': ('time_added', 'last_synced', 'source_article_id', 'fetched_at'),
@@ -54,6 +84,14 @@ class PreprocessingArticleAdmin(admin.ModelAdmin):
 
     actions = ['mark_as_processed', 'mark_as_rejected', 'mark_as_new']
 
+    def get_changelist(self, request, **kwargs):
+        return ArticleChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return search_articles(queryset, search_term), False
+
     def title_short(self, obj):
         """Return shortened title for list display."""
         return obj.title[:75] + '...' if len(obj.title) > 75 else obj.title
@@ -76,3 +114,40 @@ class PreprocessingArticleAdmin(admin.ModelAdmin):
         count = queryset.update(outcome='NEW')
         self.message_user(request, f'{count} article(s) marked as new.')
     mark_as_new.short_description = 'Mark selected as New'
+
+
+@admin.register(Topic)
+class TopicAdmin(admin.ModelAdmin):
+    """Admin interface for classifier topics."""
+
+    list_display = ['name', 'parent', 'article_count']
+    search_fields = ['name', 'description']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('parent').annotate(
+            num_articles=Count('article_topics')
+        )
+
+    def article_count(self, obj):
+        """Return number of articles linked to the topic."""
+        return obj.num_articles
+    article_count.short_description = 'Articles'
+    article_count.admin_order_field = 'num_articles'
+
+
+@admin.register(Geography)
+class GeographyAdmin(admin.ModelAdmin):
+    """Admin interface for classifier geographies."""
+
+    list_display = ['name', 'country_code', 'region', 'continent', 'article_count']
+    list_filter = ['continent']
+    search_fields = ['name', 'country_code']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(num_articles=Count('article_geographies'))
+
+    def article_count(self, obj):
+        """Return number of articles linked to the geography."""
+        return obj.num_articles
+    article_count.short_description = 'Articles'
+    article_count.admin_order_field = 'num_articles'
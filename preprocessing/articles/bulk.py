@@ -0,0 +1,90 @@
+"""
+Bulk review actions applied to every article in a queryset.
+
+The articles are walked in id order and changed with one set-based UPDATE per
+chunk, each in its own short transaction, so a large action never holds the
+write lock for long and never loads the rows into Python. The ArticleStat
+triggers keep the counters current as each chunk is written.
+
+Very large actions can run in a background thread; see ``apply_in_background``.
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, Q
+
+from . import facets
+from .models import PreprocessingArticle
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_ACTIONS = {
+    'mark_processed': 'processed',
+    'mark_rejected': 'rejected',
+    'mark_new': 'NEW',
+}
+
+
+def _steps(action: str, storygroup: str, modified_by: str) -> List[Tuple[str, Q, Dict]]:
+    """(name, condition, changes) for each UPDATE the action makes."""
+    steps = []
+    if action in OUTCOME_ACTIONS:
+        steps.append((action, Q(), {'outcome': OUTCOME_ACTIONS[action], 'modified_by': modified_by}))
+    elif action == 'accept_suggested':
+        # Only fills in articles a reviewer has not grouped yet
+        steps.append((action, Q(storygroup='') & ~Q(suggested_storygroup=''), {
+            'storygroup': F('suggested_storygroup'), 'modified_by': modified_by,
+        }))
+    if storygroup:
+        steps.append(('storygroup', Q(), {'storygroup': storygroup}))
+    return steps
+
+
+def apply(queryset, action: str, storygroup: str = '', modified_by: str = '',
+          chunk_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Apply ``action`` (and the ``storygroup``, if given) to every article in the
+    queryset. Returns {step: articles changed}, the step being the action name
+    or 'storygroup'.
+    """
+    chunk_size = chunk_size or settings.BULK_ACTION_CHUNK_SIZE
+    steps = _steps(action, storygroup, modified_by)
+    counts = {name: 0 for name, _, _ in steps}
+    if not steps:
+        return counts
+
+    # Walk by id rather than re-running the filter, since the update may move
+    # articles out of it (e.g. marking NEW articles as rejected)
+    ids = queryset.order_by('pk').values_list('pk', flat=True)
+    last = 0
+    while True:
+        chunk = list(ids.filter(pk__gt=last)[:chunk_size])
+        if not chunk:
+            break
+        last = chunk[-1]
+        with transaction.atomic():
+            for name, condition, changes in steps:
+                counts[name] += PreprocessingArticle.objects.filter(condition, pk__in=chunk).update(**changes)
+
+    if counts.get('accept_suggested') or counts.get('storygroup'):
+        facets.invalidate()
+    return counts
+
+
+def apply_in_background(queryset, action: str, storygroup: str = '', modified_by: str = '') -> threading.Thread:
+    """Run ``apply`` in a daemon thread; the result is logged."""
+    def run():
+        try:
+            counts = apply(queryset, action, storygroup, modified_by)
+            logger.info(f"Bulk action {action or 'storygroup'} finished: {counts}")
+        except Exception:
+            logger.exception(f"Bulk action {action or 'storygroup'} failed")
+        finally:
+            connections.close_all()
+
+    thread = threading.Thread(target=run, name=f'bulk-{action or "storygroup"}', daemon=True)
+    thread.start()
+    return thread
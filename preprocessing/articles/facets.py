@@ -0,0 +1,77 @@
+"""
+Filter facets for the article list: the distinct values offered in the filter
+dropdowns, and per-value article counts for the current filter.
+
+Both are cached until articles are created, deleted or regrouped. Single-object
+saves and deletes invalidate through signals (see ``signals.py``); bulk
+``update()`` and ``bulk_create()`` paths that change sources or story groups
+call ``invalidate()`` themselves, since they send no signals. Counts also
+expire after FACET_COUNTS_TIMEOUT, as outcome changes do not invalidate them.
+"""
+import hashlib
+from collections import Counter
+from typing import Dict, List, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db.models import Count
+
+from common.utils.cache import bump_version, cached
+
+from . import stats as article_stats
+
+NAMESPACE = 'facets:articles'
+
+# Fields whose distinct values are offered as facets
+FACET_FIELDS = ('source', 'storygroup')
+
+# Fields counted per value in the filter panel
+COUNT_FIELDS = ('outcome', 'source', 'category', 'storygroup')
+COUNT_LABELS = {'outcome': 'Status', 'source': 'Source', 'category': 'Category', 'storygroup': 'Story Group'}
+
+
+def values(field: str) -> List[str]:
+    """Non-empty values of ``field`` held by at least one article, sorted."""
+    return cached(NAMESPACE, field, lambda: article_stats.values(field))
+
+
+def _grouped_counts(queryset) -> Dict[str, Counter]:
+    """Per-value counts of every COUNT_FIELDS field in one GROUP BY over the queryset."""
+    counts = {field: Counter() for field in COUNT_FIELDS}
+    rows = queryset.order_by().values_list(*COUNT_FIELDS).annotate(n=Count('id'))
+    for row in rows:
+        n = row[-1]
+        for field, value in zip(COUNT_FIELDS, row):
+            counts[field][value] += n
+    return counts
+
+
+def _stat_counts() -> Dict[str, Counter]:
+    """The same counts for the unfiltered list, read from the listed ArticleStat counters."""
+    return {
+        field: Counter(article_stats.counts(article_stats.LISTED_PREFIX + field)) for field in COUNT_FIELDS
+    }
+
+
+def counts(queryset, filters: Dict[str, str], limit: int = 10) -> Dict[str, List[Tuple[str, int]]]:
+    """
+    {field: [(value, count), ...]} for the articles in ``queryset``, the largest
+    ``limit`` non-empty values per field. ``filters`` are the request's filter
+    parameters that produced the queryset and key the cache; with none, the
+    counts come from the listed ArticleStat counters, which like the list leave
+    out collapsed near-duplicates.
+    """
+    signature = hashlib.sha1(urlencode(sorted(filters.items())).encode()).hexdigest()
+
+    def compute():
+        by_field = _grouped_counts(queryset) if filters else _stat_counts()
+        return {
+            field: [(value, n) for value, n in by_field[field].most_common() if value][:limit]
+            for field in COUNT_FIELDS
+        }
+
+    return cached(NAMESPACE, f'counts:{signature}:{limit}', compute, timeout=settings.FACET_COUNTS_TIMEOUT)
+
+
+def invalidate() -> None:
+    bump_version(NAMESPACE)
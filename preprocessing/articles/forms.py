@@ -1,5 +1,5 @@
 from django import forms
-from .models import PreprocessingArticle
+from .models import Geography, PreprocessingArticle, Topic
 
 
 class ArticleFilterForm(forms.Form):
@@ -29,12 +29,21 @@ class ArticleFilterForm(forms.Form):
         })
     )
 
+    category = forms.CharField(
+        required=False,
+        max_length=100,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control form-control-sm',
+            'placeholder': 'Feed category...'
+        })
+    )
+
     search = forms.CharField(
         required=False,
         max_length=500,
         widget=forms.TextInput(attrs={
             'class': 'form-control form-control-sm',
-            'placeholder': 'Search title...'
+            'placeholder': 'Search text ("phrase", prefix*)...'
         })
     )
 
@@ -47,6 +56,40 @@ class ArticleFilterForm(forms.Form):
         })
     )
 
+    topic = forms.ModelChoiceField(
+        queryset=Topic.objects.all(),
+        to_field_name='name',
+        required=False,
+        empty_label='All',
+        widget=forms.Select(attrs={'class': 'form-control form-control-sm'})
+    )
+
+    geography = forms.ModelChoiceField(
+        queryset=Geography.objects.all(),
+        to_field_name='name',
+        required=False,
+        empty_label='All',
+        widget=forms.Select(attrs={'class': 'form-control form-control-sm'})
+    )
+
+    min_confidence = forms.FloatField(
+        required=False,
+        min_value=0,
+        max_value=1,
+        label='Min Confidence',
+        widget=forms.NumberInput(attrs={
+            'class': 'form-control form-control-sm',
+            'step': '0.05',
+            'placeholder': '0.0'
+        })
+    )
+
+    show_duplicates = forms.BooleanField(
+        required=False,
+        label='Show near-duplicates',
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+
     sort = forms.ChoiceField(
         required=False,
         choices=[
@@ -60,6 +103,7 @@ class ArticleFilterForm(forms.Form):
             ('-source', 'Source (Z-A)'),
             ('outcome', 'Status (A-Z)'),
             ('-outcome', 'Status (Z-A)'),
+            ('relevance', 'Relevance (with search)'),
         ],
         initial='-time_added',
         widget=forms.Select(attrs={'class': 'form-control form-control-sm'})
@@ -94,13 +138,15 @@ class ArticleEditForm(forms.ModelForm):
 class BulkActionForm(forms.Form):
     """Form for bulk actions on multiple articles."""
 
+    ACTIONS = [
+        ('mark_processed', 'Mark as Processed'),
+        ('mark_rejected', 'Mark as Rejected'),
+        ('mark_new', 'Mark as New'),
+        ('accept_suggested', 'Accept Suggested Story Groups'),
+    ]
+
     action = forms.ChoiceField(
-        choices=[
-            ('', 'Select action...'),
-            ('mark_processed', 'Mark as Processed'),
-            ('mark_rejected', 'Mark as Rejected'),
-            ('mark_new', 'Mark as New'),
-        ],
+        choices=[('', 'Select action...')] + ACTIONS,
         required=True,
         widget=forms.Select(attrs={'class': 'form-control form-control-sm'})
     )
@@ -0,0 +1,63 @@
+"""
+Management command to sync Topic and Geography rows with config/taxonomy.yaml.
+Keywords stay in the YAML file; this copies names, parents and descriptive fields.
+"""
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.db import transaction
+
+from articles.models import Geography, Topic
+from taxonomy import TaxonomyError, load_taxonomy_file
+
+
+class Command(BaseCommand):
+    help = 'Create or update topics and geographies from taxonomy.yaml'
+
+    def handle(self, *args, **options):
+        config_path = settings.TAXONOMY_PATH
+
+        if not config_path.exists():
+            self.stdout.write(self.style.ERROR(f'taxonomy.yaml not found at {config_path}'))
+            return
+
+        self.stdout.write(f'Loading taxonomy from {config_path}...')
+
+        try:
+            taxonomy, content_hash = load_taxonomy_file(config_path)
+        except TaxonomyError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+
+        with transaction.atomic():
+            topics = {}
+            topic_count = 0
+            for name, entry in taxonomy['topics'].items():
+                topics[name], created = Topic.objects.update_or_create(
+                    name=name,
+                    defaults={'description': entry.get('description', '')}
+                )
+                topic_count += created
+
+            # Parents are resolved once every topic exists
+            for name, entry in taxonomy['topics'].items():
+                parent = topics.get(entry.get('parent'))
+                if topics[name].parent_id != (parent.pk if parent else None):
+                    topics[name].parent = parent
+                    topics[name].save(update_fields=['parent'])
+
+            geography_count = 0
+            for name, entry in taxonomy['geographies'].items():
+                _, created = Geography.objects.update_or_create(
+                    name=name,
+                    defaults={
+                        'country_code': entry.get('country_code') or '',
+                        'region': entry.get('region', ''),
+                        'continent': entry.get('continent', ''),
+                    }
+                )
+                geography_count += created
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Taxonomy {content_hash[:12]}: {len(taxonomy["topics"])} topics ({topic_count} new), '
+            f'{len(taxonomy["geographies"])} geographies ({geography_count} new)'
+        ))
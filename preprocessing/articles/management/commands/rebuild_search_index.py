@@ -0,0 +1,16 @@
+"""
+Management command to re-index every article for full-text search.
+The triggers keep the index current; this is for repairs and bulk imports
+that bypassed them (e.g. raw SQL with triggers disabled).
+"""
+from django.core.management.base import BaseCommand
+
+from articles.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index used by the article list and admin'
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f'✓ Search index rebuilt for {count} articles'))
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-19 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_delete_newsarticle'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='classification',
+            field=models.JSONField(blank=True, default=dict, help_text='Topics and sentiment from the article classifier'),
+        ),
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='classification_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('classified', 'Classified'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='classified_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='preprocessingarticle',
+            index=models.Index(fields=['classification_status', 'id'], name='articles_pr_classif_5f38d3_idx'),
+        ),
+    ]
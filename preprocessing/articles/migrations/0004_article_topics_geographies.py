@@ -0,0 +1,142 @@
+# Generated by Django 6.0 on 2026-10-19 02:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+DEFAULT_TOPICS = [
+    ('Economics', None, 'Economic news and analysis'),
+    ('Politics', None, 'Political news and developments'),
+    ('Business', None, 'Corporate and business news'),
+    ('Finance', None, 'Financial markets and banking'),
+    ('Technology', None, 'Technology and innovation'),
+    ('Energy', None, 'Energy sector and resources'),
+    ('Climate', None, 'Climate and environmental issues'),
+    ('Trade', None, 'International trade and commerce'),
+    ('Central Banking', 'Economics', 'Monetary policy and central banks'),
+    ('Inflation', 'Economics', 'Inflation and price movements'),
+    ('GDP', 'Economics', 'Economic growth and GDP'),
+    ('Elections', 'Politics', 'Elections and voting'),
+    ('Policy', 'Politics', 'Government policy and regulation'),
+    ('Geopolitics', 'Politics', 'International relations and conflicts'),
+    ('Stock Markets', 'Finance', 'Equity markets and trading'),
+    ('Bonds', 'Finance', 'Bond markets and fixed income'),
+    ('Currencies', 'Finance', 'Foreign exchange and currencies'),
+    ('Mergers & Acquisitions', 'Business', 'M&A activity'),
+    ('Earnings', 'Business', 'Corporate earnings and results'),
+]
+
+DEFAULT_GEOGRAPHIES = [
+    ('United States', 'US', 'North America', 'North America'),
+    ('United Kingdom', 'GB', 'Europe', 'Europe'),
+    ('European Union', 'EU', 'Europe', 'Europe'),
+    ('China', 'CN', 'East Asia', 'Asia'),
+    ('Japan', 'JP', 'East Asia', 'Asia'),
+    ('Australia', 'AU', 'Oceania', 'Oceania'),
+    ('Canada', 'CA', 'North America', 'North America'),
+    ('Germany', 'DE', 'Europe', 'Europe'),
+    ('France', 'FR', 'Europe', 'Europe'),
+    ('India', 'IN', 'South Asia', 'Asia'),
+    ('Brazil', 'BR', 'South America', 'South America'),
+    ('Russia', 'RU', 'Eastern Europe', 'Europe'),
+    ('Global', '', 'Global', 'Global'),
+]
+
+
+def seed_taxonomy(apps, schema_editor):
+    """Create the default topics/geographies and link already classified articles."""
+    Topic = apps.get_model('articles', 'Topic')
+    Geography = apps.get_model('articles', 'Geography')
+    ArticleTopic = apps.get_model('articles', 'ArticleTopic')
+    PreprocessingArticle = apps.get_model('articles', 'PreprocessingArticle')
+
+    topics = {}
+    for name, parent, description in DEFAULT_TOPICS:
+        topics[name] = Topic.objects.create(name=name, parent=topics.get(parent), description=description)
+
+    Geography.objects.bulk_create([
+        Geography(name=name, country_code=code, region=region, continent=continent)
+        for name, code, region, continent in DEFAULT_GEOGRAPHIES
+    ])
+
+    # Classifications stored before this migration only hold topic names
+    links = []
+    classified = PreprocessingArticle.objects.filter(classification_status='classified')
+    for article_id, classification in classified.values_list('id', 'classification').iterator():
+        for topic in (classification or {}).get('topics', []):
+            name = topic[0] if isinstance(topic, list) else topic
+            if name not in topics:
+                topics[name] = Topic.objects.create(name=name)
+            links.append(ArticleTopic(article_id=article_id, topic=topics[name]))
+    ArticleTopic.objects.bulk_create(links, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_classification_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Geography',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('country_code', models.CharField(blank=True, max_length=10)),
+                ('region', models.CharField(blank=True, max_length=100)),
+                ('continent', models.CharField(blank=True, max_length=100)),
+            ],
+            options={
+                'verbose_name_plural': 'geographies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArticleGeography',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('confidence', models.FloatField(default=1.0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_geographies', to='articles.preprocessingarticle')),
+                ('geography', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_geographies', to='articles.geography')),
+            ],
+            options={
+                'verbose_name_plural': 'article geographies',
+                'unique_together': {('article', 'geography')},
+            },
+        ),
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='geographies',
+            field=models.ManyToManyField(blank=True, related_name='articles', through='articles.ArticleGeography', to='articles.geography'),
+        ),
+        migrations.CreateModel(
+            name='Topic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='children', to='articles.topic')),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArticleTopic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('confidence', models.FloatField(default=1.0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_topics', to='articles.preprocessingarticle')),
+                ('topic', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_topics', to='articles.topic')),
+            ],
+            options={
+                'unique_together': {('article', 'topic')},
+            },
+        ),
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='topics',
+            field=models.ManyToManyField(blank=True, related_name='articles', through='articles.ArticleTopic', to='articles.topic'),
+        ),
+        migrations.RunPython(seed_taxonomy, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-19 03:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_article_topics_geographies'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlegeography',
+            index=models.Index(fields=['geography', 'confidence', 'article'], name='articles_ar_geograp_72b9c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='articletopic',
+            index=models.Index(fields=['topic', 'confidence', 'article'], name='articles_ar_topic_i_7cb9cb_idx'),
+        ),
+    ]
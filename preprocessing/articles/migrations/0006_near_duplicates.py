@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-19 03:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_junction_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='near_duplicates', to='articles.preprocessingarticle'),
+        ),
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='minhash',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ArticleSignatureBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.BigIntegerField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signature_bands', to='articles.preprocessingarticle')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['key', 'article'], name='articles_ar_key_fcad3b_idx')],
+            },
+        ),
+    ]
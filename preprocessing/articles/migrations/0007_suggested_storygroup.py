@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_near_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='preprocessingarticle',
+            name='suggested_storygroup',
+            field=models.CharField(blank=True, help_text='Story group proposed by online clustering at fetch time', max_length=200),
+        ),
+    ]
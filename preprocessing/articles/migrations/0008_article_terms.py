@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_suggested_storygroup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='articles.preprocessingarticle')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'article', 'weight'], name='articles_ar_term_bfd27b_idx')],
+            },
+        ),
+    ]
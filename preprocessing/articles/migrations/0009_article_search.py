@@ -0,0 +1,70 @@
+# Generated by Django 6.0 on 2026-10-19 12:40
+
+import articles.models
+import django.db.models.deletion
+from django.db import migrations, models
+
+# External-content FTS5 index over the searchable article columns, kept in sync
+# by triggers; rank is BM25 weighted towards title matches
+CREATE_SEARCH_INDEX = [
+    """
+    CREATE VIRTUAL TABLE articles_search USING fts5(
+        title, description, summary, source, storygroup,
+        content='articles_preprocessingarticle', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER articles_search_insert AFTER INSERT ON articles_preprocessingarticle BEGIN
+        INSERT INTO articles_search(rowid, title, description, summary, source, storygroup)
+        VALUES (new.id, new.title, new.description, new.summary, new.source, new.storygroup);
+    END
+    """,
+    """
+    CREATE TRIGGER articles_search_delete AFTER DELETE ON articles_preprocessingarticle BEGIN
+        INSERT INTO articles_search(articles_search, rowid, title, description, summary, source, storygroup)
+        VALUES ('delete', old.id, old.title, old.description, old.summary, old.source, old.storygroup);
+    END
+    """,
+    """
+    CREATE TRIGGER articles_search_update
+    AFTER UPDATE OF title, description, summary, source, storygroup ON articles_preprocessingarticle BEGIN
+        INSERT INTO articles_search(articles_search, rowid, title, description, summary, source, storygroup)
+        VALUES ('delete', old.id, old.title, old.description, old.summary, old.source, old.storygroup);
+        INSERT INTO articles_search(rowid, title, description, summary, source, storygroup)
+        VALUES (new.id, new.title, new.description, new.summary, new.source, new.storygroup);
+    END
+    """,
+    "INSERT INTO articles_search(articles_search) VALUES ('rebuild')",
+    "INSERT INTO articles_search(articles_search, rank) VALUES ('rank', 'bm25(10.0, 3.0, 1.0, 1.0, 2.0)')",
+]
+
+DROP_SEARCH_INDEX = [
+    "DROP TRIGGER IF EXISTS articles_search_insert",
+    "DROP TRIGGER IF EXISTS articles_search_delete",
+    "DROP TRIGGER IF EXISTS articles_search_update",
+    "DROP TABLE IF EXISTS articles_search",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_article_terms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleSearchEntry',
+            fields=[
+                ('article', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_entry', serialize=False, to='articles.preprocessingarticle')),
+                ('document', articles.models.SearchDocumentField(db_column='articles_search')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'articles_search',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_SEARCH_INDEX, reverse_sql=DROP_SEARCH_INDEX),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0 on 2026-10-19 13:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_article_search'),
+    ]
+
+    operations = [
+        # The full duplicate_of index is dropped in place: Django's SQLite
+        # AlterField rebuilds the table, which would drop the search triggers
+        # defined on it. The partial index below replaces it.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "DROP INDEX IF EXISTS articles_preprocessingarticle_duplicate_of_id_900ea3fd",
+                    reverse_sql='CREATE INDEX "articles_preprocessingarticle_duplicate_of_id_900ea3fd" '
+                                'ON "articles_preprocessingarticle" ("duplicate_of_id")',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='preprocessingarticle',
+                    name='duplicate_of',
+                    field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='near_duplicates', to='articles.preprocessingarticle'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='preprocessingarticle',
+            index=models.Index(fields=['published'], name='articles_pr_publish_9f8d00_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='preprocessingarticle',
+            index=models.Index(fields=['title'], name='articles_pr_title_432c0a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='preprocessingarticle',
+            index=models.Index(condition=models.Q(('duplicate_of__isnull', False)), fields=['duplicate_of'], name='articles_duplicate_of_idx'),
+        ),
+    ]
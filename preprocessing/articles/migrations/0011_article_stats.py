@@ -0,0 +1,74 @@
+# Generated by Django 6.0 on 2026-10-19 13:45
+
+from django.db import migrations, models
+
+DIMENSIONS = ['outcome', 'source', 'storygroup', 'classification_status']
+
+
+def _increment(dimension, value, condition='1'):
+    return f"""
+        INSERT INTO articles_articlestat(dimension, value, "count") SELECT '{dimension}', {value}, 1 WHERE {condition}
+        ON CONFLICT(dimension, value) DO UPDATE SET "count" = "count" + 1;"""
+
+
+def _decrement(dimension, value, condition='1'):
+    return f"""
+        UPDATE articles_articlestat SET "count" = "count" - 1
+        WHERE {condition} AND dimension = '{dimension}' AND value = {value};"""
+
+
+# Counters follow every insert, delete and change of a counted column, whichever
+# code path (save, bulk_create, QuerySet.update, admin) made it
+CREATE_STAT_TRIGGERS = [
+    "CREATE TRIGGER articles_stats_insert AFTER INSERT ON articles_preprocessingarticle BEGIN"
+    + _increment('total', "''")
+    + ''.join(_increment(dimension, f'new.{dimension}') for dimension in DIMENSIONS)
+    + "\n    END",
+    "CREATE TRIGGER articles_stats_delete AFTER DELETE ON articles_preprocessingarticle BEGIN"
+    + _decrement('total', "''")
+    + ''.join(_decrement(dimension, f'old.{dimension}') for dimension in DIMENSIONS)
+    + "\n    END",
+    f"CREATE TRIGGER articles_stats_update AFTER UPDATE OF {', '.join(DIMENSIONS)} "
+    "ON articles_preprocessingarticle BEGIN"
+    + ''.join(
+        _decrement(dimension, f'old.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+        + _increment(dimension, f'new.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+        for dimension in DIMENSIONS
+    )
+    + "\n    END",
+    """INSERT INTO articles_articlestat(dimension, value, "count")
+       SELECT 'total', '', COUNT(*) FROM articles_preprocessingarticle""",
+] + [
+    f"""INSERT INTO articles_articlestat(dimension, value, "count")
+        SELECT '{dimension}', {dimension}, COUNT(*) FROM articles_preprocessingarticle GROUP BY {dimension}"""
+    for dimension in DIMENSIONS
+]
+
+DROP_STAT_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS articles_stats_insert",
+    "DROP TRIGGER IF EXISTS articles_stats_delete",
+    "DROP TRIGGER IF EXISTS articles_stats_update",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0010_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('total', 'Total'), ('outcome', 'Outcome'), ('source', 'Source'), ('storygroup', 'Story group'), ('classification_status', 'Classification status')], max_length=30)),
+                ('value', models.CharField(blank=True, max_length=200)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'value'), name='articles_stat_dimension_value')],
+            },
+        ),
+        migrations.RunSQL(CREATE_STAT_TRIGGERS, reverse_sql=DROP_STAT_TRIGGERS),
+    ]
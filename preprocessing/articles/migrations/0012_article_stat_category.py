@@ -0,0 +1,72 @@
+# Generated by Django 6.0 on 2026-10-19 14:20
+
+from django.db import migrations, models
+
+DIMENSIONS = ['outcome', 'source', 'category', 'storygroup', 'classification_status']
+PREVIOUS_DIMENSIONS = ['outcome', 'source', 'storygroup', 'classification_status']
+
+
+def _increment(dimension, value, condition='1'):
+    return f"""
+        INSERT INTO articles_articlestat(dimension, value, "count") SELECT '{dimension}', {value}, 1 WHERE {condition}
+        ON CONFLICT(dimension, value) DO UPDATE SET "count" = "count" + 1;"""
+
+
+def _decrement(dimension, value, condition='1'):
+    return f"""
+        UPDATE articles_articlestat SET "count" = "count" - 1
+        WHERE {condition} AND dimension = '{dimension}' AND value = {value};"""
+
+
+def _triggers(dimensions):
+    return [
+        "CREATE TRIGGER articles_stats_insert AFTER INSERT ON articles_preprocessingarticle BEGIN"
+        + _increment('total', "''")
+        + ''.join(_increment(dimension, f'new.{dimension}') for dimension in dimensions)
+        + "\n    END",
+        "CREATE TRIGGER articles_stats_delete AFTER DELETE ON articles_preprocessingarticle BEGIN"
+        + _decrement('total', "''")
+        + ''.join(_decrement(dimension, f'old.{dimension}') for dimension in dimensions)
+        + "\n    END",
+        f"CREATE TRIGGER articles_stats_update AFTER UPDATE OF {', '.join(dimensions)} "
+        "ON articles_preprocessingarticle BEGIN"
+        + ''.join(
+            _decrement(dimension, f'old.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+            + _increment(dimension, f'new.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+            for dimension in dimensions
+        )
+        + "\n    END",
+    ]
+
+
+DROP_STAT_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS articles_stats_insert",
+    "DROP TRIGGER IF EXISTS articles_stats_delete",
+    "DROP TRIGGER IF EXISTS articles_stats_update",
+]
+
+# Category counters for the filter panel's facet counts
+ADD_CATEGORY = DROP_STAT_TRIGGERS + _triggers(DIMENSIONS) + [
+    """INSERT INTO articles_articlestat(dimension, value, "count")
+       SELECT 'category', category, COUNT(*) FROM articles_preprocessingarticle GROUP BY category""",
+]
+
+REMOVE_CATEGORY = DROP_STAT_TRIGGERS + _triggers(PREVIOUS_DIMENSIONS) + [
+    "DELETE FROM articles_articlestat WHERE dimension = 'category'",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0011_article_stats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='articlestat',
+            name='dimension',
+            field=models.CharField(choices=[('total', 'Total'), ('outcome', 'Outcome'), ('source', 'Source'), ('category', 'Category'), ('storygroup', 'Story group'), ('classification_status', 'Classification status')], max_length=30),
+        ),
+        migrations.RunSQL(ADD_CATEGORY, reverse_sql=REMOVE_CATEGORY),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-19 14:55
+
+import articles.models
+from django.db import migrations, models
+
+
+def fill_snippets(apps, schema_editor):
+    PreprocessingArticle = apps.get_model('articles', 'PreprocessingArticle')
+    rows = PreprocessingArticle.objects.only('id', 'description', 'summary').order_by('id')
+
+    batch = []
+    for row in rows.iterator(chunk_size=2000):
+        row.snippet = articles.models.make_snippet(row.description, row.summary)
+        batch.append(row)
+        if len(batch) >= 2000:
+            PreprocessingArticle.objects.bulk_update(batch, ['snippet'])
+            batch = []
+    PreprocessingArticle.objects.bulk_update(batch, ['snippet'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0012_article_stat_category'),
+    ]
+
+    operations = [
+        # Added in place: Django's SQLite AddField rebuilds the table, which would
+        # drop the search and stats triggers defined on it
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "ALTER TABLE articles_preprocessingarticle ADD COLUMN snippet varchar(200) NOT NULL DEFAULT ''",
+                    reverse_sql="ALTER TABLE articles_preprocessingarticle DROP COLUMN snippet",
+                ),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='preprocessingarticle',
+                    name='snippet',
+                    field=models.CharField(blank=True, editable=False, help_text='Short plain-text lead shown in article lists, derived from the description', max_length=200),
+                ),
+            ],
+        ),
+        migrations.RunPython(fill_snippets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 6.0 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+DIMENSIONS = ['outcome', 'source', 'category', 'storygroup', 'classification_status']
+LISTED_DIMENSIONS = ['outcome', 'source', 'category', 'storygroup']
+
+
+def _increment(dimension, value, condition='1'):
+    return f"""
+        INSERT INTO articles_articlestat(dimension, value, "count") SELECT '{dimension}', {value}, 1 WHERE {condition}
+        ON CONFLICT(dimension, value) DO UPDATE SET "count" = "count" + 1;"""
+
+
+def _decrement(dimension, value, condition='1'):
+    return f"""
+        UPDATE articles_articlestat SET "count" = "count" - 1
+        WHERE {condition} AND dimension = '{dimension}' AND value = {value};"""
+
+
+def _listed_update(dimension):
+    listed = f'listed_{dimension}'
+    return (
+        _decrement(listed, f'old.{dimension}', f'old.duplicate_of_id IS NULL AND '
+                   f'(old.{dimension} IS NOT new.{dimension} OR new.duplicate_of_id IS NOT NULL)')
+        + _increment(listed, f'new.{dimension}', f'new.duplicate_of_id IS NULL AND '
+                     f'(old.{dimension} IS NOT new.{dimension} OR old.duplicate_of_id IS NOT NULL)')
+    )
+
+
+def _triggers(listed_dimensions):
+    update_columns = ', '.join(DIMENSIONS + (['duplicate_of_id'] if listed_dimensions else []))
+    return [
+        "CREATE TRIGGER articles_stats_insert AFTER INSERT ON articles_preprocessingarticle BEGIN"
+        + _increment('total', "''")
+        + ''.join(_increment(dimension, f'new.{dimension}') for dimension in DIMENSIONS)
+        + ''.join(
+            _increment(f'listed_{dimension}', f'new.{dimension}', 'new.duplicate_of_id IS NULL')
+            for dimension in listed_dimensions
+        )
+        + "\n    END",
+        "CREATE TRIGGER articles_stats_delete AFTER DELETE ON articles_preprocessingarticle BEGIN"
+        + _decrement('total', "''")
+        + ''.join(_decrement(dimension, f'old.{dimension}') for dimension in DIMENSIONS)
+        + ''.join(
+            _decrement(f'listed_{dimension}', f'old.{dimension}', 'old.duplicate_of_id IS NULL')
+            for dimension in listed_dimensions
+        )
+        + "\n    END",
+        f"CREATE TRIGGER articles_stats_update AFTER UPDATE OF {update_columns} "
+        "ON articles_preprocessingarticle BEGIN"
+        + ''.join(
+            _decrement(dimension, f'old.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+            + _increment(dimension, f'new.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+            for dimension in DIMENSIONS
+        )
+        + ''.join(_listed_update(dimension) for dimension in listed_dimensions)
+        + "\n    END",
+    ]
+
+
+DROP_STAT_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS articles_stats_insert",
+    "DROP TRIGGER IF EXISTS articles_stats_delete",
+    "DROP TRIGGER IF EXISTS articles_stats_update",
+]
+
+# Counters over the articles the list shows (not collapsed near-duplicates),
+# for the unfiltered facet counts
+ADD_LISTED = DROP_STAT_TRIGGERS + _triggers(LISTED_DIMENSIONS) + [
+    f"""INSERT INTO articles_articlestat(dimension, value, "count")
+        SELECT 'listed_{dimension}', {dimension}, COUNT(*) FROM articles_preprocessingarticle
+        WHERE duplicate_of_id IS NULL GROUP BY {dimension}"""
+    for dimension in LISTED_DIMENSIONS
+]
+
+REMOVE_LISTED = DROP_STAT_TRIGGERS + _triggers([]) + [
+    "DELETE FROM articles_articlestat WHERE dimension LIKE 'listed\\_%' ESCAPE '\\'",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0013_article_snippet'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='articlestat',
+            name='dimension',
+            field=models.CharField(choices=[('total', 'Total'), ('outcome', 'Outcome'), ('source', 'Source'), ('category', 'Category'), ('storygroup', 'Story group'), ('classification_status', 'Classification status'), ('listed_outcome', 'Outcome (listed)'), ('listed_source', 'Source (listed)'), ('listed_category', 'Category (listed)'), ('listed_storygroup', 'Story group (listed)')], max_length=30),
+        ),
+        migrations.RunSQL(ADD_LISTED, reverse_sql=REMOVE_LISTED),
+    ]
@@ -1,5 +1,33 @@
+import html
+
 from django.db import models
 from django.utils import timezone
+from django.utils.html import strip_tags
+
+SNIPPET_LENGTH = 160
+
+# Columns rendered by list pages (web list, admin changelist, JSON lists), plus the
+# keyset sort columns; the long text fields are left to the detail view
+LIST_FIELDS = [
+    'id', 'title', 'snippet', 'source', 'category', 'published', 'time_added', 'added_by',
+    'outcome', 'storygroup', 'suggested_storygroup', 'classification_status', 'classification',
+    'duplicate_of',
+]
+
+
+def make_snippet(description: str, summary: str = '') -> str:
+    """Plain-text lead of the description (or summary), cut at a word near SNIPPET_LENGTH."""
+    text = ' '.join(html.unescape(strip_tags(description or summary or '')).split())
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(' ', 1)[0].rstrip(',;:.-') + '…'
+
+
+class PreprocessingArticleQuerySet(models.QuerySet):
+
+    def for_list(self):
+        """Only the LIST_FIELDS columns, for pages that show many articles."""
+        return self.only(*LIST_FIELDS)
 
 
 class PreprocessingArticle(models.Model):
@@ -12,12 +40,24 @@ class PreprocessingArticle(models.Model):
         ('rejected', 'Rejected'),
     ]
 
+    CLASSIFICATION_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('classified', 'Classified'),
+        ('failed', 'Failed'),
+    ]
+
     # Original article fields
     title = models.TextField()
     link = models.TextField()
     description = models.TextField(blank=True)
     summary = models.TextField(blank=True)
     content = models.TextField(blank=True)
+    snippet = models.CharField(
+        max_length=200,
+        blank=True,
+        editable=False,
+        help_text='Short plain-text lead shown in article lists, derived from the description'
+    )
     source = models.CharField(max_length=200)
     category = models.CharField(max_length=100, blank=True)
     feed_url = models.TextField(blank=True)
@@ -36,9 +76,44 @@ class PreprocessingArticle(models.Model):
         default='NEW'
     )
     storygroup = models.CharField(max_length=200, blank=True)
+    suggested_storygroup = models.CharField(
+        max_length=200,
+        blank=True,
+        help_text='Story group proposed by online clustering at fetch time'
+    )
     source_article_id = models.IntegerField(null=True, blank=True, help_text='ID from news.db')
     last_synced = models.DateTimeField(auto_now=True)
 
+    # Classification (filled in at fetch time or later by classify_pending)
+    classification_status = models.CharField(
+        max_length=20,
+        choices=CLASSIFICATION_STATUS_CHOICES,
+        default='pending'
+    )
+    classification = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Topics and sentiment from the article classifier'
+    )
+    classified_at = models.DateTimeField(null=True, blank=True)
+    topics = models.ManyToManyField('Topic', through='ArticleTopic', related_name='articles', blank=True)
+    geographies = models.ManyToManyField(
+        'Geography', through='ArticleGeography', related_name='articles', blank=True
+    )
+
+    # Near-duplicate detection (src/near_duplicates.py); duplicates point at the earliest copy
+    minhash = models.BinaryField(null=True, blank=True, editable=False)
+    duplicate_of = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name='near_duplicates'
+    )
+
+    objects = PreprocessingArticleQuerySet.as_manager()
+
     class Meta:
         ordering = ['-time_added']
         unique_together = [['title', 'source', 'published']]
@@ -47,11 +122,30 @@ class PreprocessingArticle(models.Model):
             models.Index(fields=['source']),
             models.Index(fields=['storygroup']),
             models.Index(fields=['time_added']),
+            models.Index(fields=['published']),
+            models.Index(fields=['title']),
+            models.Index(fields=['classification_status', 'id']),
+            # Partial, so the list's "duplicate_of IS NULL" filter walks the sort index
+            # instead of this one (almost every article matches it)
+            models.Index(
+                fields=['duplicate_of'],
+                condition=models.Q(duplicate_of__isnull=False),
+                name='articles_duplicate_of_idx'
+            ),
         ]
 
     def __str__(self):
         return f"{self.source}: {self.title[:50]}"
 
+    def save(self, *args, **kwargs):
+        # Keep the snippet in step with the description, unless the text was never loaded
+        if not {'description', 'summary'} & self.get_deferred_fields():
+            self.snippet = make_snippet(self.description, self.summary)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and {'description', 'summary'} & set(update_fields):
+                kwargs['update_fields'] = set(update_fields) | {'snippet'}
+        super().save(*args, **kwargs)
+
     @property
     def outcome_badge_class(self):
         """Return CSS class for outcome badge."""
@@ -61,3 +155,206 @@ class PreprocessingArticle(models.Model):
             'rejected': 'badge-danger',
         }
         return badges.get(self.outcome, 'badge-secondary')
+
+    @property
+    def sentiment_label(self):
+        """Sentiment label from the stored classification, if any."""
+        return (self.classification or {}).get('sentiment', {}).get('label', '')
+
+    @property
+    def sentiment_badge_class(self):
+        """Return CSS class for sentiment badge."""
+        badges = {
+            'positive': 'bg-success',
+            'negative': 'bg-danger',
+            'neutral': 'bg-secondary',
+        }
+        return badges.get(self.sentiment_label, 'bg-light text-dark')
+
+    @property
+    def topic_names(self):
+        """Classified topic names."""
+        # Topics are stored as [name, confidence] pairs; older classifications hold bare names
+        return [
+            topic[0] if isinstance(topic, (list, tuple)) else topic
+            for topic in (self.classification or {}).get('topics', [])
+        ]
+
+
+class Topic(models.Model):
+    """Topic assigned to articles by the classifier."""
+
+    name = models.CharField(max_length=100, unique=True)
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='children'
+    )
+    description = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class Geography(models.Model):
+    """Geographic region assigned to articles by the classifier."""
+
+    name = models.CharField(max_length=100, unique=True)
+    country_code = models.CharField(max_length=10, blank=True)
+    region = models.CharField(max_length=100, blank=True)
+    continent = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        ordering = ['name']
+        verbose_name_plural = 'geographies'
+
+    def __str__(self):
+        return self.name
+
+
+class ArticleTopic(models.Model):
+    """Classifier topic for an article, with its confidence."""
+
+    article = models.ForeignKey(PreprocessingArticle, on_delete=models.CASCADE, related_name='article_topics')
+    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='article_topics')
+    confidence = models.FloatField(default=1.0)
+
+    class Meta:
+        unique_together = [['article', 'topic']]
+        indexes = [
+            # Covering index for "articles in topic above a confidence" lookups
+            models.Index(fields=['topic', 'confidence', 'article']),
+        ]
+
+    def __str__(self):
+        return f"{self.topic} ({self.confidence:.2f})"
+
+
+class ArticleGeography(models.Model):
+    """Classifier geography for an article, with its confidence."""
+
+    article = models.ForeignKey(PreprocessingArticle, on_delete=models.CASCADE, related_name='article_geographies')
+    geography = models.ForeignKey(Geography, on_delete=models.CASCADE, related_name='article_geographies')
+    confidence = models.FloatField(default=1.0)
+
+    class Meta:
+        unique_together = [['article', 'geography']]
+        indexes = [
+            models.Index(fields=['geography', 'confidence', 'article']),
+        ]
+        verbose_name_plural = 'article geographies'
+
+    def __str__(self):
+        return f"{self.geography} ({self.confidence:.2f})"
+
+
+class ArticleSignatureBand(models.Model):
+    """LSH band key of an article's MinHash signature, used to find near-duplicate candidates."""
+
+    article = models.ForeignKey(PreprocessingArticle, on_delete=models.CASCADE, related_name='signature_bands')
+    key = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['key', 'article']),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id}: {self.key}"
+
+
+class ArticleTerm(models.Model):
+    """One of an article's top TF-IDF terms; the inverted index behind related articles."""
+
+    article = models.ForeignKey(PreprocessingArticle, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=100)
+    weight = models.FloatField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['term', 'article', 'weight']),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id}: {self.term} ({self.weight:.3f})"
+
+
+class SearchDocumentField(models.TextField):
+    """The FTS5 table's hidden column of the same name; supports the ``match`` lookup."""
+
+
+@SearchDocumentField.register_lookup
+class Match(models.Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+class ArticleSearchEntry(models.Model):
+    """
+    Row of the articles_search FTS5 index (see articles/search.py).
+
+    The table is created by migration and kept in sync with PreprocessingArticle
+    by SQLite triggers, so bulk_create and QuerySet.update are indexed too.
+    ``rank`` is BM25 with title matches weighted highest.
+    """
+
+    article = models.OneToOneField(
+        PreprocessingArticle,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        related_name='search_entry'
+    )
+    document = SearchDocumentField(db_column='articles_search')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'articles_search'
+
+
+class ArticleStat(models.Model):
+    """
+    Number of articles per outcome, source, category, storygroup and classification
+    status, plus the overall total (dimension 'total', empty value). The 'listed_'
+    dimensions count only articles shown in the list, not collapsed near-duplicates.
+
+    Maintained by SQLite triggers on PreprocessingArticle (migrations 0011, 0012,
+    0014), so every write path updates it; reconcile_article_stats recounts from
+    scratch.
+    """
+
+    DIMENSION_CHOICES = [
+        ('total', 'Total'),
+        ('outcome', 'Outcome'),
+        ('source', 'Source'),
+        ('category', 'Category'),
+        ('storygroup', 'Story group'),
+        ('classification_status', 'Classification status'),
+        ('listed_outcome', 'Outcome (listed)'),
+        ('listed_source', 'Source (listed)'),
+        ('listed_category', 'Category (listed)'),
+        ('listed_storygroup', 'Story group (listed)'),
+    ]
+
+    dimension = models.CharField(max_length=30, choices=DIMENSION_CHOICES)
+    value = models.CharField(max_length=200, blank=True)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'value'], name='articles_stat_dimension_value'),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}={self.value}: {self.count}"
@@ -0,0 +1,186 @@
+"""
+Keyset (cursor) pagination for the article list.
+
+Pages are fetched with ``WHERE (sort column, id) < (last row)`` on an index of
+the sort column instead of OFFSET, so every page costs the same however deep
+it is. Cursors are opaque URL-safe tokens holding the boundary row's sort
+value and id. The total is counted once, on the first page, and carried
+along in the links; it is shown as approximate since articles keep arriving.
+
+Sorts without a usable index (relevance) fall back to OFFSET cursors.
+"""
+import base64
+import json
+import math
+from typing import List, Optional
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+# Sort options backed by an index on (column, id)
+KEYSET_SORTS = {'time_added', 'published', 'title', 'source', 'outcome'}
+
+
+def encode_cursor(data) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data, default=str).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """The cursor's payload, or None if it is malformed."""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+
+
+class KeysetPage:
+    """One page of results plus what the template needs to link to its neighbours."""
+
+    def __init__(self, object_list: List, number: int, has_previous: bool, has_next: bool,
+                 previous_cursor: Optional[str], next_cursor: Optional[str], total: Optional[int],
+                 per_page: int):
+        self.object_list = object_list
+        self.number = number
+        self.has_previous = has_previous
+        self.has_next = has_next
+        self.previous_cursor = previous_cursor
+        self.next_cursor = next_cursor
+        self.total = total
+        self.num_pages = max(1, math.ceil(total / per_page)) if total is not None else None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """Paginates a queryset ordered by ``sort`` ('field' or '-field') and id."""
+
+    def __init__(self, queryset, sort: str, per_page: int):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.descending = sort.startswith('-')
+        self.field = sort.lstrip('-')
+        self.keyset = self.field in KEYSET_SORTS
+        if self.keyset:
+            model_field = queryset.model._meta.get_field(self.field)
+            self.nullable = model_field.null
+            self.is_datetime = model_field.get_internal_type() == 'DateTimeField'
+
+    def _ordering(self, reverse: bool = False):
+        descending = self.descending != reverse
+        prefix = '-' if descending else ''
+        return [f'{prefix}{self.field}', f'{prefix}id']
+
+    def _after(self, value, pk, reverse: bool = False) -> List[Q]:
+        """
+        Conditions selecting the rows after (value, pk) in the (optionally reversed)
+        sort order, as consecutive segments of that order. Each segment is a
+        simple index range; OR-ing them would defeat the index.
+        """
+        descending = self.descending != reverse
+        field = self.field
+        before = 'lt' if descending else 'gt'
+        tail = Q(**{f'{field}__isnull': True, f'pk__{before}': pk})
+
+        # SQLite sorts NULL lowest: last when descending, first when ascending
+        if value is None:
+            return [tail] if descending else [tail, Q(**{f'{field}__isnull': False})]
+
+        segments = [Q(**{f'{field}__{before}e': value}) & (
+            Q(**{f'{field}__{before}': value}) | Q(**{f'pk__{before}': pk})
+        )]
+        if self.nullable and descending:
+            segments.append(Q(**{f'{field}__isnull': True}))
+        return segments
+
+    def _fetch(self, key, reverse: bool = False) -> List:
+        """Up to per_page + 1 rows after cursor ``key`` (from the start if None)."""
+        queryset = self.queryset.order_by(*self._ordering(reverse))
+        if key is None:
+            return list(queryset[:self.per_page + 1])
+
+        rows = []
+        for segment in self._after(*key, reverse=reverse):
+            rows.extend(queryset.filter(segment)[:self.per_page + 1 - len(rows)])
+            if len(rows) > self.per_page:
+                break
+        return rows
+
+    def _cursor(self, article) -> str:
+        return encode_cursor([getattr(article, self.field), article.pk])
+
+    def _parse(self, cursor: Optional[str]):
+        data = decode_cursor(cursor) if cursor else None
+        if not isinstance(data, list) or len(data) != 2 or not isinstance(data[1], int):
+            return None
+        value, pk = data
+        if value is not None and self.is_datetime:
+            value = parse_datetime(value)
+            if value is None:
+                return None
+        return value, pk
+
+    def page(self, after: Optional[str] = None, before: Optional[str] = None, last: bool = False,
+             number: int = 1, total: Optional[int] = None) -> KeysetPage:
+        """
+        The page following cursor ``after``, preceding cursor ``before``, the
+        ``last`` page, or the first page. ``number`` and ``total`` are carried
+        over from the link that was followed; the total is counted on the first page.
+        """
+        if not self.keyset:
+            return self._offset_page(after, before, last, number, total)
+
+        per_page = self.per_page
+        after_key = self._parse(after)
+        before_key = self._parse(before)
+
+        if before_key or last:
+            rows = self._fetch(before_key, reverse=True)
+            has_previous = len(rows) > per_page
+            rows = rows[:per_page][::-1]
+            has_next = bool(before_key)
+        else:
+            rows = self._fetch(after_key)
+            has_next = len(rows) > per_page
+            rows = rows[:per_page]
+            has_previous = bool(after_key)
+
+        if not (after_key or before_key or last):
+            number, total = 1, self.queryset.count()
+        if last and total is not None:
+            number = max(1, math.ceil(total / per_page))
+
+        return KeysetPage(
+            rows, max(number, 1), has_previous and bool(rows), has_next and bool(rows),
+            self._cursor(rows[0]) if rows else None, self._cursor(rows[-1]) if rows else None,
+            total, per_page,
+        )
+
+    def _offset_page(self, after, before, last, number, total) -> KeysetPage:
+        """OFFSET paging behind the same cursor interface, for sorts without an index."""
+        per_page = self.per_page
+        if total is None or not (after or before or last):
+            total = self.queryset.count()
+
+        data = decode_cursor(after or before or '') or {}
+        offset = data.get('offset', 0) if isinstance(data, dict) else 0
+        if not isinstance(offset, int) or offset < 0:
+            offset = 0
+        if last:
+            offset = max(0, (math.ceil(total / per_page) - 1) * per_page)
+        elif before:
+            offset = max(0, offset - per_page)
+        elif after:
+            offset += per_page
+        else:
+            offset = 0
+
+        rows = list(self.queryset[offset:offset + per_page])
+        cursor = encode_cursor({'offset': offset})
+        return KeysetPage(
+            rows, offset // per_page + 1, offset > 0, offset + per_page < total,
+            cursor, cursor, total, per_page,
+        )
@@ -0,0 +1,85 @@
+"""
+Full-text search over PreprocessingArticle for the list view and the admin.
+
+Title, description, summary, source and storygroup are indexed in an SQLite
+FTS5 table (migration 0009) maintained by triggers, so every write path -
+save(), bulk_create(), QuerySet.update() - keeps it current. Searches join the
+index to the article table: matching is an index lookup and counting matches
+walks the index's posting lists rather than scanning every article.
+
+SQLite drops a table's triggers whenever a migration rebuilds the table, so
+``ensure_triggers`` re-creates any that are missing after every migrate.
+"""
+from typing import List
+
+from django.db import connection, connections
+
+from common.utils.db import missing_triggers
+from database import fts_query
+from .models import PreprocessingArticle
+
+SEARCH_TRIGGERS = {
+    'articles_search_insert': """
+        CREATE TRIGGER IF NOT EXISTS articles_search_insert AFTER INSERT ON articles_preprocessingarticle BEGIN
+            INSERT INTO articles_search(rowid, title, description, summary, source, storygroup)
+            VALUES (new.id, new.title, new.description, new.summary, new.source, new.storygroup);
+        END
+    """,
+    'articles_search_delete': """
+        CREATE TRIGGER IF NOT EXISTS articles_search_delete AFTER DELETE ON articles_preprocessingarticle BEGIN
+            INSERT INTO articles_search(articles_search, rowid, title, description, summary, source, storygroup)
+            VALUES ('delete', old.id, old.title, old.description, old.summary, old.source, old.storygroup);
+        END
+    """,
+    'articles_search_update': """
+        CREATE TRIGGER IF NOT EXISTS articles_search_update
+        AFTER UPDATE OF title, description, summary, source, storygroup ON articles_preprocessingarticle BEGIN
+            INSERT INTO articles_search(articles_search, rowid, title, description, summary, source, storygroup)
+            VALUES ('delete', old.id, old.title, old.description, old.summary, old.source, old.storygroup);
+            INSERT INTO articles_search(rowid, title, description, summary, source, storygroup)
+            VALUES (new.id, new.title, new.description, new.summary, new.source, new.storygroup);
+        END
+    """,
+}
+
+
+def search_articles(queryset, search: str, rank: bool = False):
+    """
+    Restrict ``queryset`` to articles matching ``search``, best matches first if ``rank``.
+
+    Accepts the same syntax as query.py --search: "quoted phrases", prefix*
+    terms and AND/OR/NOT; plain words must all match.
+    """
+    match = fts_query(search)
+    if not match:
+        return queryset.none()
+
+    queryset = queryset.filter(search_entry__document__match=match)
+    if rank:
+        queryset = queryset.order_by('search_entry__rank', '-id')
+    return queryset
+
+
+def rebuild_search_index() -> int:
+    """Re-index every article. Returns the number of articles."""
+    with connection.cursor() as cursor:
+        cursor.execute("INSERT INTO articles_search(articles_search) VALUES ('rebuild')")
+        cursor.execute("INSERT INTO articles_search(articles_search) VALUES ('optimize')")
+    return PreprocessingArticle.objects.count()
+
+
+def ensure_triggers(using: str = 'default') -> List[str]:
+    """
+    Re-create any missing search triggers and re-index, since articles written
+    while they were gone were never indexed. Returns the triggers re-created;
+    does nothing before the index exists.
+    """
+    if 'articles_search' not in connections[using].introspection.table_names():
+        return []
+    missing = missing_triggers(SEARCH_TRIGGERS, using)
+    if missing:
+        with connections[using].cursor() as cursor:
+            for name in missing:
+                cursor.execute(SEARCH_TRIGGERS[name])
+            cursor.execute("INSERT INTO articles_search(articles_search) VALUES ('rebuild')")
+    return missing
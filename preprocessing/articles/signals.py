@@ -0,0 +1,38 @@
+"""
+Cache invalidation for article saves and deletes made one object at a time,
+and repair of the database triggers after migrations.
+"""
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import facets, search, stats
+from .models import PreprocessingArticle
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=PreprocessingArticle)
+def article_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or set(update_fields) & set(facets.FACET_FIELDS):
+        facets.invalidate()
+
+
+@receiver(post_delete, sender=PreprocessingArticle)
+def article_deleted(sender, instance, **kwargs):
+    facets.invalidate()
+
+
+def restore_triggers(sender, using='default', **kwargs):
+    """
+    post_migrate handler (connected in ArticlesConfig.ready): a migration that
+    rebuilds the article table drops its triggers without any error.
+    """
+    for name in search.ensure_triggers(using):
+        logger.warning(f"Re-created missing trigger {name} and rebuilt the search index")
+    restored = stats.ensure_triggers(using)
+    for name in restored:
+        logger.warning(f"Re-created missing trigger {name} and recounted article statistics")
+    if restored:
+        facets.invalidate()
@@ -0,0 +1,146 @@
+"""
+Article counts read from the ArticleStat table instead of counting articles.
+
+The triggers behind ArticleStat keep it exact as articles are inserted,
+edited and deleted; reconcile() recounts everything and reports any drift
+(e.g. after restoring a backup or editing the database with triggers off).
+SQLite drops the triggers when a migration rebuilds the article table;
+``ensure_triggers`` re-creates them after every migrate.
+"""
+from typing import Dict, List
+
+from django.db import connections, transaction
+from django.db.models import Count
+
+from common.utils.db import missing_triggers
+from .models import ArticleStat, PreprocessingArticle
+
+DIMENSIONS = ['outcome', 'source', 'category', 'storygroup', 'classification_status']
+
+# Also counted over listed articles only, leaving out the near-duplicates the
+# article list collapses, as dimension 'listed_<dimension>'
+LISTED_DIMENSIONS = ['outcome', 'source', 'category', 'storygroup']
+LISTED_PREFIX = 'listed_'
+
+
+def _increment(dimension: str, value: str, condition: str = '1') -> str:
+    return f"""
+        INSERT INTO articles_articlestat(dimension, value, "count") SELECT '{dimension}', {value}, 1 WHERE {condition}
+        ON CONFLICT(dimension, value) DO UPDATE SET "count" = "count" + 1;"""
+
+
+def _decrement(dimension: str, value: str, condition: str = '1') -> str:
+    return f"""
+        UPDATE articles_articlestat SET "count" = "count" - 1
+        WHERE {condition} AND dimension = '{dimension}' AND value = {value};"""
+
+
+def _listed_update(dimension: str) -> str:
+    """Move a listed count when the value changes or the article joins or leaves the list."""
+    listed = LISTED_PREFIX + dimension
+    return (
+        _decrement(listed, f'old.{dimension}', f'old.duplicate_of_id IS NULL AND '
+                   f'(old.{dimension} IS NOT new.{dimension} OR new.duplicate_of_id IS NOT NULL)')
+        + _increment(listed, f'new.{dimension}', f'new.duplicate_of_id IS NULL AND '
+                     f'(old.{dimension} IS NOT new.{dimension} OR old.duplicate_of_id IS NOT NULL)')
+    )
+
+
+STAT_TRIGGERS = {
+    'articles_stats_insert':
+        "CREATE TRIGGER IF NOT EXISTS articles_stats_insert AFTER INSERT ON articles_preprocessingarticle BEGIN"
+        + _increment('total', "''")
+        + ''.join(_increment(dimension, f'new.{dimension}') for dimension in DIMENSIONS)
+        + ''.join(
+            _increment(LISTED_PREFIX + dimension, f'new.{dimension}', 'new.duplicate_of_id IS NULL')
+            for dimension in LISTED_DIMENSIONS
+        )
+        + "\n    END",
+    'articles_stats_delete':
+        "CREATE TRIGGER IF NOT EXISTS articles_stats_delete AFTER DELETE ON articles_preprocessingarticle BEGIN"
+        + _decrement('total', "''")
+        + ''.join(_decrement(dimension, f'old.{dimension}') for dimension in DIMENSIONS)
+        + ''.join(
+            _decrement(LISTED_PREFIX + dimension, f'old.{dimension}', 'old.duplicate_of_id IS NULL')
+            for dimension in LISTED_DIMENSIONS
+        )
+        + "\n    END",
+    'articles_stats_update':
+        f"CREATE TRIGGER IF NOT EXISTS articles_stats_update AFTER UPDATE OF {', '.join(DIMENSIONS)}, duplicate_of_id "
+        "ON articles_preprocessingarticle BEGIN"
+        + ''.join(
+            _decrement(dimension, f'old.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+            + _increment(dimension, f'new.{dimension}', f'old.{dimension} IS NOT new.{dimension}')
+            for dimension in DIMENSIONS
+        )
+        + ''.join(_listed_update(dimension) for dimension in LISTED_DIMENSIONS)
+        + "\n    END",
+}
+
+
+def counts(dimension: str) -> Dict[str, int]:
+    """{value: number of articles} for one dimension, e.g. counts('outcome')['NEW']."""
+    return dict(
+        ArticleStat.objects.filter(dimension=dimension, count__gt=0).values_list('value', 'count')
+    )
+
+
+def total() -> int:
+    stat = ArticleStat.objects.filter(dimension='total').first()
+    return stat.count if stat else 0
+
+
+def values(dimension: str) -> List[str]:
+    """Non-empty values with at least one article, sorted (e.g. every source)."""
+    return list(
+        ArticleStat.objects.filter(dimension=dimension, count__gt=0).exclude(value='')
+        .order_by('value').values_list('value', flat=True)
+    )
+
+
+def reconcile() -> Dict[str, int]:
+    """
+    Recount every dimension from the articles and store the result.
+    Returns {dimension: number of values whose count was wrong or missing}.
+    """
+    with transaction.atomic():
+        current = {
+            (stat.dimension, stat.value): stat.count for stat in ArticleStat.objects.filter(count__gt=0)
+        }
+        actual = {('total', ''): PreprocessingArticle.objects.count()}
+        for dimension in DIMENSIONS:
+            rows = PreprocessingArticle.objects.values_list(dimension).annotate(n=Count('id')).order_by()
+            actual.update(((dimension, value), n) for value, n in rows)
+        listed = PreprocessingArticle.objects.filter(duplicate_of__isnull=True)
+        for dimension in LISTED_DIMENSIONS:
+            rows = listed.values_list(dimension).annotate(n=Count('id')).order_by()
+            actual.update(((LISTED_PREFIX + dimension, value), n) for value, n in rows)
+
+        drift = {}
+        for key in set(current) | set(actual):
+            if current.get(key, 0) != actual.get(key, 0):
+                drift[key[0]] = drift.get(key[0], 0) + 1
+
+        ArticleStat.objects.all().delete()
+        ArticleStat.objects.bulk_create(
+            [ArticleStat(dimension=dimension, value=value, count=n) for (dimension, value), n in actual.items()],
+            batch_size=500,
+        )
+    return drift
+
+
+def ensure_triggers(using: str = 'default') -> List[str]:
+    """
+    Re-create any missing counter triggers and recount, since the counters
+    missed every write made while they were gone. Returns the triggers
+    re-created; does nothing before the ArticleStat table exists.
+    """
+    if ArticleStat._meta.db_table not in connections[using].introspection.table_names():
+        return []
+    missing = missing_triggers(STAT_TRIGGERS, using)
+    if missing:
+        with connections[using].cursor() as cursor:
+            for name in missing:
+                cursor.execute(STAT_TRIGGERS[name])
+        reconcile()
+    return missing
@@ -1,3 +1,111 @@
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
 
-# Create your tests here.
+from common.utils.db import missing_triggers
+from database import fts_query
+
+from . import search, stats
+from .models import PreprocessingArticle
+
+
+class ArticleTriggerTests(TransactionTestCase):
+    """
+    The triggers the search index and article counters depend on, which SQLite
+    drops whenever a migration rebuilds the table.
+    """
+
+    TRIGGERS = [*search.SEARCH_TRIGGERS, *stats.STAT_TRIGGERS]
+
+    def migrate(self, targets):
+        # The executor sends no post_migrate, so nothing repairs what the migrations dropped
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+
+    def test_migrations_from_zero_keep_triggers(self):
+        self.migrate([('articles', None)])
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+        self.assertEqual(missing_triggers(self.TRIGGERS), [])
+
+    def test_migrate_restores_dropped_triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER articles_search_update")
+            cursor.execute("DROP TRIGGER articles_stats_insert")
+        call_command('migrate', verbosity=0)
+        self.assertEqual(missing_triggers(self.TRIGGERS), [])
+
+
+class FtsQueryTests(SimpleTestCase):
+    """Translation of search box input into FTS5 MATCH expressions."""
+
+    def test_plain_words_phrases_and_prefixes(self):
+        self.assertEqual(fts_query('fed "rate cut" infla*'), '"fed" "rate cut" "infla"*')
+
+    def test_and_not_becomes_binary_not(self):
+        self.assertEqual(fts_query('fed AND NOT oil'), '"fed" NOT "oil"')
+        self.assertEqual(fts_query('fed NOT oil'), '"fed" NOT "oil"')
+
+    def test_leading_not_drops_its_term(self):
+        self.assertEqual(fts_query('NOT oil'), '')
+        self.assertEqual(fts_query('NOT oil fed'), '"fed"')
+
+    def test_not_without_left_operand_never_keeps_its_term(self):
+        self.assertEqual(fts_query('fed OR NOT oil'), '"fed"')
+        self.assertEqual(fts_query('fed NOT NOT oil'), '"fed"')
+
+    def test_leading_and_trailing_operators_are_dropped(self):
+        self.assertEqual(fts_query('AND fed'), '"fed"')
+        self.assertEqual(fts_query('OR fed AND'), '"fed"')
+        self.assertEqual(fts_query('fed NOT'), '"fed"')
+        self.assertEqual(fts_query('NOT'), '')
+
+    def test_doubled_operators_keep_the_first(self):
+        self.assertEqual(fts_query('fed AND OR oil'), '"fed" AND "oil"')
+        self.assertEqual(fts_query('fed OR OR oil'), '"fed" OR "oil"')
+
+
+class SearchArticlesTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for title in ('Fed rate decision', 'Fed rate decision lifts oil', 'Oil prices slide'):
+            PreprocessingArticle.objects.create(title=title, link=f'https://example.com/{title}', source='Test')
+
+    def titles(self, query):
+        return sorted(search.search_articles(PreprocessingArticle.objects.all(), query).values_list('title', flat=True))
+
+    def test_and_not_excludes_the_term(self):
+        self.assertEqual(self.titles('"rate decision" AND NOT oil'), ['Fed rate decision'])
+
+    def test_leading_not_matches_nothing_rather_than_the_term(self):
+        self.assertEqual(self.titles('NOT oil'), [])
+
+
+class ListedStatTests(TestCase):
+    """The listed_ counters follow articles in and out of the list as near-duplicates are linked."""
+
+    def assertCountersExact(self):
+        self.assertEqual(stats.reconcile(), {})
+
+    def test_counters_follow_duplicate_links(self):
+        first, copy, other = (
+            PreprocessingArticle.objects.create(title=title, link=title, source=source)
+            for title, source in (('a', 'Wire'), ('b', 'Wire'), ('c', 'Paper'))
+        )
+        self.assertEqual(stats.counts('listed_source'), {'Wire': 2, 'Paper': 1})
+
+        PreprocessingArticle.objects.filter(pk=copy.pk).update(duplicate_of=first)
+        self.assertEqual(stats.counts('listed_source'), {'Wire': 1, 'Paper': 1})
+        self.assertEqual(stats.counts('source'), {'Wire': 2, 'Paper': 1})
+
+        PreprocessingArticle.objects.filter(pk=copy.pk).update(source='Paper')
+        self.assertEqual(stats.counts('listed_source'), {'Wire': 1, 'Paper': 1})
+
+        # Deleting the original unlinks its copy (SET_NULL), which rejoins the list
+        first.delete()
+        self.assertEqual(stats.counts('listed_source'), {'Paper': 2})
+        other.delete()
+        self.assertEqual(stats.counts('listed_source'), {'Paper': 1})
+        self.assertCountersExact()
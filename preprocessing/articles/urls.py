@@ -5,5 +5,9 @@ urlpatterns = [
     path('', views.ArticleListView.as_view(), name='article_list'),
     path('article/<int:pk>/', views.ArticleDetailView.as_view(), name='article_detail'),
     path('sync/', views.SyncView.as_view(), name='sync_status'),
+    path('trending/', views.TrendingView.as_view(), name='trending'),
     path('ajax/quick-edit/<int:pk>/', views.ajax_quick_edit, name='ajax_quick_edit'),
+    path('ajax/batch-edit/', views.ajax_batch_edit, name='ajax_batch_edit'),
+    path('ajax/related/<int:pk>/', views.ajax_related_articles, name='ajax_related_articles'),
+    path('ajax/classification-status/', views.ajax_classification_status, name='ajax_classification_status'),
 ]
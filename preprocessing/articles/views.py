@@ -1,15 +1,88 @@
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import ListView, DetailView, View
 from django.contrib import messages
-from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import Q, Count, Exists, OuterRef
 from django.core.management import call_command
-from django.http import JsonResponse
+from django.http import JsonResponse, QueryDict
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlencode
 from io import StringIO
+import json
 import sys
 
-from .models import PreprocessingArticle
+from .models import ArticleGeography, ArticleTopic, PreprocessingArticle
 from .forms import ArticleFilterForm, ArticleEditForm, BulkActionForm
+from . import bulk, facets, stats as article_stats
+from .pagination import KeysetPaginator
+from .search import search_articles
+from aggregator.services import RelatedArticleIndex
+from taxonomy import get_taxonomy_loader
+from trends import TrendTracker
+
+
+BULK_ACTION_MESSAGES = {
+    'mark_processed': '{count} articles marked as processed.',
+    'mark_rejected': '{count} articles marked as rejected.',
+    'mark_new': '{count} articles marked as new.',
+    'accept_suggested': 'Suggested story group accepted for {count} articles.',
+    'storygroup': 'Story group updated for {count} articles.',
+}
+
+# Query parameters that narrow the article list (everything else sorts or pages it)
+FILTER_PARAMS = [name for name in ArticleFilterForm.base_fields if name != 'sort'] + ['duplicates_of']
+
+
+def filter_articles(queryset, params, rank=False):
+    """Narrow ``queryset`` by the article list's filter parameters (``rank`` orders searches by relevance)."""
+    outcome = params.get('outcome')
+    source = params.get('source')
+    storygroup = params.get('storygroup')
+    category = params.get('category')
+    search = params.get('search')
+    added_by = params.get('added_by')
+
+    if outcome:
+        queryset = queryset.filter(outcome=outcome)
+    if source:
+        queryset = queryset.filter(source__icontains=source)
+    if storygroup:
+        queryset = queryset.filter(storygroup__icontains=storygroup)
+    if category:
+        queryset = queryset.filter(category=category)
+    if search:
+        queryset = search_articles(queryset, search, rank=rank)
+    if added_by:
+        queryset = queryset.filter(added_by__icontains=added_by)
+
+    # Near-duplicates are collapsed under their earliest copy unless asked for
+    duplicates_of = params.get('duplicates_of')
+    if duplicates_of and duplicates_of.isdigit():
+        queryset = queryset.filter(Q(pk=duplicates_of) | Q(duplicate_of=duplicates_of))
+    elif not params.get('show_duplicates'):
+        queryset = queryset.filter(duplicate_of__isnull=True)
+
+    # Classification filters - correlated EXISTS probes on the junction tables,
+    # so the list keeps walking its sort index instead of joining every match
+    topic = params.get('topic')
+    geography = params.get('geography')
+    try:
+        min_confidence = float(params.get('min_confidence') or 0)
+    except ValueError:
+        min_confidence = 0
+
+    if topic:
+        queryset = queryset.filter(Exists(ArticleTopic.objects.filter(
+            article=OuterRef('pk'), topic__name=topic, confidence__gte=min_confidence
+        )))
+    if geography:
+        queryset = queryset.filter(Exists(ArticleGeography.objects.filter(
+            article=OuterRef('pk'), geography__name=geography, confidence__gte=min_confidence
+        )))
+
+    return queryset
 
 
 class ArticleListView(ListView):
@@ -21,86 +94,147 @@ class ArticleListView(ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        queryset = PreprocessingArticle.objects.all()
-
-        # Apply filters from query parameters
-        outcome = self.request.GET.get('outcome')
-        source = self.request.GET.get('source')
-        storygroup = self.request.GET.get('storygroup')
-        search = self.request.GET.get('search')
-        added_by = self.request.GET.get('added_by')
-
-        if outcome:
-            queryset = queryset.filter(outcome=outcome)
-        if source:
-            queryset = queryset.filter(source__icontains=source)
-        if storygroup:
-            queryset = queryset.filter(storygroup__icontains=storygroup)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
-        if added_by:
-            queryset = queryset.filter(added_by__icontains=added_by)
-
-        # Sorting
         sort_by = self.request.GET.get('sort', '-time_added')
-        queryset = queryset.order_by(sort_by)
+        queryset = filter_articles(
+            PreprocessingArticle.objects.for_list(), self.request.GET, rank=sort_by == 'relevance'
+        )
+
+        # Sorting (relevance ordering comes from the search itself)
+        if sort_by == 'relevance':
+            if not self.request.GET.get('search'):
+                queryset = queryset.order_by('-time_added')
+        else:
+            queryset = queryset.order_by(sort_by)
 
         return queryset
 
+    def paginate_queryset(self, queryset, page_size):
+        """Keyset pagination: ?after= / ?before= cursors, ?last=1, with page and total carried in the links."""
+        params = self.request.GET
+        number = params.get('page', '')
+        total = params.get('total', '')
+        paginator = KeysetPaginator(queryset, params.get('sort', '-time_added'), page_size)
+        page = paginator.page(
+            after=params.get('after'),
+            before=params.get('before'),
+            last=bool(params.get('last')),
+            number=int(number) if number.isdigit() else 1,
+            total=int(total) if total.isdigit() else None,
+        )
+        return paginator, page, page.object_list, page.has_previous or page.has_next
+
+    def _page_links(self, page):
+        """Query strings for the first/previous/next/last page links, keeping the current filters."""
+        params = self.request.GET.copy()
+        for key in ('after', 'before', 'last', 'page', 'total'):
+            params.pop(key, None)
+        links = {'first': params.urlencode()}
+
+        if page.total is not None:
+            params['total'] = page.total
+        for name, cursor_key, cursor, number in (
+            ('previous', 'before', page.previous_cursor, page.number - 1),
+            ('next', 'after', page.next_cursor, page.number + 1),
+        ):
+            link = params.copy()
+            link[cursor_key] = cursor
+            link['page'] = number
+            links[name] = link.urlencode()
+
+        last = params.copy()
+        last['last'] = 1
+        links['last'] = last.urlencode()
+        return links
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context['page_links'] = self._page_links(context['page_obj'])
         context['filter_form'] = ArticleFilterForm(self.request.GET or None)
         context['bulk_form'] = BulkActionForm()
 
-        # Add statistics
+        # Near-duplicate counts for the articles on this page only
+        page_articles = context['articles']
+        duplicate_counts = dict(
+            PreprocessingArticle.objects.filter(duplicate_of__in=[a.pk for a in page_articles])
+            .values('duplicate_of').annotate(count=Count('id')).values_list('duplicate_of', 'count')
+        )
+        for article in page_articles:
+            article.duplicate_count = duplicate_counts.get(article.pk, 0)
+
+        # Add statistics (from the ArticleStat counters, not the article table)
+        outcomes = article_stats.counts('outcome')
         context['stats'] = {
-            'total': PreprocessingArticle.objects.count(),
-            'new': PreprocessingArticle.objects.filter(outcome='NEW').count(),
-            'processed': PreprocessingArticle.objects.filter(outcome='processed').count(),
-            'rejected': PreprocessingArticle.objects.filter(outcome='rejected').count(),
+            'total': article_stats.total(),
+            'new': outcomes.get('NEW', 0),
+            'processed': outcomes.get('processed', 0),
+            'rejected': outcomes.get('rejected', 0),
         }
 
         # Get unique sources and storygroups for filtering
-        context['sources'] = PreprocessingArticle.objects.values_list(
-            'source', flat=True
-        ).distinct().order_by('source')
+        context['sources'] = facets.values('source')
+        context['storygroups'] = facets.values('storygroup')
 
-        context['storygroups'] = PreprocessingArticle.objects.exclude(
-            storygroup=''
-        ).values_list('storygroup', flat=True).distinct().order_by('storygroup')
+        # Per-value counts for the current filter, shown in the filter panel
+        filters = {
+            key: value for key, value in self.request.GET.items() if key in FILTER_PARAMS and value
+        }
+        context['facet_counts'] = facets.counts(self.object_list, filters)
+        context['facet_labels'] = facets.COUNT_LABELS
+        context['filter_query'] = urlencode(filters)
 
         return context
 
     def post(self, request, *args, **kwargs):
-        """Handle bulk actions."""
-        action = request.POST.get('action')
-        article_ids = request.POST.getlist('selected_articles')
+        """
+        Handle bulk actions, applied to the selected articles or (scope=matching)
+        to every article matching the list filters posted in ``filters``.
+        """
+        action = request.POST.get('action', '')
         modified_by = request.POST.get('modified_by', '')
         storygroup = request.POST.get('storygroup', '')
+        filters = QueryDict(request.POST.get('filters', ''))
+        list_url = reverse('article_list') + (f'?{filters.urlencode()}' if filters else '')
+
+        if request.POST.get('scope') == 'matching':
+            articles = filter_articles(PreprocessingArticle.objects.all(), filters)
+        else:
+            article_ids = request.POST.getlist('selected_articles')
+            if not article_ids:
+                messages.warning(request, 'No articles selected.')
+                return redirect(list_url)
+            articles = PreprocessingArticle.objects.filter(id__in=article_ids)
+
+        if action not in dict(BulkActionForm.ACTIONS) and not storygroup:
+            messages.warning(request, 'No action selected.')
+            return redirect(list_url)
+
+        # Huge actions run in the background; the counters catch up as they go
+        matching = articles.count()
+        if matching > settings.BULK_ACTION_BACKGROUND_THRESHOLD:
+            bulk.apply_in_background(articles, action, storygroup, modified_by)
+            messages.info(request, f'Applying to {matching} articles in the background; refresh to follow progress.')
+            return redirect(list_url)
 
-        if not article_ids:
-            messages.warning(request, 'No articles selected.')
-            return redirect('article_list')
+        counts = bulk.apply(articles, action, storygroup, modified_by)
+        for step, count in counts.items():
+            messages.success(request, BULK_ACTION_MESSAGES[step].format(count=count))
 
-        articles = PreprocessingArticle.objects.filter(id__in=article_ids)
+        return redirect(list_url)
 
-        if action == 'mark_processed':
-            articles.update(outcome='processed', modified_by=modified_by)
-            messages.success(request, f'{len(article_ids)} articles marked as processed.')
-        elif action == 'mark_rejected':
-            articles.update(outcome='rejected', modified_by=modified_by)
-            messages.success(request, f'{len(article_ids)} articles marked as rejected.')
-        elif action == 'mark_new':
-            articles.update(outcome='NEW', modified_by=modified_by)
-            messages.success(request, f'{len(article_ids)} articles marked as new.')
 
-        if storygroup:
-            articles.update(storygroup=storygroup)
-            messages.success(request, f'Story group updated for {len(article_ids)} articles.')
+def related_articles(article, limit=None):
+    """The articles most similar to ``article``, best first, each with a ``similarity``."""
+    scores = RelatedArticleIndex().related(article, limit or settings.RELATED_ARTICLES_LIMIT)
+    articles = PreprocessingArticle.objects.only(
+        'id', 'title', 'source', 'published', 'storygroup'
+    ).in_bulk([article_id for article_id, _ in scores])
 
-        return redirect('article_list')
+    related = []
+    for article_id, score in scores:
+        if article_id in articles:
+            articles[article_id].similarity = score
+            related.append(articles[article_id])
+    return related
 
 
 class ArticleDetailView(DetailView):
@@ -113,6 +247,7 @@ class ArticleDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['edit_form'] = ArticleEditForm(instance=self.object)
+        context['related_articles'] = related_articles(self.object)
         return context
 
     def post(self, request, *args, **kwargs):
@@ -138,14 +273,13 @@ class SyncView(View):
 
     def get(self, request):
         """Display aggregator status and controls."""
-        preprocessing_count = PreprocessingArticle.objects.count()
-        new_count = PreprocessingArticle.objects.filter(outcome='NEW').count()
-        processed_count = PreprocessingArticle.objects.filter(outcome='processed').count()
+        outcomes = article_stats.counts('outcome')
 
         context = {
-            'total_articles': preprocessing_count,
-            'new_articles': new_count,
-            'processed_articles': processed_count,
+            'total_articles': article_stats.total(),
+            'new_articles': outcomes.get('NEW', 0),
+            'processed_articles': outcomes.get('processed', 0),
+            'pending_classification': article_stats.counts('classification_status').get('pending', 0),
         }
 
         return render(request, self.template_name, context)
@@ -156,6 +290,8 @@ class SyncView(View):
 
         if action == 'fetch_articles':
             return self.fetch_articles(request)
+        if action == 'classify_pending':
+            return self.classify_pending(request)
 
         messages.error(request, 'Unknown action.')
         return redirect('sync_status')
@@ -164,7 +300,11 @@ class SyncView(View):
         """Fetch new articles from RSS feeds."""
         try:
             output = StringIO()
-            call_command('fetch_articles', stdout=output)
+            call_command(
+                'fetch_articles',
+                defer_classification=bool(request.POST.get('defer_classification')),
+                stdout=output,
+            )
 
             output_str = output.getvalue()
 
@@ -181,6 +321,69 @@ class SyncView(View):
 
         return redirect('sync_status')
 
+    def classify_pending(self, request):
+        """Classify all articles waiting in the classification backlog."""
+        try:
+            output = StringIO()
+            call_command('classify_pending', stdout=output)
+
+            for line in output.getvalue().split('\n'):
+                if 'Classified' in line or 'No articles pending' in line:
+                    messages.info(request, line.strip())
+
+            messages.success(request, 'Pending articles classified.')
+
+        except Exception as e:
+            messages.error(request, f'Error classifying articles: {str(e)}')
+
+        return redirect('sync_status')
+
+
+class TrendingView(View):
+    """Emerging phrases from the trend detector updated by each fetch."""
+
+    template_name = 'articles/trending.html'
+
+    def get(self, request):
+        """Display phrases trending in the recent window against the baseline."""
+        detector = TrendTracker(settings.TRENDS_STATE_PATH).load()
+        try:
+            min_count = max(1, int(request.GET.get('min_count', 3)))
+        except ValueError:
+            min_count = 3
+
+        # Phrases that are already taxonomy keywords are not new topics
+        known = get_taxonomy_loader(str(settings.TAXONOMY_PATH), settings.TAXONOMY_CACHE_DIR).get().keywords
+
+        context = {
+            'trends': detector.trending(limit=50, min_count=min_count, exclude=known),
+            'has_data': bool(detector.buckets),
+            'recent_hours': detector.recent_hours,
+            'baseline_hours': detector.baseline_hours,
+            'min_count': min_count,
+        }
+
+        return render(request, self.template_name, context)
+
+
+# Fields reviewers may change from the list without opening the article
+QUICK_EDIT_FIELDS = ['outcome', 'storygroup', 'modified_by']
+BATCH_EDIT_LIMIT = 500
+
+
+def quick_edit_error(field, value):
+    """Why ``value`` cannot be written to ``field`` by a quick edit, or None if it can."""
+    if field not in QUICK_EDIT_FIELDS:
+        return 'Invalid field'
+    if not isinstance(value, str):
+        return 'Invalid value'
+    if field == 'outcome' and value not in dict(PreprocessingArticle.OUTCOME_CHOICES):
+        return 'Invalid outcome'
+    max_length = PreprocessingArticle._meta.get_field(field).max_length
+    if len(value) > max_length:
+        return f'Value longer than {max_length} characters'
+    return None
+
 
 def ajax_quick_edit(request, pk):
     """AJAX endpoint for quick editing of article fields."""
@@ -189,11 +392,116 @@ def ajax_quick_edit(request, pk):
         field = request.POST.get('field')
         value = request.POST.get('value')
 
-        if field in ['outcome', 'storygroup', 'modified_by']:
-            setattr(article, field, value)
-            article.save()
-            return JsonResponse({'success': True, 'message': 'Updated successfully'})
+        error = quick_edit_error(field, value)
+        if error:
+            return JsonResponse({'success': False, 'message': error})
 
-        return JsonResponse({'success': False, 'message': 'Invalid field'})
+        setattr(article, field, value)
+        # last_synced is auto_now, so it is only bumped when listed
+        article.save(update_fields=[field, 'last_synced'])
+        return JsonResponse({'success': True, 'message': 'Updated successfully'})
 
     return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+
+def ajax_batch_edit(request):
+    """
+    AJAX endpoint applying many quick edits at once. Takes a JSON body
+    {"edits": [{"id": 1, "field": "outcome", "value": "rejected"}, ...]} and returns
+    one result per edit, in order. Valid edits are written in one transaction,
+    as one UPDATE per (field, value); for repeated edits of a field the last wins.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+    try:
+        edits = json.loads(request.body).get('edits')
+    except (ValueError, AttributeError):
+        edits = None
+    if not isinstance(edits, list):
+        return JsonResponse({'success': False, 'message': 'Expected {"edits": [...]}'}, status=400)
+    if len(edits) > BATCH_EDIT_LIMIT:
+        return JsonResponse({'success': False, 'message': f'At most {BATCH_EDIT_LIMIT} edits per batch'}, status=400)
+
+    results = []
+    latest = {}
+    for index, edit in enumerate(edits):
+        edit = edit if isinstance(edit, dict) else {}
+        pk, field, value = edit.get('id'), edit.get('field'), edit.get('value')
+        # type() rather than isinstance(), which would take true/false as ids 1/0
+        error = 'Invalid id' if type(pk) is not int else quick_edit_error(field, value)
+        results.append({'id': pk, 'field': field, 'success': not error, 'message': error or 'Updated'})
+        if not error:
+            if (pk, field) in latest:
+                results[latest[(pk, field)][0]]['message'] = 'Superseded by a later edit'
+            latest[(pk, field)] = (index, value)
+
+    groups = {}
+    for (pk, field), (index, value) in latest.items():
+        groups.setdefault((field, value), []).append(pk)
+
+    now = timezone.now()
+    with transaction.atomic():
+        found = set(PreprocessingArticle.objects.filter(
+            pk__in={pk for pk, _ in latest}
+        ).values_list('pk', flat=True))
+        for (field, value), pks in groups.items():
+            pks = [pk for pk in pks if pk in found]
+            if pks:
+                PreprocessingArticle.objects.filter(pk__in=pks).update(**{field: value}, last_synced=now)
+
+    for result in results:
+        if result['success'] and result['id'] not in found:
+            result.update(success=False, message='Article not found')
+    if any(field == 'storygroup' and pk in found for pk, field in latest):
+        facets.invalidate()
+
+    return JsonResponse({
+        'success': True,
+        'updated': sum(1 for result in results if result['success']),
+        'results': results,
+    })
+
+
+def ajax_related_articles(request, pk):
+    """AJAX endpoint listing the articles related to an article (?limit=N, at most 50)."""
+    article = get_object_or_404(PreprocessingArticle, pk=pk)
+    limit = request.GET.get('limit', '')
+    limit = min(int(limit), 50) if limit.isdigit() and int(limit) > 0 else None
+
+    return JsonResponse({
+        'success': True,
+        'articles': [
+            {
+                'id': related.id,
+                'title': related.title,
+                'source': related.source,
+                'published': related.published.isoformat() if related.published else None,
+                'storygroup': related.storygroup,
+                'similarity': round(related.similarity, 4),
+            }
+            for related in related_articles(article, limit)
+        ],
+    })
+
+
+def ajax_classification_status(request):
+    """AJAX endpoint reporting classification progress for ?ids=1,2,3."""
+    ids = [i for i in request.GET.get('ids', '').split(',') if i.strip().isdigit()]
+
+    articles = PreprocessingArticle.objects.filter(id__in=ids[:200]).only(
+        'id', 'classification_status', 'classification'
+    )
+
+    return JsonResponse({
+        'success': True,
+        'articles': {
+            str(article.id): {
+                'status': article.classification_status,
+                'sentiment': article.sentiment_label,
+                'badge_class': article.sentiment_badge_class,
+                'topics': article.topic_names,
+            }
+            for article in articles
+        },
+    })
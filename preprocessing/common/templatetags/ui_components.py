@@ -30,7 +30,7 @@ def stat_card(value, label, variant='primary', icon=None):
 
 
 @register.inclusion_tag('components/filter_panel.html', takes_context=True)
-def filter_panel(context, form, action_url=None, show_sort=True):
+def filter_panel(context, form, action_url=None, show_sort=True, facets=None):
     """
     Render a filter panel with form.
 
@@ -38,6 +38,7 @@ def filter_panel(context, form, action_url=None, show_sort=True):
         form: The filter form instance
         action_url: The form action URL (default: current path)
         show_sort: Whether to show sort field
+        facets: Optional per-value counts to show below the form (see facet_counts)
 
     Example:
         {% load ui_components %}
@@ -47,10 +48,53 @@ def filter_panel(context, form, action_url=None, show_sort=True):
         'form': form,
         'action_url': action_url,
         'show_sort': show_sort,
+        'facets': facets,
         'request': context.get('request')
     }
 
 
+@register.inclusion_tag('components/facet_counts.html', takes_context=True)
+def facet_counts(context, counts, labels=None):
+    """
+    Render per-value counts for each facet as links that apply the value as a filter.
+
+    Args:
+        counts: {field: [(value, count), ...]}
+        labels: Optional {field: heading}; defaults to the field name in title case
+
+    Example:
+        {% load ui_components %}
+        {% facet_counts facet_counts %}
+    """
+    request = context.get('request')
+    params = request.GET.copy() if request else None
+    if params is not None:
+        # A new filter starts again from the first page
+        for key in ('after', 'before', 'last', 'page', 'total'):
+            params.pop(key, None)
+
+    facets = []
+    for field, values in (counts or {}).items():
+        entries = []
+        for value, count in values:
+            query = ''
+            if params is not None:
+                link = params.copy()
+                link[field] = value
+                query = link.urlencode()
+            entries.append({
+                'value': value,
+                'count': count,
+                'query': query,
+                'active': params is not None and params.get(field) == value,
+            })
+        if entries:
+            label = (labels or {}).get(field, field.replace('_', ' ').title())
+            facets.append({'field': field, 'label': label, 'values': entries})
+
+    return {'facets': facets}
+
+
 @register.inclusion_tag('components/pagination.html', takes_context=True)
 def pagination_controls(context, page_obj):
     """
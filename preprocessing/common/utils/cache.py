@@ -0,0 +1,45 @@
+"""
+Version-keyed caching for small, read-mostly lists such as filter facets.
+
+Every entry in a namespace is stored under the namespace's current version, so
+invalidating the whole namespace is a single write of a new version; stale
+entries are never read again and simply expire.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _version_key(namespace: str) -> str:
+    return f'{namespace}:version'
+
+
+def namespace_version(namespace: str) -> int:
+    """The namespace's current version, starting one if there is none."""
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        version = time.time_ns()
+        # add() so that concurrent first readers agree on one version
+        if not cache.add(_version_key(namespace), version, None):
+            version = cache.get(_version_key(namespace), version)
+    return version
+
+
+def bump_version(namespace: str) -> None:
+    """
+    Invalidate every entry in the namespace. The new version is a fresh
+    timestamp rather than an increment, so a lost or evicted version key can
+    never bring back entries cached under an earlier one.
+    """
+    cache.set(_version_key(namespace), time.time_ns(), None)
+
+
+def cached(namespace: str, name: str, compute, timeout=None):
+    """``compute()``, cached under the namespace's current version."""
+    key = f'{namespace}:{namespace_version(namespace)}:{name}'
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, settings.FACET_CACHE_TIMEOUT if timeout is None else timeout)
+    return value
@@ -0,0 +1,15 @@
+"""
+Helpers for the raw SQLite objects (triggers, FTS tables) that migrations
+create alongside Django's tables.
+"""
+from typing import Iterable, List
+
+from django.db import connections
+
+
+def missing_triggers(names: Iterable[str], using: str = 'default') -> List[str]:
+    """Those of the named triggers that are not in the database."""
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        existing = {row[0] for row in cursor.fetchall()}
+    return [name for name in names if name not in existing]
@@ -0,0 +1,22 @@
+"""
+Distinct sources and categories for the feed list's filter dropdowns, cached
+until a feed is created, changed or deleted.
+"""
+from typing import List
+
+from common.utils.cache import bump_version, cached
+
+from .models import Feed
+
+NAMESPACE = 'facets:feeds'
+
+
+def values(field: str) -> List[str]:
+    """Distinct values of ``field`` across all feeds, sorted."""
+    return cached(NAMESPACE, field, lambda: list(
+        Feed.objects.values_list(field, flat=True).distinct().order_by(field)
+    ))
+
+
+def invalidate() -> None:
+    bump_version(NAMESPACE)
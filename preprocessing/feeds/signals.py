@@ -0,0 +1,14 @@
+"""
+Cache invalidation for feed saves and deletes.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import facets
+from .models import Feed
+
+
+@receiver(post_save, sender=Feed)
+@receiver(post_delete, sender=Feed)
+def feed_changed(sender, instance, **kwargs):
+    facets.invalidate()
@@ -4,6 +4,7 @@ from django.contrib import messages
 from django.urls import reverse_lazy
 from django.http import JsonResponse
 
+from . import facets
 from .models import Feed
 from .forms import FeedForm
 
@@ -49,13 +50,8 @@ class FeedListView(ListView):
         }
 
         # Get unique sources and categories for filtering
-        context['sources'] = Feed.objects.values_list(
-            'source_name', flat=True
-        ).distinct().order_by('source_name')
-
-        context['categories'] = Feed.objects.values_list(
-            'category', flat=True
-        ).distinct().order_by('category')
+        context['sources'] = facets.values('source_name')
+        context['categories'] = facets.values('category')
 
         return context
 
@@ -10,11 +10,17 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Shared ingestion modules (sentiment, classification) live in the repository's src/ directory
+SHARED_SRC_DIR = BASE_DIR.parent / 'src'
+if str(SHARED_SRC_DIR) not in sys.path:
+    sys.path.append(str(SHARED_SRC_DIR))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
@@ -59,7 +65,7 @@ ROOT_URLCONF = 'preprocessing_project.urls'
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [],
+        'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -123,3 +129,59 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Cache
+# File-based so that invalidations made by management commands (fetch_articles
+# from cron) reach the web server processes; a local-memory cache would not see them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'data' / 'cache',
+    }
+}
+
+# Filter facet lists (distinct sources, story groups, feed categories) are cached
+# until the rows behind them change; the timeout only bounds missed invalidations
+FACET_CACHE_TIMEOUT = 3600
+
+# Per-filter facet counts in the article list's filter panel are cached this long
+FACET_COUNTS_TIMEOUT = 60
+
+
+# Article classification
+# 'lexicon' (fast, compiled lexicon) or 'textblob' (reference implementation)
+SENTIMENT_BACKEND = 'lexicon'
+
+# Classification results cached by content hash; set the path to None to disable
+CLASSIFICATION_CACHE_PATH = BASE_DIR / 'data' / 'classification_cache.db'
+CLASSIFICATION_CACHE_MAX_ENTRIES = 200000
+
+# Topic/geography keyword tables shared with src/classifier.py; edits are picked up
+# by running classifiers. Compiled copies are cached in TAXONOMY_CACHE_DIR (None disables).
+TAXONOMY_PATH = BASE_DIR.parent / 'config' / 'taxonomy.yaml'
+TAXONOMY_CACHE_DIR = BASE_DIR / 'data'
+
+# Streaming trend detector state, updated with the new articles of each fetch
+TRENDS_STATE_PATH = BASE_DIR / 'data' / 'trends.pickle'
+
+# Articles whose MinHash similarity reaches the threshold within the window are
+# linked as near-duplicates of the earliest copy
+NEAR_DUPLICATE_THRESHOLD = 0.6
+NEAR_DUPLICATE_WINDOW_DAYS = 3
+
+# Online story clustering behind suggested_storygroup: articles join the active
+# cluster (updated within the window) whose centroid similarity reaches the threshold
+STORY_CLUSTERS_STATE_PATH = BASE_DIR / 'data' / 'story_clusters.pickle'
+STORY_CLUSTER_THRESHOLD = 0.35
+STORY_CLUSTER_WINDOW_HOURS = 72
+
+# Related-articles index: article terms live in ArticleTerm, document frequencies here.
+# Lookups read at most RELATED_ARTICLES_MAX_POSTINGS of the newest articles per term.
+RELATED_ARTICLES_STATE_PATH = BASE_DIR / 'data' / 'related_terms.pickle'
+RELATED_ARTICLES_LIMIT = 10
+RELATED_ARTICLES_MAX_POSTINGS = 2000
+
+# Bulk review actions update articles in chunks of BULK_ACTION_CHUNK_SIZE; actions
+# on more articles than the threshold run in a background thread
+BULK_ACTION_CHUNK_SIZE = 500
+BULK_ACTION_BACKGROUND_THRESHOLD = 5000
@@ -1,5 +1,7 @@
 from django.contrib import admin
+from django.db import transaction
 from .models import SankeyDiagram, PublishedNode, NodeArticleAssociation
+from .services import AssociationService
 
 
 @admin.register(SankeyDiagram)
@@ -68,6 +70,7 @@ class PublishedNodeAdmin(admin.ModelAdmin):
 
     list_filter = [
         'sankey_diagram',
+        'retired_at',
         'created_at',
     ]
 
@@ -76,15 +79,13 @@ class PublishedNodeAdmin(admin.ModelAdmin):
         'sankey_diagram__name',
     ]
 
-    readonly_fields = ['created_at']
-
-    def supporting_count(self, obj):
-        return obj.get_supporting_count()
-    supporting_count.short_description = 'Supporting'
-
-    def conflicting_count(self, obj):
-        return obj.get_conflicting_count()
-    conflicting_count.short_description = 'Conflicting'
+    readonly_fields = [
+        'supporting_count',
+        'conflicting_count',
+        'supporting_score',
+        'conflicting_score',
+        'created_at',
+    ]
 
 
 @admin.register(NodeArticleAssociation)
@@ -114,6 +115,14 @@ class NodeArticleAssociationAdmin(admin.ModelAdmin):
 
     readonly_fields = ['created_at']
 
+    def save_model(self, request, obj, form, change):
+        """Save the association and move its evidence between node counters."""
+        with transaction.atomic():
+            if change:
+                AssociationService.adjust_counters(NodeArticleAssociation.objects.get(pk=obj.pk), -1)
+            super().save_model(request, obj, form, change)
+            AssociationService.adjust_counters(obj, 1)
+
     def article_title_short(self, obj):
         """Return shortened article title."""
         return obj.article.title[:50] + ('...' if len(obj.article.title) > 50 else '')
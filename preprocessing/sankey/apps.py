@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class SankeyConfig(AppConfig):
     name = 'sankey'
+
+    def ready(self):
+        from . import signals  # noqa: F401
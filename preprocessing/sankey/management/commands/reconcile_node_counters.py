@@ -0,0 +1,23 @@
+"""
+Management command to recount the evidence counters on published nodes from
+their article associations. The counters are kept current by
+AssociationService and a post_delete receiver; run this periodically (e.g.
+nightly from cron) to catch drift from restores or manual database edits.
+"""
+from django.core.management.base import BaseCommand
+
+from sankey.services import NodeService
+
+
+class Command(BaseCommand):
+    help = 'Recount supporting and conflicting association counts and scores per published node'
+
+    def handle(self, *args, **options):
+        corrected = NodeService.reconcile_counters()
+
+        if not corrected:
+            self.stdout.write(self.style.SUCCESS('✓ Node counters were up to date'))
+            return
+
+        self.stdout.write(self.style.WARNING(f'⊘ Corrected the counters of {corrected} node(s)'))
+        self.stdout.write(self.style.SUCCESS('✓ Node counters reconciled'))
@@ -0,0 +1,55 @@
+# Generated by Django 6.0 on 2026-10-19 14:05
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    PublishedNode = apps.get_model('sankey', 'PublishedNode')
+    supporting = Q(article_associations__association_type='supporting')
+    conflicting = Q(article_associations__association_type='conflicting')
+    nodes = PublishedNode.objects.annotate(
+        actual_supporting_count=Count('article_associations', filter=supporting),
+        actual_conflicting_count=Count('article_associations', filter=conflicting),
+        actual_supporting_score=Coalesce(Sum('article_associations__score', filter=supporting), 0),
+        actual_conflicting_score=Coalesce(Sum('article_associations__score', filter=conflicting), 0),
+    )
+    fields = ['supporting_count', 'conflicting_count', 'supporting_score', 'conflicting_score']
+    filled = []
+    for node in nodes:
+        for field in fields:
+            setattr(node, field, getattr(node, f'actual_{field}'))
+        filled.append(node)
+    PublishedNode.objects.bulk_update(filled, fields, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sankey', '0002_sankeydiagram_is_published_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publishednode',
+            name='supporting_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='publishednode',
+            name='conflicting_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='publishednode',
+            name='supporting_score',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='publishednode',
+            name='conflicting_score',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sankey', '0003_publishednode_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publishednode',
+            name='retired_at',
+            field=models.DateTimeField(blank=True, help_text='When the node was removed from its diagram', null=True),
+        ),
+    ]
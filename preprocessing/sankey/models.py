@@ -87,6 +87,21 @@ class PublishedNode(models.Model):
         help_text='Original node configuration (position, color, etc.)'
     )
 
+    # Set when a republished diagram no longer has the node; its associations
+    # are kept, but it takes no new ones
+    retired_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='When the node was removed from its diagram'
+    )
+
+    # Evidence counters, kept current by AssociationService; recount with
+    # the reconcile_node_counters command
+    supporting_count = models.IntegerField(default=0, editable=False)
+    conflicting_count = models.IntegerField(default=0, editable=False)
+    supporting_score = models.IntegerField(default=0, editable=False)
+    conflicting_score = models.IntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -100,17 +115,15 @@ class PublishedNode(models.Model):
 
     def get_supporting_count(self):
         """Count of supporting article associations."""
-        return self.article_associations.filter(association_type='supporting').count()
+        return self.supporting_count
 
     def get_conflicting_count(self):
         """Count of conflicting article associations."""
-        return self.article_associations.filter(association_type='conflicting').count()
+        return self.conflicting_count
 
     def get_total_score(self):
         """Sum of all association scores."""
-        from django.db.models import Sum
-        result = self.article_associations.aggregate(total=Sum('score'))
-        return result['total'] or 0
+        return self.supporting_score + self.conflicting_score
 
 
 class NodeArticleAssociation(models.Model):
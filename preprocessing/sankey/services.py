@@ -2,11 +2,18 @@
 Business logic for Sankey diagram operations.
 """
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from common.services.base import BaseCRUDService
 from .models import SankeyDiagram, PublishedNode, NodeArticleAssociation
 
 
+# PublishedNode counters maintained from its associations
+COUNTER_FIELDS = ['supporting_count', 'conflicting_count', 'supporting_score', 'conflicting_score']
+
+
 class DiagramService(BaseCRUDService):
     """Service for Sankey diagram operations."""
 
@@ -33,45 +40,63 @@ class DiagramService(BaseCRUDService):
     @classmethod
     def publish_diagram(cls, diagram, nodes_data):
         """
-        Publish a diagram by creating PublishedNode entries for all nodes.
+        Publish a diagram by creating PublishedNode entries for its nodes, or
+        republish an edited one: nodes new to the diagram are created, nodes
+        no longer in it are retired (keeping their associations) and retired
+        nodes that are back are restored. Runs in one transaction.
 
         Args:
             diagram: SankeyDiagram instance
             nodes_data: List of dicts with node information [{'name': '...', 'color': '...'}, ...]
 
         Returns:
-            tuple: (diagram, created_nodes_count)
+            tuple: (diagram, {'created': n, 'retired': n, 'restored': n})
 
         Raises:
-            ValidationError: If diagram is already published or no nodes provided
+            ValidationError: If no nodes provided
         """
-        if diagram.is_published:
-            raise ValidationError("Diagram is already published")
+        nodes_by_name = {}
+        for node_data in nodes_data or []:
+            if node_data.get('name'):
+                nodes_by_name.setdefault(node_data['name'], node_data)
 
-        if not nodes_data:
+        if not nodes_by_name:
             raise ValidationError("No nodes provided")
 
-        # Create PublishedNode entries
-        created_count = 0
-        for node_data in nodes_data:
-            node_name = node_data.get('name')
-            if node_name:
-                _, created = PublishedNode.objects.get_or_create(
-                    sankey_diagram=diagram,
-                    name=node_name,
-                    defaults={
-                        'original_config_data': node_data
-                    }
-                )
-                if created:
-                    created_count += 1
-
-        # Mark diagram as published
-        diagram.is_published = True
-        diagram.published_at = timezone.now()
-        diagram.save()
-
-        return diagram, created_count
+        now = timezone.now()
+        with transaction.atomic():
+            existing = dict(
+                PublishedNode.objects.filter(sankey_diagram=diagram).values_list('name', 'retired_at')
+            )
+            new_nodes = [
+                PublishedNode(sankey_diagram=diagram, name=name, original_config_data=node_data)
+                for name, node_data in nodes_by_name.items() if name not in existing
+            ]
+            PublishedNode.objects.bulk_create(new_nodes, batch_size=500, ignore_conflicts=True)
+
+            retired = [name for name, retired_at in existing.items() if not retired_at and name not in nodes_by_name]
+            restored = [name for name, retired_at in existing.items() if retired_at and name in nodes_by_name]
+            if retired:
+                diagram.published_nodes.filter(name__in=retired).update(retired_at=now)
+            if restored:
+                diagram.published_nodes.filter(name__in=restored).update(retired_at=None)
+
+            # Mark diagram as published
+            diagram.is_published = True
+            diagram.published_at = now
+            diagram.save()
+
+        return diagram, {'created': len(new_nodes), 'retired': len(retired), 'restored': len(restored)}
+
+    @classmethod
+    def publish_message(cls, changes):
+        """Summary of a publish_diagram result for the user."""
+        message = f"Diagram published with {changes['created']} new node(s)"
+        if changes['retired']:
+            message += f", {changes['retired']} retired"
+        if changes['restored']:
+            message += f", {changes['restored']} restored"
+        return message
 
     @classmethod
     def get_diagram_statistics(cls, diagram):
@@ -82,7 +107,7 @@ class DiagramService(BaseCRUDService):
         }
 
         if diagram.is_published:
-            stats['total_nodes'] = diagram.published_nodes.count()
+            stats['total_nodes'] = diagram.published_nodes.filter(retired_at__isnull=True).count()
             stats['total_associations'] = NodeArticleAssociation.objects.filter(
                 node__sankey_diagram=diagram
             ).count()
@@ -97,28 +122,75 @@ class NodeService(BaseCRUDService):
 
     @classmethod
     def get_node_statistics(cls, node):
-        """Get detailed statistics for a node."""
-        from django.db.models import Sum
+        """Get detailed statistics for a node, from its stored counters."""
+        return {
+            'supporting_count': node.supporting_count,
+            'conflicting_count': node.conflicting_count,
+            'supporting_score': node.supporting_score,
+            'conflicting_score': node.conflicting_score,
+            'total_score': node.supporting_score - node.conflicting_score,
+            'total_associations': node.supporting_count + node.conflicting_count
+        }
 
-        supporting = node.article_associations.filter(association_type='supporting')
-        conflicting = node.article_associations.filter(association_type='conflicting')
+    @classmethod
+    def listable_nodes(cls, nodes=None):
+        """
+        Published nodes (those not retired, or the given queryset) with their
+        diagrams loaded, ready for ``to_dict``.
+        """
+        nodes = PublishedNode.objects.filter(retired_at__isnull=True) if nodes is None else nodes
+        return nodes.select_related('sankey_diagram')
 
-        supporting_score = supporting.aggregate(total=Sum('score'))['total'] or 0
-        conflicting_score = conflicting.aggregate(total=Sum('score'))['total'] or 0
+    @classmethod
+    def reconcile_counters(cls):
+        """
+        Recount every node's evidence counters from its associations and store
+        the ones that differ. Returns the number of nodes corrected.
+        """
+        supporting = Q(article_associations__association_type='supporting')
+        conflicting = Q(article_associations__association_type='conflicting')
+        with transaction.atomic():
+            nodes = PublishedNode.objects.annotate(
+                actual_supporting_count=Count('article_associations', filter=supporting),
+                actual_conflicting_count=Count('article_associations', filter=conflicting),
+                actual_supporting_score=Coalesce(Sum('article_associations__score', filter=supporting), 0),
+                actual_conflicting_score=Coalesce(Sum('article_associations__score', filter=conflicting), 0),
+            )
+            drifted = []
+            for node in nodes:
+                changed = False
+                for field in COUNTER_FIELDS:
+                    actual = getattr(node, f'actual_{field}')
+                    if getattr(node, field) != actual:
+                        setattr(node, field, actual)
+                        changed = True
+                if changed:
+                    drifted.append(node)
+            PublishedNode.objects.bulk_update(drifted, COUNTER_FIELDS, batch_size=500)
+        return len(drifted)
 
+    @classmethod
+    def to_dict(cls, node):
+        """JSON-ready summary of a node and its stored counters; load nodes with ``listable_nodes``."""
         return {
-            'supporting_count': supporting.count(),
-            'conflicting_count': conflicting.count(),
-            'supporting_score': supporting_score,
-            'conflicting_score': conflicting_score,
-            'total_score': supporting_score - conflicting_score,
-            'total_associations': node.article_associations.count()
+            'id': node.id,
+            'name': node.name,
+            'diagram_name': node.sankey_diagram.name,
+            'diagram_id': node.sankey_diagram.id,
+            'supporting_count': node.supporting_count,
+            'conflicting_count': node.conflicting_count,
+            'supporting_score': node.supporting_score,
+            'conflicting_score': node.conflicting_score,
+            'retired': node.retired_at is not None,
         }
 
     @classmethod
     def get_node_associations(cls, node):
         """Get all associations for a node, grouped by type."""
-        associations = node.article_associations.select_related('article').all()
+        associations = node.article_associations.select_related('article').only(
+            'id', 'association_type', 'score', 'created_at', 'created_by',
+            'article__id', 'article__title', 'article__source'
+        )
 
         supporting = []
         conflicting = []
@@ -183,19 +255,77 @@ class AssociationService(BaseCRUDService):
         if association_type not in ['supporting', 'conflicting']:
             raise ValidationError("Association type must be 'supporting' or 'conflicting'")
 
-        association, created = NodeArticleAssociation.objects.update_or_create(
-            node=node,
-            article=article,
-            defaults={
-                'association_type': association_type,
-                'score': score,
-                'created_by': created_by
-            }
-        )
+        try:
+            score = int(score)
+        except (TypeError, ValueError):
+            raise ValidationError("Score must be a whole number")
+
+        with transaction.atomic():
+            # Take back what the association counted before an update
+            previous = NodeArticleAssociation.objects.select_for_update().filter(
+                node=node, article=article
+            ).only('node_id', 'association_type', 'score').first()
+            if previous:
+                cls.adjust_counters(previous, -1)
+            elif node.retired_at:
+                raise ValidationError("Node has been retired from its diagram")
+
+            association, created = NodeArticleAssociation.objects.update_or_create(
+                node=node,
+                article=article,
+                defaults={
+                    'association_type': association_type,
+                    'score': score,
+                    'created_by': created_by
+                }
+            )
+            cls.adjust_counters(association, 1)
 
         return association, created
 
+    @classmethod
+    def adjust_counters(cls, association, sign):
+        """
+        Add (sign=1) or remove (sign=-1) the association's type and score on
+        its node's counters, in one UPDATE. Deletes, including those cascaded
+        from articles and nodes, are counted by the post_delete receiver in
+        signals.py.
+        """
+        kind = association.association_type
+        PublishedNode.objects.filter(pk=association.node_id).update(**{
+            f'{kind}_count': F(f'{kind}_count') + sign,
+            f'{kind}_score': F(f'{kind}_score') + sign * association.score,
+        })
+
     @classmethod
     def get_article_associations(cls, article):
         """Get all node associations for an article."""
         return article.node_associations.select_related('node__sankey_diagram').all()
+
+    @classmethod
+    def get_article_bundle(cls, article_id):
+        """
+        Everything the article page needs about nodes, in two queries: the
+        article's associations and every published node with its counters,
+        including retired nodes the article is associated with.
+        """
+        associations = list(NodeArticleAssociation.objects.filter(article_id=article_id).only(
+            'id', 'node_id', 'association_type', 'score', 'created_at', 'created_by'
+        ))
+        nodes = PublishedNode.objects.filter(
+            Q(retired_at__isnull=True) | Q(pk__in=[association.node_id for association in associations])
+        )
+        return {
+            'associations': [
+                {
+                    'id': association.id,
+                    'node_id': association.node_id,
+                    'association_type': association.association_type,
+                    'score': association.score,
+                    'created_at': association.created_at,
+                    'created_by': association.created_by,
+                }
+                for association in associations
+            ],
+            'nodes': [NodeService.to_dict(node) for node in NodeService.listable_nodes(nodes)],
+        }
@@ -0,0 +1,15 @@
+"""
+Node counter upkeep for association deletes.
+"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import NodeArticleAssociation
+from .services import AssociationService
+
+
+@receiver(post_delete, sender=NodeArticleAssociation)
+def association_deleted(sender, instance, **kwargs):
+    # Sent for each cascaded row too (e.g. when an article is deleted), inside
+    # the delete's transaction
+    AssociationService.adjust_counters(instance, -1)
@@ -13,6 +13,7 @@ urlpatterns = [
     path('ajax/publish/<int:pk>/', views.diagram_publish, name='sankey_publish'),
     path('ajax/nodes/<int:diagram_id>/<str:node_name>/associations/', views.node_associations, name='node_associations'),
     path('ajax/nodes/published/', views.published_nodes_list, name='published_nodes_list'),
+    path('ajax/articles/<int:article_id>/associations/', views.article_associations, name='article_associations'),
     path('ajax/associations/create/', views.create_association, name='create_association'),
     path('ajax/associations/<int:association_id>/delete/', views.delete_association, name='delete_association'),
 ]
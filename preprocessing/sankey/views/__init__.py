@@ -15,6 +15,7 @@ from .ajax_views import (
     diagram_publish,
     node_associations,
     published_nodes_list,
+    article_associations,
     create_association,
     delete_association
 )
@@ -31,6 +32,7 @@ __all__ = [
     'diagram_publish',
     'node_associations',
     'published_nodes_list',
+    'article_associations',
     'create_association',
     'delete_association',
 ]
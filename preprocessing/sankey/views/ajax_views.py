@@ -1,6 +1,7 @@
 """
 AJAX endpoints for Sankey diagram operations.
 """
+from django.core.paginator import Paginator
 from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_http_methods
 from django.core.exceptions import ValidationError
@@ -55,7 +56,10 @@ def diagram_save_ajax(request):
 @require_http_methods(["POST"])
 @ajax_response
 def diagram_publish(request, pk):
-    """Publish a diagram - creates PublishedNode entries for all nodes."""
+    """
+    Publish a diagram - creates PublishedNode entries for all nodes. Publishing
+    again syncs the nodes with the edited diagram.
+    """
     data = json.loads(request.body)
     diagram = get_object_or_404(SankeyDiagram, pk=pk)
 
@@ -63,11 +67,12 @@ def diagram_publish(request, pk):
     nodes = data.get('nodes', [])
 
     # Publish using service
-    diagram, created_count = DiagramService.publish_diagram(diagram, nodes)
+    diagram, changes = DiagramService.publish_diagram(diagram, nodes)
 
     return {
-        'message': f'Diagram published successfully with {created_count} nodes',
-        'published_at': diagram.published_at.isoformat()
+        'message': DiagramService.publish_message(changes),
+        'published_at': diagram.published_at.isoformat(),
+        **changes
     }
 
 
@@ -108,21 +113,36 @@ def node_associations(request, diagram_id, node_name):
 
 @require_http_methods(["GET"])
 def published_nodes_list(request):
-    """Get list of all published nodes for article association."""
-    nodes = PublishedNode.objects.select_related('sankey_diagram').all()
-
-    nodes_data = []
-    for node in nodes:
-        nodes_data.append({
-            'id': node.id,
-            'name': node.name,
-            'diagram_name': node.sankey_diagram.name,
-            'diagram_id': node.sankey_diagram.id,
-            'supporting_count': node.get_supporting_count(),
-            'conflicting_count': node.get_conflicting_count()
-        })
+    """
+    Get published nodes with their association counts and scores, a page at a
+    time (?page=N, ?page_size=N up to 500), optionally for one ?diagram=<id>.
+    """
+    nodes = NodeService.listable_nodes()
+    diagram_id = request.GET.get('diagram', '')
+    if diagram_id.isdigit():
+        nodes = nodes.filter(sankey_diagram_id=diagram_id)
+
+    page_size = request.GET.get('page_size', '')
+    page_size = min(int(page_size), 500) if page_size.isdigit() and int(page_size) > 0 else 100
+    paginator = Paginator(nodes.order_by('sankey_diagram__name', 'name', 'id'), page_size)
+    page = paginator.get_page(request.GET.get('page'))
+
+    return APIResponse.success(data={
+        'nodes': [NodeService.to_dict(node) for node in page],
+        'page': page.number,
+        'num_pages': paginator.num_pages,
+        'total': paginator.count,
+    })
+
+
+@require_http_methods(["GET"])
+def article_associations(request, article_id):
+    """Get an article's node associations together with every published node and its counts."""
+    from articles.models import PreprocessingArticle
+    if not PreprocessingArticle.objects.filter(pk=article_id).exists():
+        return APIResponse.not_found("Article not found")
 
-    return APIResponse.success(data={'nodes': nodes_data})
+    return APIResponse.success(data=AssociationService.get_article_bundle(article_id))
 
 
 @require_http_methods(["POST"])
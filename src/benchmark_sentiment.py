@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Compare sentiment backends on stored articles.
+Reports label agreement with TextBlob and throughput of each backend.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+from database import NewsDatabase
+from sentiment import SENTIMENT_BACKENDS, compare_backends
+
+def main():
+    """Run the sentiment backend comparison."""
+    parser = argparse.ArgumentParser(description='Benchmark sentiment backends')
+    parser.add_argument('--db', type=str, default='data/news.db', help='Database path (default: data/news.db)')
+    parser.add_argument('--limit', '-l', type=int, default=5000, help='Number of articles to score (default: 5000)')
+    parser.add_argument('--reference', choices=sorted(SENTIMENT_BACKENDS), default='textblob', help='Reference backend')
+    parser.add_argument('--candidate', choices=sorted(SENTIMENT_BACKENDS), default='lexicon', help='Backend under test')
+    
+    args = parser.parse_args()
+    
+    db = NewsDatabase(args.db)
+    articles = db.get_articles(limit=args.limit)
+    if not articles:
+        print("No articles found.")
+        return 1
+    
+    # Same text the classifier scores
+    texts = [
+        f"{a.get('title') or ''} {a.get('description') or ''} {a.get('summary') or ''}".lower()
+        for a in articles
+    ]
+    
+    report = compare_backends(texts, reference=args.reference, candidate=args.candidate)
+    
+    print(f"=== Sentiment Backend Comparison ({report['count']} articles) ===")
+    for name, timing in report['backends'].items():
+        print(f"  {name}: {timing['seconds']:.3f}s ({timing['texts_per_second']:.0f} articles/s)")
+    
+    reference = report['backends'][args.reference]['seconds']
+    candidate = report['backends'][args.candidate]['seconds']
+    if candidate:
+        print(f"  Speedup: {reference / candidate:.1f}x")
+    
+    print(f"\nLabel agreement: {report['label_agreement']:.1%}")
+    print(f"Exact polarity matches: {report['exact_polarity_matches']:.1%}")
+    print(f"Mean polarity difference: {report['mean_polarity_error']:.4f} (max {report['max_polarity_error']:.4f})")
+    print(f"Mean subjectivity difference: {report['mean_subjectivity_error']:.4f}")
+    
+    return 0
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,131 @@
+"""
+Persistent cache of article classification results.
+
+Results are keyed by a hash of the normalised title, description and summary
+together with the classifier version, so re-fetched or syndicated articles are
+not reclassified and any change to the keyword tables or sentiment backend
+invalidates old entries automatically. Entries live in a small SQLite
+database and the least recently used ones (including entries from old
+versions) are evicted beyond ``max_entries``.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_CACHE_PATH = "data/classification_cache.db"
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lowercase and collapse whitespace so trivial differences share a key."""
+    return WHITESPACE_RE.sub(' ', (value or '').lower()).strip()
+
+
+def content_hash(article: Dict) -> str:
+    """Hash the classified fields of an article."""
+    parts = [normalize_text(article.get(field)) for field in ('title', 'description', 'summary')]
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def version_hash(*components) -> str:
+    """Build a version key from any JSON-serialisable classifier configuration."""
+    payload = json.dumps(components, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class ClassificationCache:
+    """SQLite-backed LRU cache of classification results."""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, max_entries: int = 200000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self._writes_since_evict = 0
+        self._lock = threading.Lock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS classification_cache (
+                cache_key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_classification_cache_last_used
+                ON classification_cache(last_used);
+        """)
+
+    @staticmethod
+    def key_for(article: Dict, version: str) -> str:
+        """Cache key for an article under a classifier version."""
+        return f"{version}:{content_hash(article)}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for ``key`` and mark it as recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM classification_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE classification_cache SET last_used = ? WHERE cache_key = ?",
+                (time.time(), key)
+            )
+            return json.loads(row[0])
+
+    def put(self, key: str, result: Dict):
+        """Store a classification result."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO classification_cache (cache_key, result, last_used) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(result), time.time())
+            )
+            self._writes_since_evict += 1
+
+            # Amortise eviction instead of counting rows on every write
+            if self._writes_since_evict >= 1000:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries beyond ``max_entries``."""
+        self._writes_since_evict = 0
+        count = self._conn.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute("""
+                DELETE FROM classification_cache WHERE cache_key IN (
+                    SELECT cache_key FROM classification_cache ORDER BY last_used LIMIT ?
+                )
+            """, (excess,))
+            self.logger.debug(f"Evicted {excess} classification cache entries")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this process."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        """Close the underlying connection."""
+        self._conn.close()
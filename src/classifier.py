@@ -1,138 +1,60 @@
 import re
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Optional
 import logging
-from textblob import TextBlob
+
+from classification_cache import ClassificationCache, version_hash
+from sentiment import get_sentiment_analyzer, sentiment_label
+from taxonomy import CompiledTaxonomy, DEFAULT_TAXONOMY_CACHE_DIR, DEFAULT_TAXONOMY_PATH, get_taxonomy_loader
+from trends import TrendDetector
+
+# Bump when the classification logic (not just the taxonomy) changes
+CLASSIFIER_VERSION = 1
 
 class NewsClassifier:
-    def __init__(self):
+    def __init__(self, sentiment_backend: str = None, cache: Optional[ClassificationCache] = None,
+                 taxonomy_path: str = DEFAULT_TAXONOMY_PATH, taxonomy_cache_dir: Optional[str] = DEFAULT_TAXONOMY_CACHE_DIR):
         """Initialize the news classifier."""
         self.logger = logging.getLogger(__name__)
+        self.sentiment_analyzer = get_sentiment_analyzer(sentiment_backend)
+        self.cache = cache
         
-        # Define keyword mappings for topics
-        self.topic_keywords = {
-            'Economics': [
-                'economy', 'economic', 'gdp', 'growth', 'recession', 'inflation', 
-                'deflation', 'unemployment', 'jobs', 'employment', 'fiscal', 
-                'monetary', 'budget', 'debt', 'deficit', 'stimulus'
-            ],
-            'Central Banking': [
-                'fed', 'federal reserve', 'central bank', 'interest rate', 
-                'monetary policy', 'quantitative easing', 'ecb', 'boe', 
-                'bank of japan', 'rba', 'pboc'
-            ],
-            'Politics': [
-                'government', 'political', 'politics', 'election', 'vote', 
-                'campaign', 'policy', 'legislation', 'congress', 'parliament', 
-                'senate', 'house', 'president', 'prime minister'
-            ],
-            'Geopolitics': [
-                'international', 'diplomacy', 'foreign policy', 'alliance', 
-                'sanctions', 'trade war', 'conflict', 'peace', 'nato', 'un', 
-                'united nations', 'summit', 'bilateral', 'multilateral'
-            ],
-            'Business': [
-                'company', 'corporate', 'business', 'enterprise', 'corporation', 
-                'startup', 'ceo', 'executive', 'management', 'board', 'shares', 
-                'stock', 'revenue', 'profit', 'earnings'
-            ],
-            'Finance': [
-                'market', 'trading', 'investment', 'investor', 'fund', 'bank', 
-                'banking', 'financial', 'credit', 'loan', 'mortgage', 'bond', 
-                'equity', 'currency', 'forex', 'commodity'
-            ],
-            'Technology': [
-                'tech', 'technology', 'digital', 'ai', 'artificial intelligence', 
-                'blockchain', 'cryptocurrency', 'bitcoin', 'software', 'hardware', 
-                'innovation', 'startup', 'silicon valley'
-            ],
-            'Energy': [
-                'oil', 'gas', 'energy', 'renewable', 'solar', 'wind', 'nuclear', 
-                'coal', 'petroleum', 'lng', 'pipeline', 'opec', 'electricity', 
-                'power', 'grid'
-            ],
-            'Climate': [
-                'climate', 'environment', 'green', 'carbon', 'emissions', 
-                'sustainability', 'renewable', 'clean energy', 'global warming', 
-                'paris agreement', 'esg'
-            ],
-            'Trade': [
-                'trade', 'export', 'import', 'tariff', 'customs', 'wto', 
-                'free trade', 'trade agreement', 'supply chain', 'logistics'
-            ]
-        }
-        
-        # Define geographic keywords
-        self.geography_keywords = {
-            'United States': [
-                'us', 'usa', 'america', 'american', 'united states', 'washington', 
-                'new york', 'california', 'texas', 'wall street', 'silicon valley'
-            ],
-            'United Kingdom': [
-                'uk', 'britain', 'british', 'england', 'london', 'scotland', 
-                'wales', 'northern ireland'
-            ],
-            'European Union': [
-                'eu', 'europe', 'european', 'brussels', 'eurozone', 'euro area'
-            ],
-            'China': [
-                'china', 'chinese', 'beijing', 'shanghai', 'hong kong', 'mainland china'
-            ],
-            'Japan': [
-                'japan', 'japanese', 'tokyo', 'osaka', 'yen'
-            ],
-            'Australia': [
-                'australia', 'australian', 'sydney', 'melbourne', 'canberra'
-            ],
-            'Canada': [
-                'canada', 'canadian', 'toronto', 'ottawa', 'vancouver'
-            ],
-            'Germany': [
-                'germany', 'german', 'berlin', 'frankfurt', 'munich'
-            ],
-            'France': [
-                'france', 'french', 'paris', 'lyon'
-            ],
-            'India': [
-                'india', 'indian', 'mumbai', 'delhi', 'bangalore'
-            ],
-            'Russia': [
-                'russia', 'russian', 'moscow', 'kremlin'
-            ],
-            'Brazil': [
-                'brazil', 'brazilian', 'sao paulo', 'rio de janeiro'
-            ]
-        }
-        
-        # Market-specific terms
-        self.market_keywords = {
-            'Stock Markets': [
-                'stock market', 'equity', 'shares', 'dow jones', 'nasdaq', 
-                's&p 500', 'ftse', 'dax', 'nikkei', 'asx', 'tsx'
-            ],
-            'Bonds': [
-                'bond', 'treasury', 'government bond', 'corporate bond', 
-                'yield', 'fixed income'
-            ],
-            'Currencies': [
-                'currency', 'forex', 'exchange rate', 'dollar', 'euro', 
-                'pound', 'yen', 'yuan', 'rmb'
-            ]
-        }
-        
-        # Combine all keyword mappings
-        self.all_keywords = {**self.topic_keywords, **self.geography_keywords, **self.market_keywords}
+        # Keyword tables live in config/taxonomy.yaml and are reloaded when it changes
+        self.taxonomy = get_taxonomy_loader(taxonomy_path, taxonomy_cache_dir)
+        self._versions: Dict[str, str] = {}
+    
+    @property
+    def version(self) -> str:
+        """Cache key version - changes whenever the taxonomy or sentiment backend change."""
+        return self._version_for(self.taxonomy.get())
+    
+    def _version_for(self, taxonomy: CompiledTaxonomy) -> str:
+        if taxonomy.content_hash not in self._versions:
+            self._versions[taxonomy.content_hash] = version_hash(
+                CLASSIFIER_VERSION, taxonomy.content_hash, self.sentiment_analyzer.name
+            )
+        return self._versions[taxonomy.content_hash]
     
     def classify_article(self, article: Dict) -> Dict:
         """Classify an article and return topics, geographies, and other tags."""
+        taxonomy = self.taxonomy.get()
+        
+        if self.cache is not None:
+            cache_key = self.cache.key_for(article, self._version_for(taxonomy))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                # JSON round-trip turns (name, confidence) tuples into lists
+                cached['topics'] = [tuple(t) for t in cached['topics']]
+                cached['geographies'] = [tuple(g) for g in cached['geographies']]
+                return cached
+        
         # Combine title and description for analysis
         text = f"{article.get('title', '')} {article.get('description', '')} {article.get('summary', '')}"
         text = text.lower()
         
-        # Extract topics
-        topics = self._extract_topics(text)
-        
-        # Extract geographies
-        geographies = self._extract_geographies(text)
+        # Extract topics (top 5) and geographies (top 3)
+        matches = taxonomy.match(text)
+        topics = matches['topics'][:5]
+        geographies = matches['geographies'][:3]
         
         # Extract sentiment
         sentiment = self._analyze_sentiment(text)
@@ -140,78 +62,25 @@ class NewsClassifier:
         # Generate additional tags
         additional_tags = self._generate_additional_tags(text)
         
-        return {
+        result = {
             'topics': topics,
             'geographies': geographies,
             'sentiment': sentiment,
             'additional_tags': additional_tags
         }
-    
-    def _extract_topics(self, text: str) -> List[Tuple[str, float]]:
-        """Extract topics from text with confidence scores."""
-        topics = []
-        
-        for topic, keywords in self.topic_keywords.items():
-            score = 0
-            matches = 0
-            
-            for keyword in keywords:
-                # Count exact matches
-                if keyword in text:
-                    matches += 1
-                    # Give higher score for exact phrase matches
-                    if len(keyword.split()) > 1:
-                        score += 2
-                    else:
-                        score += 1
-            
-            if matches > 0:
-                # Normalize score based on text length and number of keywords
-                confidence = min(score / len(keywords) * 2, 1.0)
-                topics.append((topic, confidence))
-        
-        # Sort by confidence and return top topics
-        topics.sort(key=lambda x: x[1], reverse=True)
-        return topics[:5]  # Return top 5 topics
-    
-    def _extract_geographies(self, text: str) -> List[Tuple[str, float]]:
-        """Extract geographic mentions from text."""
-        geographies = []
         
-        for geography, keywords in self.geography_keywords.items():
-            score = 0
-            matches = 0
-            
-            for keyword in keywords:
-                if keyword in text:
-                    matches += 1
-                    score += 1
-            
-            if matches > 0:
-                confidence = min(score / len(keywords) * 3, 1.0)
-                geographies.append((geography, confidence))
+        if self.cache is not None:
+            self.cache.put(cache_key, result)
         
-        # Sort by confidence
-        geographies.sort(key=lambda x: x[1], reverse=True)
-        return geographies[:3]  # Return top 3 geographies
+        return result
     
     def _analyze_sentiment(self, text: str) -> Dict:
         """Analyze sentiment of the text."""
         try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity  # -1 to 1
-            subjectivity = blob.sentiment.subjectivity  # 0 to 1
-            
-            # Classify sentiment
-            if polarity > 0.1:
-                sentiment_label = 'positive'
-            elif polarity < -0.1:
-                sentiment_label = 'negative'
-            else:
-                sentiment_label = 'neutral'
+            polarity, subjectivity = self.sentiment_analyzer.analyze(text)  # -1 to 1, 0 to 1
             
             return {
-                'label': sentiment_label,
+                'label': sentiment_label(polarity),
                 'polarity': polarity,
                 'subjectivity': subjectivity
             }
@@ -257,15 +126,25 @@ class NewsClassifier:
     
     def get_topic_hierarchy(self) -> Dict:
         """Return the topic hierarchy for reference."""
-        return {
-            'Economics': ['Central Banking', 'Inflation', 'GDP'],
-            'Politics': ['Elections', 'Policy', 'Geopolitics'],
-            'Finance': ['Stock Markets', 'Bonds', 'Currencies'],
-            'Business': ['Mergers & Acquisitions', 'Earnings'],
-        }
+        return self.taxonomy.get().topic_hierarchy()
     
-    def suggest_new_topics(self, recent_articles: List[Dict], min_frequency: int = 5) -> List[str]:
-        """Suggest new topics based on frequently occurring terms."""
-        # This would analyze recent articles to find new trending topics
-        # For now, return empty list - can be enhanced with NLP
-        return []
\ No newline at end of file
+    def suggest_new_topics(self, recent_articles: List[Dict] = (), min_frequency: int = 5,
+                           detector: Optional[TrendDetector] = None) -> List[str]:
+        """
+        Suggest new topics: emerging phrases that no taxonomy keyword covers yet.
+        
+        ``recent_articles`` are added to ``detector`` (a fresh one if None) before
+        it is queried; pass ``TrendTracker().load()`` to use the ingestion history.
+        """
+        detector = detector or TrendDetector()
+        detector.update(recent_articles)
+        trending = detector.trending(min_count=min_frequency, exclude=self.taxonomy.get().keywords)
+        return [trend['phrase'] for trend in trending]
+
+def build_classifier(sentiment_backend: str = None, cache_path: Optional[str] = None,
+                     taxonomy_path: str = DEFAULT_TAXONOMY_PATH,
+                     taxonomy_cache_dir: Optional[str] = DEFAULT_TAXONOMY_CACHE_DIR) -> NewsClassifier:
+    """Build a classifier with its own cache connection (used by pool worker processes)."""
+    cache = ClassificationCache(cache_path) if cache_path else None
+    return NewsClassifier(sentiment_backend=sentiment_backend, cache=cache, taxonomy_path=taxonomy_path,
+                          taxonomy_cache_dir=taxonomy_cache_dir)
\ No newline at end of file
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Classification backlog worker.
+Classifies articles saved with --defer-classification and writes the results back.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+from database import NewsDatabase
+from classifier import build_classifier
+from classify_pool import ClassificationPool
+from classification_cache import DEFAULT_CACHE_PATH
+from sentiment import SENTIMENT_BACKENDS, DEFAULT_SENTIMENT_BACKEND
+
+def drain_backlog(db, pool, batch_size: int, logger) -> int:
+    """Classify pending articles batch by batch until none are left."""
+    total = 0
+    
+    while True:
+        pending = db.get_pending_articles(batch_size)
+        if not pending:
+            return total
+        
+        results = pool.classify(pending)
+        
+        for article, (_, error) in zip(pending, results):
+            if error:
+                logger.error(f"Error classifying article '{article.get('title', 'Unknown')}': {error}")
+        
+        db.update_classifications([
+            (article['id'], classification)
+            for article, (classification, _) in zip(pending, results)
+        ])
+        total += len(pending)
+        
+        run = pool.last_run
+        logger.info(f"Classified batch of {run['articles']} in {run['seconds']:.2f}s "
+                    f"({run['articles_per_second']:.0f} articles/s, {run['errors']} errors)")
+
+def main():
+    """Drain the classification backlog once, or keep polling with --loop."""
+    parser = argparse.ArgumentParser(description='Classify pending articles')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--batch-size', type=int, default=200, help='Articles read and written per batch (default: 200)')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='Classification worker processes (default: 1, in-process)')
+    parser.add_argument('--chunk-size', type=int, default=50, help='Articles sent to a worker at a time (default: 50)')
+    parser.add_argument('--sentiment-backend', choices=sorted(SENTIMENT_BACKENDS), default=DEFAULT_SENTIMENT_BACKEND,
+                        help=f'Sentiment analysis backend (default: {DEFAULT_SENTIMENT_BACKEND})')
+    parser.add_argument('--no-cache', action='store_true', help='Reclassify every article instead of using the classification cache')
+    parser.add_argument('--loop', action='store_true', help='Keep running and poll for new pending articles')
+    parser.add_argument('--interval', type=int, default=30, help='Seconds between polls with --loop (default: 30)')
+    
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger = logging.getLogger(__name__)
+    
+    db = NewsDatabase()
+    classifier_factory = partial(
+        build_classifier,
+        sentiment_backend=args.sentiment_backend,
+        cache_path=None if args.no_cache else DEFAULT_CACHE_PATH
+    )
+    
+    try:
+        with ClassificationPool(classifier_factory, workers=args.workers, chunk_size=args.chunk_size) as pool:
+            while True:
+                logger.info(f"{db.get_pending_count()} articles pending classification")
+                classified = drain_backlog(db, pool, args.batch_size, logger)
+                if classified:
+                    logger.info(f"Classified {classified} articles")
+                
+                if not args.loop:
+                    break
+                time.sleep(args.interval)
+    except KeyboardInterrupt:
+        logger.info("Process interrupted by user")
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -1,16 +1,26 @@
 import sqlite3
 import json
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import re
+from datetime import datetime, timezone
+from functools import partial
+from typing import List, Dict, Iterable, Optional, Set, Tuple
 import logging
 from pathlib import Path
 
+from near_duplicates import MinHasher, NearDuplicateIndex, StoredSignature
+
 class NewsDatabase:
     def __init__(self, db_path: str = "data/news.db"):
         """Initialize the news database."""
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
         
+        # Topic/geography name -> id, filled lazily so classification writes skip lookups
+        self._topic_ids: Dict[str, int] = {}
+        self._geography_ids: Dict[str, int] = {}
+        
+        self._minhasher = MinHasher()
+        
         # Ensure data directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
@@ -37,7 +47,11 @@ class NewsDatabase:
                     published DATETIME,
                     fetched_at DATETIME NOT NULL,
                     processed_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    classification_status TEXT DEFAULT 'pending', -- pending, classified, failed
+                    classification TEXT, -- JSON classifier output
+                    minhash BLOB, -- packed MinHash signature (near_duplicates.py)
+                    duplicate_of INTEGER -- earliest near-duplicate article, NULL for originals
                 );
                 
                 -- Tags table
@@ -101,6 +115,13 @@ class NewsDatabase:
                     FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
                 );
                 
+                -- LSH band keys of article MinHash signatures, for near-duplicate lookups
+                CREATE TABLE IF NOT EXISTS article_signature_bands (
+                    key INTEGER NOT NULL,
+                    article_id INTEGER NOT NULL,
+                    FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
+                );
+                
                 -- Feed sources table
                 CREATE TABLE IF NOT EXISTS feed_sources (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -121,14 +142,98 @@ class NewsDatabase:
                 CREATE INDEX IF NOT EXISTS idx_article_tags_tag_id ON article_tags(tag_id);
                 CREATE INDEX IF NOT EXISTS idx_article_geographies_article_id ON article_geographies(article_id);
                 CREATE INDEX IF NOT EXISTS idx_article_topics_article_id ON article_topics(article_id);
+                -- Covering indexes for topic/geography filters (lookup by id, range on confidence)
+                CREATE INDEX IF NOT EXISTS idx_article_topics_topic ON article_topics(topic_id, confidence, article_id);
+                CREATE INDEX IF NOT EXISTS idx_article_geographies_geography ON article_geographies(geography_id, confidence, article_id);
+                CREATE INDEX IF NOT EXISTS idx_topics_name_nocase ON topics(name COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_geographies_name_nocase ON geographies(name COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_article_signature_bands_key ON article_signature_bands(key, article_id);
             """)
             
+            # Bring databases created before newer columns up to date
+            self._migrate_schema(conn)
+            
+            # Full-text index over title/description/summary
+            self._fts_enabled = self._init_search_index(conn)
+            
             # Insert default topics
             self._insert_default_topics(conn)
             
             # Insert default geographies
             self._insert_default_geographies(conn)
     
+    def _migrate_schema(self, conn):
+        """Add columns introduced after the original schema."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)").fetchall()}
+        
+        if 'classification_status' not in columns:
+            # Existing articles join the classification backlog
+            conn.execute("ALTER TABLE articles ADD COLUMN classification_status TEXT DEFAULT 'pending'")
+        if 'classification' not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN classification TEXT")
+        if 'minhash' not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN minhash BLOB")
+        if 'duplicate_of' not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN duplicate_of INTEGER")
+        
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_classification_status ON articles(classification_status, id)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_duplicate_of ON articles(duplicate_of)")
+    
+    def _init_search_index(self, conn) -> bool:
+        """
+        Create the FTS5 index and the triggers keeping it in sync with articles.
+        
+        The index is external-content (it stores no copy of the text). Databases
+        that already have articles are indexed when it is first created. Returns
+        False if this SQLite build has no FTS5, in which case search falls back to LIKE.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        try:
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, description, summary,
+                    content='articles', content_rowid='id',
+                    tokenize='porter unicode61 remove_diacritics 2'
+                );
+                
+                CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                    INSERT INTO articles_fts(rowid, title, description, summary)
+                    VALUES (new.id, new.title, new.description, new.summary);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, title, description, summary)
+                    VALUES ('delete', old.id, old.title, old.description, old.summary);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, description, summary ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, title, description, summary)
+                    VALUES ('delete', old.id, old.title, old.description, old.summary);
+                    INSERT INTO articles_fts(rowid, title, description, summary)
+                    VALUES (new.id, new.title, new.description, new.summary);
+                END;
+            """)
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Full-text search unavailable, falling back to LIKE search: {e}")
+            return False
+        
+        if not exists:
+            conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+        return True
+    
+    def rebuild_search_index(self) -> int:
+        """Re-index every article for full-text search. Returns the number of articles."""
+        if not self._fts_enabled:
+            raise RuntimeError("This SQLite build does not support FTS5")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+            conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')")
+            return conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    
     def _insert_default_topics(self, conn):
         """Insert default topic categories."""
         default_topics = [
@@ -205,31 +310,9 @@ class NewsDatabase:
         """Insert a new article into the database."""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    INSERT OR REPLACE INTO articles 
-                    (title, link, description, summary, source, category, feed_url, 
-                     guid, author, published, fetched_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    article_data.get('title'),
-                    article_data.get('link'),
-                    article_data.get('description'),
-                    article_data.get('summary'),
-                    article_data.get('source'),
-                    article_data.get('category'),
-                    article_data.get('feed_url'),
-                    article_data.get('guid'),
-                    article_data.get('author'),
-                    article_data.get('published'),
-                    article_data.get('fetched_at')
-                ))
-                
-                article_id = cursor.lastrowid
-                
-                # Insert tags if provided
-                if 'tags' in article_data and article_data['tags']:
-                    self._insert_article_tags(conn, article_id, article_data['tags'])
-                
+                article_id = self._insert_article(conn, article_data)
+                self._store_classifications(conn, [(article_id, article_data.get('classification'))])
+                self._link_near_duplicates(conn, [(article_id, article_data)])
                 return article_id
                 
         except sqlite3.IntegrityError as e:
@@ -244,6 +327,92 @@ class NewsDatabase:
             self.logger.error(f"Error inserting article: {e}")
             return None
     
+    def _insert_article(self, conn, article_data: Dict) -> int:
+        """Insert one article row (and its tags) on an open connection."""
+        classification = article_data.get('classification')
+        status = article_data.get('classification_status') or ('classified' if classification else 'pending')
+        
+        # A plain INSERT: an existing link raises IntegrityError for the caller.
+        # REPLACE would delete the old row without firing the search index's
+        # delete trigger, leaving its terms in articles_fts.
+        cursor = conn.execute("""
+            INSERT INTO articles 
+            (title, link, description, summary, source, category, feed_url, 
+             guid, author, published, fetched_at, processed_at,
+             classification_status, classification)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            article_data.get('title'),
+            article_data.get('link'),
+            article_data.get('description'),
+            article_data.get('summary'),
+            article_data.get('source'),
+            article_data.get('category'),
+            article_data.get('feed_url'),
+            article_data.get('guid'),
+            article_data.get('author'),
+            article_data.get('published'),
+            article_data.get('fetched_at'),
+            datetime.now() if status != 'pending' else None,
+            status,
+            json.dumps(classification) if classification else None
+        ))
+        
+        article_id = cursor.lastrowid
+        
+        # Insert tags if provided
+        if 'tags' in article_data and article_data['tags']:
+            self._insert_article_tags(conn, article_id, article_data['tags'])
+        
+        return article_id
+    
+    def _resolve_ids(self, conn, table: str, names: set, cache: Dict[str, int]) -> Dict[str, int]:
+        """Map names to ids in ``table``, creating unknown names and caching the result."""
+        missing = [name for name in names if name not in cache]
+        if missing:
+            conn.executemany(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", [(name,) for name in missing])
+            placeholders = ', '.join('?' for _ in missing)
+            rows = conn.execute(f"SELECT name, id FROM {table} WHERE name IN ({placeholders})", missing)
+            cache.update(rows.fetchall())
+        return cache
+    
+    def _store_classifications(self, conn, results: List[Tuple[int, Optional[Dict]]]):
+        """
+        Replace the topic and geography links of each (article_id, classification) pair.
+        
+        Classifier output lists (name, confidence) pairs; all rows are written with
+        one executemany per table.
+        """
+        results = [(article_id, classification or {}) for article_id, classification in results if article_id]
+        if not results:
+            return
+        
+        topic_ids = self._resolve_ids(
+            conn, 'topics',
+            {name for _, c in results for name, _ in c.get('topics', [])},
+            self._topic_ids
+        )
+        geography_ids = self._resolve_ids(
+            conn, 'geographies',
+            {name for _, c in results for name, _ in c.get('geographies', [])},
+            self._geography_ids
+        )
+        
+        article_ids = [(article_id,) for article_id, _ in results]
+        conn.executemany("DELETE FROM article_topics WHERE article_id = ?", article_ids)
+        conn.executemany("DELETE FROM article_geographies WHERE article_id = ?", article_ids)
+        
+        conn.executemany(
+            "INSERT OR REPLACE INTO article_topics (article_id, topic_id, confidence) VALUES (?, ?, ?)",
+            [(article_id, topic_ids[name], confidence)
+             for article_id, c in results for name, confidence in c.get('topics', [])]
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO article_geographies (article_id, geography_id, confidence) VALUES (?, ?, ?)",
+            [(article_id, geography_ids[name], confidence)
+             for article_id, c in results for name, confidence in c.get('geographies', [])]
+        )
+    
     def _insert_article_tags(self, conn, article_id: int, tags: List[str]):
         """Insert tags for an article."""
         for tag_name in tags:
@@ -258,18 +427,136 @@ class NewsDatabase:
                     (article_id, tag_id)
                 )
     
+    def _band_candidates(self, conn, keys: List[int]) -> Dict[int, Set[int]]:
+        """Map LSH band keys to the ids of articles indexed under them."""
+        candidates: Dict[int, Set[int]] = {}
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            placeholders = ', '.join('?' for _ in batch)
+            rows = conn.execute(
+                f"SELECT key, article_id FROM article_signature_bands WHERE key IN ({placeholders})", batch
+            )
+            for key, article_id in rows:
+                candidates.setdefault(key, set()).add(article_id)
+        return candidates
+    
+    def _load_signatures(self, conn, article_ids: Iterable[int]) -> Dict[int, StoredSignature]:
+        """Stored MinHash signatures, publication times and duplicate links for ``article_ids``."""
+        article_ids = list(article_ids)
+        stored = {}
+        for i in range(0, len(article_ids), 500):
+            batch = article_ids[i:i + 500]
+            placeholders = ', '.join('?' for _ in batch)
+            rows = conn.execute(f"""
+                SELECT id, minhash, published, duplicate_of FROM articles
+                WHERE id IN ({placeholders}) AND minhash IS NOT NULL
+            """, batch)
+            for article_id, minhash, published, duplicate_of in rows:
+                stored[article_id] = StoredSignature(
+                    self._minhasher.unpack(minhash), _parse_timestamp(published), duplicate_of
+                )
+        return stored
+    
+    def _link_near_duplicates(self, conn, inserted: List[Tuple[int, Dict]]) -> int:
+        """
+        Store MinHash signatures for newly inserted articles, index their band keys and
+        link each to the earliest near-duplicate already stored. Returns the number linked.
+        """
+        entries = []
+        for article_id, article in inserted:
+            signature = self._minhasher.signature(article.get('title'), article.get('description'))
+            if signature is not None:
+                entries.append((article_id, signature, _parse_timestamp(article.get('published'))))
+        if not entries:
+            return 0
+        
+        index = NearDuplicateIndex(
+            partial(self._band_candidates, conn), partial(self._load_signatures, conn), self._minhasher
+        )
+        matches = index.match(entries)
+        
+        conn.executemany(
+            "UPDATE articles SET minhash = ?, duplicate_of = ? WHERE id = ?",
+            [(self._minhasher.pack(signature), matches[article_id], article_id) for article_id, signature, _ in entries]
+        )
+        conn.executemany(
+            "INSERT INTO article_signature_bands (key, article_id) VALUES (?, ?)",
+            [(key, article_id) for article_id, signature, _ in entries for key in self._minhasher.band_keys(signature)]
+        )
+        
+        for article_id, article in inserted:
+            if matches.get(article_id):
+                article['duplicate_of'] = matches[article_id]
+        return sum(1 for canonical in matches.values() if canonical)
+    
     def get_article_id_by_link(self, link: str) -> Optional[int]:
         """Get article ID by its link."""
         with sqlite3.connect(self.db_path) as conn:
             result = conn.execute("SELECT id FROM articles WHERE link = ?", (link,)).fetchone()
             return result[0] if result else None
     
+    def get_existing_links(self, links: List[str]) -> set:
+        """Return the subset of ``links`` already stored."""
+        links = [link for link in set(links) if link]
+        existing = set()
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(0, len(links), 500):
+                batch = links[i:i + 500]
+                placeholders = ', '.join('?' for _ in batch)
+                rows = conn.execute(f"SELECT link FROM articles WHERE link IN ({placeholders})", batch)
+                existing.update(row[0] for row in rows)
+        return existing
+    
+    def _classification_conditions(self, topic: str = None, geography: str = None,
+                                   min_confidence: float = 0.0, correlated: bool = True) -> Tuple[List[str], List]:
+        """
+        SQL conditions restricting articles to a classified topic and/or geography.
+        
+        Listings use correlated EXISTS probes so SQLite walks the published index
+        newest-first and stops at LIMIT; counts (``correlated=False``) drive from the
+        covering (topic_id, confidence, article_id) indexes instead.
+        """
+        conditions = []
+        params = []
+        filters = [
+            ('article_topics', 'topic_id', 'topics', topic),
+            ('article_geographies', 'geography_id', 'geographies', geography),
+        ]
+        
+        for junction, key, table, name in filters:
+            if not name:
+                continue
+            if correlated:
+                conditions.append(f"""EXISTS (
+                    SELECT 1 FROM {junction} j
+                    WHERE j.article_id = articles.id
+                    AND j.{key} = (SELECT id FROM {table} WHERE name = ? COLLATE NOCASE)
+                    AND j.confidence >= ?
+                )""")
+            else:
+                conditions.append(f"""id IN (
+                    SELECT j.article_id FROM {junction} j
+                    WHERE j.{key} = (SELECT id FROM {table} WHERE name = ? COLLATE NOCASE)
+                    AND j.confidence >= ?
+                )""")
+            params.extend([name, min_confidence])
+        
+        return conditions, params
+    
     def get_articles(self, limit: int = 100, offset: int = 0, source: str = None, 
-                    category: str = None, since: datetime = None) -> List[Dict]:
-        """Get articles with optional filtering."""
+                    category: str = None, since: datetime = None, topic: str = None,
+                    geography: str = None, min_confidence: float = 0.0,
+                    after: Tuple = None, before: Tuple = None) -> List[Dict]:
+        """
+        Get articles with optional filtering, newest first.
+        
+        ``after`` / ``before`` are (published, id) of the last / first article of a
+        page already shown, and fetch the page following / preceding it by walking
+        the published index from that point - constant time however deep the
+        page, unlike ``offset``.
+        """
         query = "SELECT * FROM articles"
-        params = []
-        conditions = []
+        conditions, params = self._classification_conditions(topic, geography, min_confidence)
         
         if source:
             conditions.append("source = ?")
@@ -283,29 +570,72 @@ class NewsDatabase:
             conditions.append("published >= ?")
             params.append(since)
         
+        order = "DESC"
+        if after:
+            conditions.append("published <= ? AND (published < ? OR id < ?)")
+            params.extend([after[0], after[0], after[1]])
+        elif before:
+            # Walk forwards from the page start, then flip back to newest first
+            conditions.append("published >= ? AND (published > ? OR id > ?)")
+            params.extend([before[0], before[0], before[1]])
+            order = "ASC"
+        
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
         
-        query += " ORDER BY published DESC LIMIT ? OFFSET ?"
+        query += f" ORDER BY published {order}, id {order} LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            articles = [dict(row) for row in rows]
+            return articles[::-1] if order == "ASC" else articles
     
-    def get_article_count(self, source: str = None) -> int:
+    def get_article_count(self, source: str = None, topic: str = None, geography: str = None,
+                          min_confidence: float = 0.0, category: str = None, since: datetime = None) -> int:
         """Get total number of articles."""
         query = "SELECT COUNT(*) FROM articles"
-        params = []
+        conditions, params = self._classification_conditions(topic, geography, min_confidence, correlated=False)
         
         if source:
-            query += " WHERE source = ?"
+            conditions.append("source = ?")
             params.append(source)
         
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        
+        if since:
+            conditions.append("published >= ?")
+            params.append(since)
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
         with sqlite3.connect(self.db_path) as conn:
             return conn.execute(query, params).fetchone()[0]
     
+    def get_topics(self) -> List[str]:
+        """Get names of topics that have classified articles."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT name FROM topics
+                WHERE EXISTS (SELECT 1 FROM article_topics WHERE topic_id = topics.id)
+                ORDER BY name
+            """).fetchall()
+            return [row[0] for row in rows]
+    
+    def get_geographies(self) -> List[str]:
+        """Get names of geographies that have classified articles."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT name FROM geographies
+                WHERE EXISTS (SELECT 1 FROM article_geographies WHERE geography_id = geographies.id)
+                ORDER BY name
+            """).fetchall()
+            return [row[0] for row in rows]
+    
     def get_sources(self) -> List[str]:
         """Get list of all sources in database."""
         with sqlite3.connect(self.db_path) as conn:
@@ -318,10 +648,49 @@ class NewsDatabase:
         since = datetime.now() - timedelta(hours=hours)
         return self.get_articles(since=since)
     
-    def search_articles(self, keywords: str, limit: int = 100, offset: int = 0) -> List[Dict]:
-        """Search articles by keywords in title and description."""
+    def search_articles(self, keywords: str, limit: int = 100, offset: int = 0,
+                        highlight: Tuple[str, str] = ('[', ']')) -> List[Dict]:
+        """
+        Search articles by keywords in title, description and summary.
+        
+        Results are ranked by BM25 (title matches count most) and carry a
+        ``snippet`` of the matching text with terms wrapped in ``highlight``.
+        Supports "quoted phrases", prefix* terms and AND/OR/NOT; plain words
+        must all match.
+        """
+        if not self._fts_enabled:
+            return self._like_search(keywords, limit, offset)
+        
+        match = fts_query(keywords)
+        if not match:
+            return []
+        
+        query = """
+            SELECT articles.*,
+                   snippet(articles_fts, -1, ?, ?, '...', 16) AS snippet,
+                   bm25(articles_fts, 10.0, 3.0, 1.0) AS rank
+            FROM articles_fts
+            JOIN articles ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+            ORDER BY rank, articles.published DESC
+            LIMIT ? OFFSET ?
+        """
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            try:
+                rows = conn.execute(query, [highlight[0], highlight[1], match, limit, offset]).fetchall()
+            except sqlite3.OperationalError as e:
+                self.logger.error(f"Invalid search query {keywords!r}: {e}")
+                return []
+            return [dict(row) for row in rows]
+    
+    def _like_search(self, keywords: str, limit: int, offset: int) -> List[Dict]:
+        """Unranked substring search, for SQLite builds without FTS5."""
         # Create search terms
         search_terms = keywords.lower().split()
+        if not search_terms:
+            return []
         
         # Build query with LIKE conditions for each search term
         conditions = []
@@ -344,14 +713,136 @@ class NewsDatabase:
             rows = conn.execute(query, params).fetchall()
             return [dict(row) for row in rows]
     
+    def get_pending_articles(self, limit: int = 200) -> List[Dict]:
+        """Get the oldest articles still waiting for classification."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                SELECT id, title, description, summary FROM articles
+                WHERE classification_status = 'pending'
+                ORDER BY id LIMIT ?
+            """, (limit,)).fetchall()
+            return [dict(row) for row in rows]
+    
+    def get_pending_count(self) -> int:
+        """Get number of articles waiting for classification."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE classification_status = 'pending'"
+            ).fetchone()[0]
+    
+    def update_classifications(self, results: List[Tuple[int, Optional[Dict]]]) -> int:
+        """
+        Write classifier output back for (article_id, classification) pairs.
+        
+        A classification of None marks the article as failed so it leaves the backlog.
+        """
+        now = datetime.now()
+        rows = [
+            ('classified' if classification else 'failed',
+             json.dumps(classification) if classification else None,
+             now, article_id)
+            for article_id, classification in results
+        ]
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "UPDATE articles SET classification_status = ?, classification = ?, processed_at = ? WHERE id = ?",
+                rows
+            )
+            self._store_classifications(conn, results)
+        return len(rows)
+    
     def bulk_insert_articles(self, articles: List[Dict]) -> int:
-        """Insert multiple articles in a single transaction."""
-        inserted_count = 0
+        """Insert multiple articles and their classifications in a single transaction."""
+        inserted = []
+        inserted_articles = []
         
-        for article in articles:
-            article_id = self.insert_article(article)
-            if article_id:
-                inserted_count += 1
+        with sqlite3.connect(self.db_path) as conn:
+            for article in articles:
+                try:
+                    article_id = self._insert_article(conn, article)
+                except sqlite3.IntegrityError as e:
+                    if "UNIQUE constraint failed" not in str(e):
+                        self.logger.error(f"Error inserting article {article.get('link')}: {e}")
+                    else:
+                        self.logger.debug(f"Article already exists: {article.get('link')}")
+                    continue
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error inserting article {article.get('link')}: {e}")
+                    continue
+                article['id'] = article_id
+                inserted.append((article_id, article.get('classification')))
+                inserted_articles.append(article)
+            
+            self._store_classifications(conn, inserted)
+            linked = self._link_near_duplicates(
+                conn, [(article_id, article) for (article_id, _), article in zip(inserted, inserted_articles)]
+            )
         
-        self.logger.info(f"Inserted {inserted_count} new articles out of {len(articles)} total")
-        return inserted_count
\ No newline at end of file
+        self.logger.info(f"Inserted {len(inserted)} new articles out of {len(articles)} total "
+                         f"({linked} linked as near-duplicates)")
+        return len(inserted)
+
+
+SEARCH_TOKEN_PATTERN = re.compile(r'"[^"]*"?|\S+')
+SEARCH_OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+def fts_query(keywords: str) -> str:
+    """
+    Translate user search input into an FTS5 MATCH expression.
+    
+    "Quoted text" becomes a phrase, a trailing * a prefix search and AND/OR/NOT
+    stay operators; everything else is quoted so punctuation in the input
+    cannot break the query syntax.
+    
+    FTS5's NOT is binary ("a NOT b"), so "a AND NOT b" becomes "a NOT b". A NOT
+    with nothing to subtract from - leading, after OR or after another NOT -
+    cannot be expressed and is dropped together with its term, so the term is
+    never searched for as a positive match. Other operators missing an operand
+    are dropped.
+    """
+    terms = []
+    operator = None
+    skip_term = False
+    for token in SEARCH_TOKEN_PATTERN.findall(keywords or ''):
+        if token in SEARCH_OPERATORS:
+            if skip_term:
+                continue
+            if token == 'NOT':
+                if terms and operator in (None, 'AND'):
+                    operator = 'NOT'
+                else:
+                    skip_term = True
+                    operator = None
+            elif terms and operator is None:
+                operator = token
+            continue
+        prefix = token.endswith('*')
+        text = token.strip('"*').strip()
+        if not text:
+            continue
+        if skip_term:
+            skip_term = False
+            continue
+        if operator:
+            terms.append(operator)
+            operator = None
+        terms.append('"' + text.replace('"', '""') + '"' + ('*' if prefix else ''))
+    
+    return ' '.join(terms)
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Read a published value stored by sqlite3 (ISO text) or passed in as a datetime."""
+    if value is None or isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
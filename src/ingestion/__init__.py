@@ -0,0 +1,30 @@
+"""
+Shared ingestion core: fetch RSS feeds, classify articles and store them.
+
+Both entry points run the same ``IngestionPipeline`` and differ only in the
+source they read feeds from and the sink they write articles to:
+
+    src/main.py                YamlFeedSource  -> NewsDatabaseSink
+    manage.py fetch_articles   FeedModelSource -> DjangoArticleSink
+                               (aggregator/services.py)
+
+A source provides ``feeds(source=None) -> List[FeedSpec]``; a sink provides
+``save(articles) -> List[Dict]`` returning the articles that were new, with
+their stored ``id`` and ``duplicate_of`` set on those linked to an earlier
+near-duplicate.
+Observers (e.g. ``trends.TrendTracker``) receive those new articles after
+each run.
+"""
+
+from .fetcher import FeedFetcher
+from .pipeline import IngestionPipeline
+from .sinks import NewsDatabaseSink
+from .sources import FeedSpec, YamlFeedSource
+
+__all__ = [
+    'FeedFetcher',
+    'FeedSpec',
+    'IngestionPipeline',
+    'NewsDatabaseSink',
+    'YamlFeedSource',
+]
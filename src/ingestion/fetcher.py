@@ -0,0 +1,108 @@
+"""
+RSS feed fetching and entry extraction.
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+import feedparser
+
+from .sources import FeedSpec
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FeedFetcher:
+    """Parses RSS feeds into article dicts."""
+
+    def __init__(self, request_delay: float = 1.0, user_agent: str = USER_AGENT):
+        """
+        Args:
+            request_delay: Seconds to wait between feeds, to be respectful to servers
+            user_agent: User-Agent header sent with each feed request
+        """
+        self.request_delay = request_delay
+        self.user_agent = user_agent
+
+    def parse_feed(self, feed_url: str, source_name: str, category: str) -> List[Dict]:
+        """Parse a single RSS feed and return articles."""
+        articles = []
+
+        try:
+            logger.info(f"Parsing feed: {feed_url}")
+
+            feed = feedparser.parse(feed_url, agent=self.user_agent)
+
+            if feed.status != 200:
+                logger.warning(f"HTTP {feed.status} for feed {feed_url}")
+                return articles
+
+            for entry in feed.entries:
+                article = self._extract_article_data(entry, source_name, category, feed_url)
+                if article:
+                    articles.append(article)
+
+        except Exception as e:
+            logger.error(f"Error parsing feed {feed_url}: {str(e)}")
+
+        return articles
+
+    def _extract_article_data(self, entry, source_name: str, category: str, feed_url: str) -> Optional[Dict]:
+        """Extract article data from a feed entry."""
+        try:
+            article = {
+                'title': getattr(entry, 'title', ''),
+                'link': getattr(entry, 'link', ''),
+                'description': getattr(entry, 'description', ''),
+                'summary': getattr(entry, 'summary', ''),
+                'source': source_name,
+                'category': category,
+                'feed_url': feed_url,
+                'guid': getattr(entry, 'id', getattr(entry, 'link', '')),
+            }
+
+            # Extract publication date
+            published_time = getattr(entry, 'published_parsed', None)
+            if published_time:
+                article['published'] = datetime(*published_time[:6], tzinfo=timezone.utc)
+            else:
+                article['published'] = datetime.now(timezone.utc)
+
+            # Extract author
+            author = getattr(entry, 'author', '')
+            if hasattr(entry, 'authors') and entry.authors:
+                author = ', '.join([a.get('name', '') for a in entry.authors if a.get('name')])
+            article['author'] = author
+
+            # Extract tags
+            tags = []
+            if hasattr(entry, 'tags'):
+                tags = [tag.term for tag in entry.tags if hasattr(tag, 'term')]
+            article['tags'] = tags
+
+            article['fetched_at'] = datetime.now(timezone.utc)
+
+            return article
+
+        except Exception as e:
+            logger.error(f"Error extracting article data: {str(e)}")
+            return None
+
+    def fetch(self, feeds: Iterable[FeedSpec]) -> List[Dict]:
+        """Parse every feed in ``feeds`` and return all articles."""
+        all_articles = []
+
+        for i, feed in enumerate(feeds):
+            if i and self.request_delay:
+                time.sleep(self.request_delay)
+            all_articles.extend(self.parse_feed(feed.url, feed.source, feed.category))
+
+        logger.info(f"Total articles parsed: {len(all_articles)}")
+        return all_articles
@@ -0,0 +1,25 @@
+"""
+Article sinks for the ingestion pipeline.
+"""
+
+from typing import Dict, List
+
+
+class NewsDatabaseSink:
+    """Stores articles in the CLI's SQLite ``NewsDatabase``."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def save(self, articles: List[Dict]) -> List[Dict]:
+        """Insert articles whose link is not stored yet. Returns the inserted articles."""
+        existing = self.db.get_existing_links([article.get('link') for article in articles])
+        new_articles = []
+        for article in articles:
+            if article.get('link') not in existing:
+                existing.add(article.get('link'))
+                new_articles.append(article)
+
+        if new_articles:
+            self.db.bulk_insert_articles(new_articles)
+        return new_articles
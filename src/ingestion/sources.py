@@ -0,0 +1,51 @@
+"""
+Feed sources for the ingestion pipeline.
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+class FeedSpec(NamedTuple):
+    """One RSS feed to fetch."""
+    url: str
+    source: str
+    category: str = 'general'
+
+
+class YamlFeedSource:
+    """Feeds listed in a YAML configuration file (``config/feeds.yaml``)."""
+
+    def __init__(self, config_path: str = "config/feeds.yaml"):
+        self.config_path = config_path
+        self.feeds_config = self._load_config()
+
+    def _load_config(self) -> Dict:
+        """Load RSS feed configuration from YAML file."""
+        try:
+            with open(self.config_path, 'r') as file:
+                return yaml.safe_load(file) or {"sources": {}}
+        except FileNotFoundError:
+            logger.error(f"Configuration file {self.config_path} not found")
+            return {"sources": {}}
+
+    def feeds(self, source: Optional[str] = None) -> List[FeedSpec]:
+        """Return every configured feed, or only those of the source named ``source``."""
+        feeds = []
+        for source_key, source_config in self.feeds_config.get('sources', {}).items():
+            source_name = source_config.get('name', source_key)
+            if source and source_name != source:
+                continue
+            for feed_config in source_config.get('feeds', []):
+                if feed_config.get('url'):
+                    feeds.append(FeedSpec(feed_config['url'], source_name, feed_config.get('category', 'general')))
+        return feeds
+
+    def source_names(self) -> List[str]:
+        """Get list of configured news sources."""
+        sources = self.feeds_config.get('sources', {})
+        return [config.get('name', key) for key, config in sources.items()]
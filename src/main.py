@@ -8,14 +8,18 @@ import argparse
 import logging
 import sys
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from feed_parser import FeedParser
 from database import NewsDatabase
-from classifier import NewsClassifier
+from classifier import build_classifier
+from ingestion import IngestionPipeline, NewsDatabaseSink, YamlFeedSource
+from trends import TrendTracker
+from classification_cache import DEFAULT_CACHE_PATH
+from sentiment import SENTIMENT_BACKENDS, DEFAULT_SENTIMENT_BACKEND
 
 def setup_logging(verbose: bool = False):
     """Set up logging configuration."""
@@ -41,6 +45,13 @@ def main():
     parser.add_argument('--source', '-s', type=str, help='Specific source to fetch (optional)')
     parser.add_argument('--dry-run', action='store_true', help='Parse feeds but don\'t save to database')
     parser.add_argument('--config', '-c', type=str, default='config/feeds.yaml', help='Configuration file path')
+    parser.add_argument('--sentiment-backend', choices=sorted(SENTIMENT_BACKENDS), default=DEFAULT_SENTIMENT_BACKEND,
+                        help=f'Sentiment analysis backend (default: {DEFAULT_SENTIMENT_BACKEND})')
+    parser.add_argument('--no-cache', action='store_true', help='Reclassify every article instead of using the classification cache')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='Classification worker processes (default: 1, in-process)')
+    parser.add_argument('--chunk-size', type=int, default=50, help='Articles sent to a worker at a time (default: 50)')
+    parser.add_argument('--defer-classification', action='store_true',
+                        help='Save articles as pending and leave classification to src/classify_worker.py')
     
     args = parser.parse_args()
     
@@ -53,59 +64,57 @@ def main():
     try:
         # Initialize components
         logger.info("Initializing components...")
-        feed_parser = FeedParser(args.config)
+        feed_source = YamlFeedSource(args.config)
         db = NewsDatabase()
-        classifier = NewsClassifier()
+        classifier_factory = partial(
+            build_classifier,
+            sentiment_backend=args.sentiment_backend,
+            cache_path=None if args.no_cache else DEFAULT_CACHE_PATH
+        )
+        pipeline = IngestionPipeline(
+            feed_source,
+            NewsDatabaseSink(db),
+            classifier_factory,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            defer_classification=args.defer_classification,
+            observers=[TrendTracker()]
+        )
         
-        # Parse RSS feeds
-        logger.info("Parsing RSS feeds...")
-        if args.source:
-            # Parse specific source only
-            source_feeds = feed_parser.get_feed_urls_by_source(args.source)
-            if not source_feeds:
-                logger.error(f"Source '{args.source}' not found in configuration")
-                return 1
-            
-            articles = []
-            for feed_url in source_feeds:
-                feed_articles = feed_parser.parse_feed(feed_url, args.source, 'general')
-                articles.extend(feed_articles)
+        if args.source and not feed_source.feeds(args.source):
+            logger.error(f"Source '{args.source}' not found in configuration")
+            return 1
+        
+        if args.defer_classification:
+            # Articles are saved as pending; classify_worker.py fills in classifications later
+            logger.info("Deferring classification - articles will be saved as pending")
         else:
-            # Parse all configured feeds
-            articles = feed_parser.parse_all_feeds()
+            logger.info(f"Classifying with {args.workers} worker(s), chunks of {args.chunk_size}")
         
-        if not articles:
+        def log_progress(done, total):
+            logger.info(f"Classified {done}/{total} articles")
+        
+        # Fetch, classify and store in one pass
+        logger.info("Parsing RSS feeds...")
+        classified_articles = pipeline.run(args.source, dry_run=args.dry_run, progress=log_progress)
+        stats = pipeline.last_run
+        
+        if not classified_articles:
             logger.warning("No articles found to process")
             return 0
         
-        logger.info(f"Parsed {len(articles)} articles")
-        
-        # Classify articles
-        logger.info("Classifying articles...")
-        classified_articles = []
+        logger.info(f"Parsed {stats['articles']} articles from {stats['feeds']} feeds in {stats['fetch_seconds']:.2f}s")
         
-        for i, article in enumerate(articles):
-            try:
-                # Classify the article
-                classification = classifier.classify_article(article)
-                
-                # Add classification data to article
-                article['classification'] = classification
-                classified_articles.append(article)
-                
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Classified {i + 1}/{len(articles)} articles")
-                    
-            except Exception as e:
-                logger.error(f"Error classifying article '{article.get('title', 'Unknown')}': {e}")
-                # Still add the article without classification
-                classified_articles.append(article)
+        run = stats['classification']
+        if run:
+            logger.info(f"Classified {run['articles']} articles in {run['seconds']:.2f}s "
+                        f"({run['articles_per_second']:.0f} articles/s, {run['errors']} errors, "
+                        f"{run['cache_hits']} cache hits)")
         
-        # Save to database (unless dry run)
+        # Summarise the stored articles (unless dry run)
         if not args.dry_run:
-            logger.info("Saving articles to database...")
-            inserted_count = db.bulk_insert_articles(classified_articles)
-            logger.info(f"Successfully inserted {inserted_count} new articles")
+            logger.info(f"Successfully inserted {stats['new']} new articles in {stats['store_seconds']:.2f}s "
+                        f"({stats['near_duplicates']} near-duplicates of earlier articles)")
             
             # Print summary statistics
             total_articles = db.get_article_count()
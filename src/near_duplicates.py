@@ -0,0 +1,174 @@
+"""
+Near-duplicate article detection with MinHash and locality-sensitive hashing.
+
+Each article's title and description are reduced to a set of word shingles
+and summarised by a MinHash signature (64 x 32-bit values, stored as 256
+bytes). The fraction of positions where two signatures agree estimates the
+Jaccard similarity of the shingle sets.
+
+The signature is split into bands; each band hashes to a 64-bit key stored in
+an index table, so candidate duplicates are the articles sharing at least one
+band key - a handful of indexed lookups regardless of how many articles are
+stored. With 16 bands of 4 rows, pairs above ~0.5 similarity almost always
+share a band while dissimilar pairs rarely do. Candidates are then confirmed
+against ``threshold`` using their signatures.
+
+Storage is left to the caller: ``NearDuplicateIndex`` takes two callbacks, one
+mapping band keys to stored article ids and one loading stored signatures,
+so the SQLite CLI database and the Django ORM share the matching logic.
+"""
+
+import hashlib
+import html
+import re
+import struct
+import zlib
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+Signature = Tuple[int, ...]
+
+
+class StoredSignature(NamedTuple):
+    """What the index needs to know about an already stored article."""
+    signature: Signature
+    published: Optional[datetime]
+    duplicate_of: Optional[int]
+
+
+class MinHasher:
+    """Computes MinHash signatures and their LSH band keys."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 2, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length
+            bands: LSH bands; num_perm must divide evenly into them
+            shingle_size: Words per shingle
+            seed: Seed for the permutation coefficients (changing it invalidates stored signatures)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # Deterministic coefficients so signatures stay comparable across processes and runs
+        self._permutations = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'little') % (MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'little') % MERSENNE_PRIME
+            self._permutations.append((a, b))
+        self._pack_format = f"<{num_perm}I"
+
+    def shingles(self, text: str) -> Set[int]:
+        """32-bit hashes of the word shingles in ``text``."""
+        words = WORD_PATTERN.findall(html.unescape(TAG_PATTERN.sub(' ', text)).lower())
+        n = self.shingle_size
+        if len(words) < n:
+            return {zlib.crc32(' '.join(words).encode())} if words else set()
+        return {zlib.crc32(' '.join(words[i:i + n]).encode()) for i in range(len(words) - n + 1)}
+
+    def signature(self, title: str, description: str = '') -> Optional[Signature]:
+        """MinHash signature of an article, or None when it has too little text to compare."""
+        hashes = self.shingles(f"{title or ''} {description or ''}")
+        if len(hashes) < 3:
+            return None
+        return tuple(
+            min((a * h + b) % MERSENNE_PRIME for h in hashes) & MAX_HASH
+            for a, b in self._permutations
+        )
+
+    def band_keys(self, signature: Signature) -> List[int]:
+        """One signed 64-bit key per band (fits an SQLite INTEGER / BigIntegerField)."""
+        rows = self.rows
+        keys = []
+        for band in range(self.bands):
+            chunk = struct.pack(f"<B{rows}I", band, *signature[band * rows:(band + 1) * rows])
+            keys.append(int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'little', signed=True))
+        return keys
+
+    def pack(self, signature: Signature) -> bytes:
+        return struct.pack(self._pack_format, *signature)
+
+    def unpack(self, data: bytes) -> Signature:
+        return struct.unpack(self._pack_format, bytes(data))
+
+    @staticmethod
+    def similarity(a: Signature, b: Signature) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class NearDuplicateIndex:
+    """Links new articles to the earliest stored article they nearly duplicate."""
+
+    def __init__(self, candidates_for: Callable[[List[int]], Dict[int, Set[int]]],
+                 load: Callable[[Iterable[int]], Dict[int, StoredSignature]],
+                 hasher: Optional[MinHasher] = None, threshold: float = 0.6,
+                 window: timedelta = timedelta(days=3)):
+        """
+        Args:
+            candidates_for: Maps band keys to the stored article ids indexed under each key
+            load: Loads StoredSignatures for article ids
+            hasher: MinHasher used for the stored signatures
+            threshold: Minimum estimated similarity for a link
+            window: Maximum publication gap between duplicates (None for no limit)
+        """
+        self.candidates_for = candidates_for
+        self.load = load
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.window = window
+
+    def match(self, articles: List[Tuple[int, Signature, Optional[datetime]]]) -> Dict[int, Optional[int]]:
+        """
+        Find the canonical article for each new (id, signature, published) entry.
+
+        Entries are matched in order, against stored articles and against earlier
+        entries of the same batch. Returns {id: canonical id or None}.
+        """
+        band_keys = {article_id: self.hasher.band_keys(signature) for article_id, signature, _ in articles}
+        all_keys = sorted({key for keys in band_keys.values() for key in keys})
+        index = {key: set(ids) for key, ids in self.candidates_for(all_keys).items()} if all_keys else {}
+
+        new_ids = {article_id for article_id, _, _ in articles}
+        stored = self.load({i for ids in index.values() for i in ids} - new_ids)
+
+        matches = {}
+        for article_id, signature, published in articles:
+            candidates = {i for key in band_keys[article_id] for i in index.get(key, ())} - {article_id}
+            best, best_similarity = None, self.threshold
+            for candidate in candidates:
+                other = stored.get(candidate)
+                if other is None or not self._within_window(published, other.published):
+                    continue
+                similarity = MinHasher.similarity(signature, other.signature)
+                if similarity >= best_similarity:
+                    best, best_similarity = candidate, similarity
+
+            # Always link to the root of an existing group, never to another duplicate
+            canonical = None
+            if best is not None:
+                canonical = stored[best].duplicate_of or best
+            matches[article_id] = canonical
+
+            # Later articles in the batch can match this one
+            stored[article_id] = StoredSignature(signature, published, canonical)
+            for key in band_keys[article_id]:
+                index.setdefault(key, set()).add(article_id)
+
+        return matches
+
+    def _within_window(self, a: Optional[datetime], b: Optional[datetime]) -> bool:
+        if self.window is None or a is None or b is None:
+            return True
+        return abs(a - b) <= self.window
@@ -13,6 +13,8 @@ import json
 sys.path.append(str(Path(__file__).parent))
 
 from database import NewsDatabase
+from taxonomy import DEFAULT_TAXONOMY_CACHE_DIR, DEFAULT_TAXONOMY_PATH, get_taxonomy_loader
+from trends import TrendTracker
 
 def print_articles(articles, show_full=False, start_index=1):
     """Print articles in a formatted way."""
@@ -28,21 +30,59 @@ def print_articles(articles, show_full=False, start_index=1):
         print(f"Published: {article.get('published', 'N/A')}")
         print(f"Link: {article['link']}")
         
+        if article.get('snippet'):
+            print(f"Match: {article['snippet']}")
+        
         if show_full and article.get('description'):
             print(f"Description: {article['description'][:200]}...")
     
     print(f"\nShowing {len(articles)} articles")
 
+def print_trending(args):
+    """Print emerging phrases from the trend detector updated by main.py."""
+    detector = TrendTracker().load()
+    if not detector.buckets:
+        print("No trend data yet - run src/main.py to ingest articles.")
+        return
+    
+    # Phrases that are already taxonomy keywords are not new topics
+    known = get_taxonomy_loader(DEFAULT_TAXONOMY_PATH, DEFAULT_TAXONOMY_CACHE_DIR).get().keywords
+    trending = detector.trending(limit=args.limit, min_count=args.min_count, exclude=known)
+    
+    print(f"=== Trending Phrases (last {detector.recent_hours:.0f}h vs previous {detector.baseline_hours:.0f}h) ===")
+    if not trending:
+        print("No emerging phrases found.")
+        return
+    
+    print(f"{'Phrase':<40} {'Count':>6} {'Expected':>9} {'Score':>7}")
+    for trend in trending:
+        print(f"{trend['phrase'][:40]:<40} {trend['count']:>6} {trend['expected']:>9.1f} {trend['score']:>7.1f}")
+
 def interactive_browse(db, args):
     """Interactive browsing mode with pagination."""
     page_size = args.limit
     current_page = args.page
     source_filter = args.source
     category_filter = args.category
+    topic_filter = args.topic
+    geo_filter = args.geo
+    
+    # Next/previous pages continue from the (published, id) of the page shown;
+    # only jumps with 'g' (or --page) fall back to OFFSET
+    page_cursor = None
+    counted_filters = None
     
     while True:
-        # Calculate offset
-        offset = (current_page - 1) * page_size
+        if current_page == 1:
+            page_cursor = None
+        
+        offset = 0
+        after = before = None
+        if page_cursor:
+            direction, key = page_cursor
+            after, before = (key, None) if direction == 'after' else (None, key)
+        else:
+            offset = (current_page - 1) * page_size
         
         # Get articles for current page
         since = datetime.now() - timedelta(hours=args.hours) if args.hours and args.hours > 0 else None
@@ -51,12 +91,22 @@ def interactive_browse(db, args):
             offset=offset,
             source=source_filter,
             category=category_filter,
-            since=since
+            since=since,
+            topic=topic_filter,
+            geography=geo_filter,
+            min_confidence=args.min_confidence,
+            after=after,
+            before=before
         )
         
-        # Get total count for pagination info
-        total_articles = db.get_article_count(source_filter)
-        total_pages = (total_articles + page_size - 1) // page_size
+        # Count once per set of filters; the total is approximate while paging
+        filters_key = (source_filter, category_filter, topic_filter, geo_filter)
+        if filters_key != counted_filters:
+            total_articles = db.get_article_count(
+                source_filter, topic_filter, geo_filter, args.min_confidence, category_filter, since
+            )
+            counted_filters = filters_key
+        total_pages = max(1, (total_articles + page_size - 1) // page_size)
         
         # Clear screen (works on most terminals)
         print("\033[2J\033[H")
@@ -71,18 +121,22 @@ def interactive_browse(db, args):
             filters.append(f"Source: {source_filter}")
         if category_filter:
             filters.append(f"Category: {category_filter}")
+        if topic_filter:
+            filters.append(f"Topic: {topic_filter}")
+        if geo_filter:
+            filters.append(f"Geography: {geo_filter}")
         if args.hours:
             filters.append(f"Last {args.hours} hours")
             
         if filters:
             print(f"Filters: {' | '.join(filters)}")
         
-        print(f"Page {current_page} of {total_pages} ({total_articles} total articles)")
+        print(f"Page {current_page} of about {total_pages} (~{total_articles} total articles)")
         print("-" * 60)
         
         # Print articles
         if articles:
-            start_index = offset + 1
+            start_index = (current_page - 1) * page_size + 1
             print_articles(articles, args.full, start_index)
         else:
             print("No articles found on this page.")
@@ -92,12 +146,14 @@ def interactive_browse(db, args):
         print("Navigation:")
         if current_page > 1:
             print("  [p] Previous page")
-        if current_page < total_pages:
+        if len(articles) == page_size:
             print("  [n] Next page")
         print("  [g] Go to page number")
         print("  [f] Toggle full details")
         print("  [s] Filter by source")
         print("  [c] Filter by category") 
+        print("  [t] Filter by topic")
+        print("  [l] Filter by geography")
         print("  [r] Reset filters")
         print("  [h] Show help")
         print("  [q] Quit")
@@ -108,15 +164,18 @@ def interactive_browse(db, args):
             
             if choice == 'q':
                 break
-            elif choice == 'n' and current_page < total_pages:
+            elif choice == 'n' and len(articles) == page_size:
+                page_cursor = ('after', (articles[-1]['published'], articles[-1]['id']))
                 current_page += 1
             elif choice == 'p' and current_page > 1:
+                page_cursor = ('before', (articles[0]['published'], articles[0]['id'])) if articles else None
                 current_page -= 1
             elif choice == 'g':
                 try:
                     page_num = int(input(f"Go to page (1-{total_pages}): "))
                     if 1 <= page_num <= total_pages:
                         current_page = page_num
+                        page_cursor = None
                     else:
                         print(f"Invalid page number. Please enter 1-{total_pages}")
                         input("Press Enter to continue...")
@@ -167,9 +226,34 @@ def interactive_browse(db, args):
                 except ValueError:
                     print("Invalid choice")
                     input("Press Enter to continue...")
+            elif choice in ('t', 'l'):
+                options = db.get_topics() if choice == 't' else db.get_geographies()
+                label = 'topic' if choice == 't' else 'geography'
+                print(f"Available {label} filters:")
+                for i, option in enumerate(options, 1):
+                    print(f"  {i}. {option}")
+                print(f"  {len(options)+1}. Clear filter")
+                
+                try:
+                    option_choice = int(input(f"Select {label} number: ")) - 1
+                    if 0 <= option_choice <= len(options):
+                        selected = options[option_choice] if option_choice < len(options) else None
+                        if choice == 't':
+                            topic_filter = selected
+                        else:
+                            geo_filter = selected
+                        current_page = 1
+                    else:
+                        print("Invalid choice")
+                        input("Press Enter to continue...")
+                except ValueError:
+                    print("Invalid choice")
+                    input("Press Enter to continue...")
             elif choice == 'r':
                 source_filter = None
                 category_filter = None
+                topic_filter = None
+                geo_filter = None
                 current_page = 1
             elif choice == 'h':
                 print("\nHelp:")
@@ -177,6 +261,7 @@ def interactive_browse(db, args):
                 print("  Use 'g' to jump to a specific page")
                 print("  Use 'f' to toggle between summary and full article details")
                 print("  Use 's' and 'c' to filter by source or category")
+                print("  Use 't' and 'l' to filter by classified topic or geography")
                 print("  Use 'r' to reset all filters")
                 print("  Use 'q' to quit the browser")
                 input("\nPress Enter to continue...")
@@ -197,6 +282,10 @@ def main():
     parser = argparse.ArgumentParser(description='Query News Database')
     parser.add_argument('--source', '-s', type=str, help='Filter by source')
     parser.add_argument('--category', '-c', type=str, help='Filter by category')
+    parser.add_argument('--topic', '-t', type=str, help='Filter by classified topic (e.g. "Central Banking")')
+    parser.add_argument('--geo', '-g', type=str, help='Filter by classified geography (e.g. "China")')
+    parser.add_argument('--min-confidence', type=float, default=0.0,
+                        help='Minimum classification confidence for --topic/--geo (default: 0.0)')
     parser.add_argument('--hours', type=int, default=24, help='Articles from last N hours (default: 24)')
     parser.add_argument('--limit', '-l', type=int, default=10, help='Number of articles to show (default: 10)')
     parser.add_argument('--full', '-f', action='store_true', help='Show full article details')
@@ -204,7 +293,13 @@ def main():
     parser.add_argument('--sources', action='store_true', help='List all sources')
     parser.add_argument('--browse', '-b', action='store_true', help='Interactive browse mode')
     parser.add_argument('--page', '-p', type=int, default=1, help='Page number (for browsing)')
-    parser.add_argument('--search', type=str, help='Search articles by keywords in title/description')
+    parser.add_argument('--search', type=str,
+                        help='Full-text search, ranked by relevance ("exact phrase", prefix*, AND/OR/NOT)')
+    parser.add_argument('--rebuild-search-index', action='store_true',
+                        help='Re-index all articles for --search')
+    parser.add_argument('--trending', action='store_true', help='Show emerging phrases from recent ingestion')
+    parser.add_argument('--min-count', type=int, default=3,
+                        help='Minimum recent article count for --trending phrases (default: 3)')
     
     args = parser.parse_args()
     
@@ -237,6 +332,15 @@ def main():
                 print(f"  - {source}")
             return 0
         
+        if args.trending:
+            print_trending(args)
+            return 0
+        
+        if args.rebuild_search_index:
+            count = db.rebuild_search_index()
+            print(f"Search index rebuilt for {count} articles")
+            return 0
+        
         if args.browse:
             # Interactive browse mode
             return interactive_browse(db, args)
@@ -245,7 +349,9 @@ def main():
             # Search articles
             print(f"=== Search Results for: '{args.search}' ===")
             offset = (args.page - 1) * args.limit
-            articles = db.search_articles(args.search, args.limit, offset)
+            # Bold matches on a terminal, brackets when piped
+            highlight = ('\033[1m', '\033[0m') if sys.stdout.isatty() else ('[', ']')
+            articles = db.search_articles(args.search, args.limit, offset, highlight)
             
             if articles:
                 print_articles(articles, args.full, offset + 1)
@@ -265,7 +371,10 @@ def main():
             limit=args.limit,
             source=args.source,
             category=args.category,
-            since=since
+            since=since,
+            topic=args.topic,
+            geography=args.geo,
+            min_confidence=args.min_confidence
         )
         
         print(f"=== Recent Articles ===")
@@ -273,12 +382,18 @@ def main():
             print(f"Source: {args.source}")
         if args.category:
             print(f"Category: {args.category}")
+        if args.topic:
+            print(f"Topic: {args.topic}")
+        if args.geo:
+            print(f"Geography: {args.geo}")
+        if args.min_confidence:
+            print(f"Min confidence: {args.min_confidence}")
         if args.hours:
             print(f"Last {args.hours} hours")
         
         # Show pagination info if using pagination
         if args.page > 1 or len(articles) == args.limit:
-            total_articles = db.get_article_count(args.source)
+            total_articles = db.get_article_count(args.source, args.topic, args.geo, args.min_confidence)
             total_pages = (total_articles + args.limit - 1) // args.limit
             print(f"\nPage {args.page} of {total_pages} (Total: {total_articles} articles)")
             if args.page < total_pages:
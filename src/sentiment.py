@@ -0,0 +1,289 @@
+"""
+Sentiment analysis backends used by the article classifiers.
+
+The ``lexicon`` backend compiles the pattern/TextBlob subjectivity lexicon
+(``en-sentiment.xml``) into a flat dictionary once per process and scores
+token lists directly, so classification no longer builds a ``TextBlob`` (and
+imports NLTK) for every article. The ``textblob`` backend is kept so the two
+can be compared with ``python src/benchmark_sentiment.py``.
+"""
+
+import importlib.util
+import logging
+import re
+import time
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Words that flip the polarity of the next known word ("not good")
+NEGATIONS = frozenset(['no', 'not', "n't", 'never'])
+
+# Contractions are split off the preceding word before tokenizing
+CONTRACTION_RE = re.compile(r"(n't|'d|'m|'s|'ll|'re|'ve)\b")
+TOKEN_RE = re.compile(r"n't|'[a-z]+|[a-z0-9]+(?:[-'&][a-z0-9]+)*|!")
+
+# Entry layout in the compiled lexicon: (polarity, subjectivity, intensity, is_modifier)
+LexiconEntry = Tuple[float, float, float, bool]
+
+_compiled_lexicons: Dict[str, Dict[str, LexiconEntry]] = {}
+
+
+def sentiment_label(polarity: float) -> str:
+    """Map a polarity score onto the positive/negative/neutral labels."""
+    if polarity > 0.1:
+        return 'positive'
+    if polarity < -0.1:
+        return 'negative'
+    return 'neutral'
+
+
+def default_lexicon_path() -> Optional[Path]:
+    """Locate the lexicon bundled with TextBlob without importing it."""
+    spec = importlib.util.find_spec('textblob')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+
+    for location in spec.submodule_search_locations:
+        path = Path(location) / 'en' / 'en-sentiment.xml'
+        if path.exists():
+            return path
+    return None
+
+
+def _average(values: Iterable[Tuple[float, float, float]]) -> List[float]:
+    """Average (polarity, subjectivity, intensity) triples column-wise."""
+    values = list(values)
+    return [sum(column) / len(values) for column in zip(*values)]
+
+
+def compile_lexicon(path: Path) -> Dict[str, LexiconEntry]:
+    """
+    Compile the sentiment XML into a word -> entry dictionary.
+
+    Scores are averaged across senses and part-of-speech tags the same way
+    pattern does, and adjectives get a derived ``-ly`` adverb entry.
+    """
+    senses: Dict[str, Dict[str, List[Tuple[float, float, float]]]] = {}
+
+    root = ElementTree.parse(str(path)).getroot()
+    for node in root.findall('word'):
+        form = node.attrib.get('form')
+        if not form:
+            continue
+        senses.setdefault(form, {}).setdefault(node.attrib.get('pos'), []).append((
+            float(node.attrib.get('polarity', 0.0)),
+            float(node.attrib.get('subjectivity', 0.0)),
+            float(node.attrib.get('intensity', 1.0)),
+        ))
+
+    lexicon: Dict[str, LexiconEntry] = {}
+    adjectives: Dict[str, List[float]] = {}
+
+    for form, by_pos in senses.items():
+        per_pos = {pos: _average(scores) for pos, scores in by_pos.items()}
+        p, s, i = _average(per_pos.values())
+        lexicon[form] = (p, s, i, 'RB' in per_pos)
+        if 'JJ' in per_pos:
+            adjectives[form] = per_pos['JJ']
+
+    # Map "terrible" to the adverb "terribly", as pattern does
+    for form, (p, s, i) in adjectives.items():
+        if form.endswith('y'):
+            form = form[:-1] + 'i'
+        if form.endswith('le'):
+            form = form[:-2]
+        lexicon[form + 'ly'] = (p, s, i, True)
+
+    return lexicon
+
+
+def load_lexicon(path: Optional[Path] = None) -> Dict[str, LexiconEntry]:
+    """Return the compiled lexicon for ``path``, compiling it once per process."""
+    path = Path(path) if path else default_lexicon_path()
+    if path is None:
+        raise FileNotFoundError(
+            "Sentiment lexicon not found; install textblob or pass lexicon_path"
+        )
+
+    key = str(path.resolve())
+    if key not in _compiled_lexicons:
+        started = time.perf_counter()
+        _compiled_lexicons[key] = compile_lexicon(path)
+        logger.debug(
+            f"Compiled sentiment lexicon {path} ({len(_compiled_lexicons[key])} words) "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+    return _compiled_lexicons[key]
+
+
+class LexiconSentimentAnalyzer:
+    """Pattern-compatible lexicon scorer working on pre-tokenized text."""
+
+    name = 'lexicon'
+
+    def __init__(self, lexicon_path: Optional[Path] = None):
+        self.lexicon = load_lexicon(lexicon_path)
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """Lowercase and split text into words, contractions and exclamation marks."""
+        text = CONTRACTION_RE.sub(r' \1', text.lower().replace('’', "'"))
+        return TOKEN_RE.findall(text)
+
+    def score_tokens(self, tokens: List[str]) -> Tuple[float, float]:
+        """
+        Score a token list, returning (polarity, subjectivity).
+
+        Known words are averaged; a preceding modifier ("very") scales the
+        next known word by its intensity, a preceding negation ("not") halves
+        and flips its polarity, and "!" boosts the previous assessment.
+        Unlike TextBlob, "n't" contractions are recognised as negations.
+        """
+        lexicon = self.lexicon
+        assessments = []  # [polarity, subjectivity, intensity, negated]
+        modifier = None
+        negation = None
+
+        for word in tokens:
+            entry = lexicon.get(word)
+            if entry is not None:
+                p, s, i, is_modifier = entry
+                if modifier is None:
+                    assessments.append([p, s, i, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(p * last[2], 1.0))
+                    last[1] = max(-1.0, min(s * last[2], 1.0))
+                    last[2] = i
+                if negation is not None:
+                    last = assessments[-1]
+                    last[2] = 1.0 / last[2] if last[2] else last[2]
+                    last[3] = True
+
+                modifier = word if is_modifier else None
+                negation = word if word in NEGATIONS else None
+            else:
+                if word in NEGATIONS:
+                    negation = word
+                elif negation and len(word.strip("'")) > 1:
+                    # Retain negation across small words ("not a good")
+                    negation = None
+
+                if negation is not None and modifier is not None and modifier.endswith('ly'):
+                    # "really not good"
+                    assessments[-1][3] = True
+                    negation = None
+                elif modifier and len(word) > 2:
+                    # Retain modifier across small words ("really is a good")
+                    modifier = None
+
+                if word == '!' and assessments:
+                    assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+
+        if not assessments:
+            return 0.0, 0.0
+
+        polarity = sum(-0.5 * p if negated else p for p, _, _, negated in assessments)
+        subjectivity = sum(s for _, s, _, _ in assessments)
+        return polarity / len(assessments), subjectivity / len(assessments)
+
+    def analyze(self, text: str) -> Tuple[float, float]:
+        """Return (polarity, subjectivity) for a single text."""
+        return self.score_tokens(self.tokenize(text))
+
+    def analyze_batch(self, texts: List[str]) -> List[Tuple[float, float]]:
+        """Score many texts, reusing results for identical inputs."""
+        seen: Dict[str, Tuple[float, float]] = {}
+        results = []
+        for text in texts:
+            if text not in seen:
+                seen[text] = self.score_tokens(self.tokenize(text))
+            results.append(seen[text])
+        return results
+
+
+class TextBlobSentimentAnalyzer:
+    """Reference backend delegating to TextBlob's pattern analyzer."""
+
+    name = 'textblob'
+
+    def __init__(self):
+        from textblob import TextBlob
+        self._textblob = TextBlob
+
+    def analyze(self, text: str) -> Tuple[float, float]:
+        """Return (polarity, subjectivity) for a single text."""
+        sentiment = self._textblob(text).sentiment
+        return sentiment.polarity, sentiment.subjectivity
+
+    def analyze_batch(self, texts: List[str]) -> List[Tuple[float, float]]:
+        """Score many texts one TextBlob at a time."""
+        return [self.analyze(text) for text in texts]
+
+
+SENTIMENT_BACKENDS = {
+    LexiconSentimentAnalyzer.name: LexiconSentimentAnalyzer,
+    TextBlobSentimentAnalyzer.name: TextBlobSentimentAnalyzer,
+}
+
+DEFAULT_SENTIMENT_BACKEND = LexiconSentimentAnalyzer.name
+
+_analyzers: Dict[str, object] = {}
+
+
+def get_sentiment_analyzer(backend: Optional[str] = None):
+    """Return a shared analyzer instance for the named backend."""
+    backend = backend or DEFAULT_SENTIMENT_BACKEND
+    if backend not in SENTIMENT_BACKENDS:
+        raise ValueError(
+            f"Unknown sentiment backend '{backend}' "
+            f"(choose from {', '.join(sorted(SENTIMENT_BACKENDS))})"
+        )
+    if backend not in _analyzers:
+        _analyzers[backend] = SENTIMENT_BACKENDS[backend]()
+    return _analyzers[backend]
+
+
+def compare_backends(texts: List[str], reference: str = 'textblob',
+                     candidate: str = 'lexicon') -> Dict:
+    """
+    Score ``texts`` with two backends and report agreement and throughput.
+
+    Returns a dict with label agreement, polarity error statistics and
+    texts/second for each backend.
+    """
+    report = {'count': len(texts), 'backends': {}}
+    scores = {}
+
+    for backend in (reference, candidate):
+        analyzer = get_sentiment_analyzer(backend)
+        started = time.perf_counter()
+        scores[backend] = analyzer.analyze_batch(texts)
+        elapsed = time.perf_counter() - started
+        report['backends'][backend] = {
+            'seconds': elapsed,
+            'texts_per_second': len(texts) / elapsed if elapsed else float('inf'),
+        }
+
+    if not texts:
+        return report
+
+    pairs = list(zip(scores[reference], scores[candidate]))
+    label_matches = sum(
+        1 for (ref_p, _), (cand_p, _) in pairs
+        if sentiment_label(ref_p) == sentiment_label(cand_p)
+    )
+    polarity_errors = [abs(ref_p - cand_p) for (ref_p, _), (cand_p, _) in pairs]
+    subjectivity_errors = [abs(ref_s - cand_s) for (_, ref_s), (_, cand_s) in pairs]
+
+    report.update({
+        'label_agreement': label_matches / len(pairs),
+        'exact_polarity_matches': sum(1 for e in polarity_errors if e < 1e-9) / len(pairs),
+        'mean_polarity_error': sum(polarity_errors) / len(pairs),
+        'max_polarity_error': max(polarity_errors),
+        'mean_subjectivity_error': sum(subjectivity_errors) / len(pairs),
+    })
+    return report
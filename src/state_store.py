@@ -0,0 +1,72 @@
+"""
+Pickled state files for incremental ingestion observers (trends, story clusters).
+
+Overlapping fetch runs (cron and the Sync page) update the same files, so
+read-modify-write cycles go through ``update_state``, which holds an exclusive
+lock on a ``.lock`` file next to the state for the whole cycle.
+"""
+
+import logging
+import os
+import pickle
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows: updates are not serialised
+    fcntl = None
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+def load_state(path: str, factory: Callable[[], T]) -> T:
+    """Return the object pickled at ``path``, or ``factory()`` if there is none (or it is unreadable)."""
+    path = Path(path)
+    if path.exists():
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Starting new state; could not read {path}: {e}")
+    return factory()
+
+
+def save_state(path: str, state) -> None:
+    """Pickle ``state`` to ``path`` atomically (write then rename)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, path)
+
+
+@contextmanager
+def state_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on the state at ``path``, blocking until it is free."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + '.lock'), 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def update_state(path: str, factory: Callable[[], T]) -> Iterator[T]:
+    """
+    Load the state at ``path`` (see ``load_state``) under ``state_lock`` and
+    save it when the block completes; nothing is saved if the block raises.
+    """
+    with state_lock(path):
+        state = load_state(path, factory)
+        yield state
+        save_state(path, state)
@@ -0,0 +1,177 @@
+"""
+Incremental story clustering for suggesting storygroups.
+
+Each new article's term vector (see text_vectors.py) is compared with the
+centroids of the clusters active within ``window_hours``. Only clusters that
+share a term with the article are scored, found through an inverted index
+from centroid terms to clusters. The article joins the most similar cluster
+at or above ``threshold``, or opens a new one. Centroids are truncated to
+their strongest terms and idle clusters expire, so the state stays small and
+each fetch run only does work for its own articles.
+"""
+
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+
+from state_store import load_state, save_state, update_state
+from text_vectors import TermVector, TermVectorizer
+
+DEFAULT_STORY_CLUSTERS_PATH = "data/story_clusters.pickle"
+
+
+class StoryCluster:
+    """One story: a truncated centroid plus its most recent member article ids."""
+
+    def __init__(self, cluster_id: int, label: str, seen_at: float, max_members: int):
+        self.id = cluster_id
+        self.label = label
+        self.centroid: Dict[str, float] = {}
+        self.norm = 0.0
+        self.size = 0
+        self.first_seen = seen_at
+        self.last_seen = seen_at
+        self.members = deque(maxlen=max_members)
+
+    def similarity(self, vector: TermVector) -> float:
+        """Cosine similarity between ``vector`` and the centroid."""
+        if not self.norm:
+            return 0.0
+        centroid = self.centroid
+        return sum(weight * centroid[term] for term, weight in vector.items() if term in centroid) / self.norm
+
+
+class StoryClusterer:
+    """Assigns articles to story clusters one at a time."""
+
+    def __init__(self, threshold: float = 0.35, window_hours: float = 72, centroid_terms: int = 40,
+                 max_members: int = 50, vectorizer: Optional[TermVectorizer] = None):
+        """
+        Args:
+            threshold: Minimum cosine similarity to join an existing cluster
+            window_hours: Clusters with no new article for this long are retired
+            centroid_terms: Terms kept per centroid
+            max_members: Member article ids remembered per cluster
+            vectorizer: Term vectorizer (its document frequencies persist with the clusterer)
+        """
+        self.threshold = threshold
+        self.window_seconds = window_hours * 3600
+        self.centroid_terms = centroid_terms
+        self.max_members = max_members
+        self.vectorizer = vectorizer or TermVectorizer()
+        self.clusters: Dict[int, StoryCluster] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.next_id = 1
+
+    def assign(self, article_id: int, title: str, description: str = '',
+               published: Optional[datetime] = None, now: Optional[float] = None) -> Optional[StoryCluster]:
+        """Add an article to its best matching active cluster (or a new one) and return the cluster."""
+        now = now if now is not None else time.time()
+        seen_at = min(published.timestamp(), now) if isinstance(published, datetime) else now
+
+        vector = self.vectorizer.vectorize(title, description)
+        if vector is None:
+            return None
+
+        best, best_similarity = None, self.threshold
+        for cluster_id in {i for term in vector for i in self.postings.get(term, ())}:
+            cluster = self.clusters[cluster_id]
+            if seen_at - cluster.last_seen > self.window_seconds:
+                continue
+            similarity = cluster.similarity(vector)
+            if similarity >= best_similarity:
+                best, best_similarity = cluster, similarity
+
+        if best is None:
+            best = StoryCluster(self.next_id, self._label(vector, title), seen_at, self.max_members)
+            self.clusters[best.id] = best
+            self.next_id += 1
+
+        self._add(best, vector)
+        best.size += 1
+        best.last_seen = max(best.last_seen, seen_at)
+        best.members.append(article_id)
+        return best
+
+    def _add(self, cluster: StoryCluster, vector: TermVector):
+        """Fold a vector into the centroid, keep its strongest terms and update the postings."""
+        before = set(cluster.centroid)
+        centroid = dict(cluster.centroid)
+        for term, weight in vector.items():
+            centroid[term] = centroid.get(term, 0.0) + weight
+        if len(centroid) > self.centroid_terms:
+            centroid = dict(sorted(centroid.items(), key=lambda x: x[1], reverse=True)[:self.centroid_terms])
+
+        cluster.centroid = centroid
+        cluster.norm = sum(weight * weight for weight in centroid.values()) ** 0.5
+
+        after = set(centroid)
+        for term in before - after:
+            self._unpost(term, cluster.id)
+        for term in after - before:
+            self.postings.setdefault(term, set()).add(cluster.id)
+
+    def _unpost(self, term: str, cluster_id: int):
+        clusters = self.postings.get(term)
+        if clusters is not None:
+            clusters.discard(cluster_id)
+            if not clusters:
+                del self.postings[term]
+
+    def _label(self, vector: TermVector, title: str) -> str:
+        """Storygroup suggestion: the opening article's three strongest terms, in title order."""
+        terms = [term for term, _ in sorted(vector.items(), key=lambda x: x[1], reverse=True)[:3]]
+        order = {word: i for i, word in reversed(list(enumerate(self.vectorizer.words(title))))}
+        terms.sort(key=lambda term: order.get(term, len(order)))
+        return ' '.join(term.title() for term in terms)
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Retire clusters idle for longer than the window. Returns the number retired."""
+        now = now if now is not None else time.time()
+        expired = [c for c in self.clusters.values() if now - c.last_seen > self.window_seconds]
+        for cluster in expired:
+            for term in cluster.centroid:
+                self._unpost(term, cluster.id)
+            del self.clusters[cluster.id]
+        return len(expired)
+
+
+class StoryClusterTracker:
+    """Keeps a StoryClusterer on disk between fetch runs."""
+
+    def __init__(self, path: str = DEFAULT_STORY_CLUSTERS_PATH, **clusterer_options):
+        """
+        Args:
+            path: Pickle file holding the clusterer state
+            clusterer_options: StoryClusterer arguments used when no state exists yet
+        """
+        self.path = path
+        self.clusterer_options = clusterer_options
+
+    def load(self) -> StoryClusterer:
+        return load_state(self.path, lambda: StoryClusterer(**self.clusterer_options))
+
+    def save(self, clusterer: StoryClusterer):
+        save_state(self.path, clusterer)
+
+    def assign(self, articles: Iterable[Dict]) -> Dict[int, StoryCluster]:
+        """
+        Cluster new articles (dicts with id, title, description, published) in order
+        and persist the state. Returns {article id: cluster}.
+        """
+        assigned = {}
+        # Locked so that overlapping fetch runs do not lose each other's updates
+        with update_state(self.path, lambda: StoryClusterer(**self.clusterer_options)) as clusterer:
+            now = time.time()
+            clusterer.expire(now)
+
+            for article in articles:
+                cluster = clusterer.assign(
+                    article['id'], article.get('title', ''), article.get('description', ''),
+                    article.get('published'), now
+                )
+                if cluster is not None:
+                    assigned[article['id']] = cluster
+
+        return assigned
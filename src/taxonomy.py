@@ -0,0 +1,232 @@
+"""
+Classification taxonomy loaded from ``config/taxonomy.yaml``.
+
+The YAML file holds the topic and geography keyword tables used by both the
+CLI classifier and the Django aggregator. It is compiled into a
+``CompiledTaxonomy`` - a de-duplicated keyword list with postings back to
+every topic/geography that uses the keyword - which is pickled next to the
+classification cache under the SHA-1 of the YAML bytes, so processes that
+start with an unchanged file skip parsing and compiling.
+
+``TaxonomyLoader`` re-checks the file's mtime at most every
+``check_interval`` seconds, so long-running workers pick up edits without a
+restart. A file that fails to load keeps the previous taxonomy in place.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+DEFAULT_TAXONOMY_PATH = "config/taxonomy.yaml"
+DEFAULT_TAXONOMY_CACHE_DIR = "data"
+
+# Bump when CompiledTaxonomy's pickled layout changes
+COMPILED_FORMAT = 1
+
+# Per-section scoring: (confidence multiplier, weight for multi-word keywords)
+SECTION_SCORING = {
+    'topics': (2, 2),
+    'geographies': (3, 1),
+}
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyError(ValueError):
+    """Raised when a taxonomy file is malformed."""
+
+
+def load_taxonomy_file(path: str) -> Tuple[Dict, str]:
+    """Read and validate a taxonomy YAML file, returning (taxonomy, content hash)."""
+    raw = Path(path).read_bytes()
+    return parse_taxonomy(raw), hashlib.sha1(raw).hexdigest()
+
+
+def parse_taxonomy(raw: bytes) -> Dict:
+    """Parse taxonomy YAML, checking every section maps names to entries with a keyword list."""
+    try:
+        taxonomy = yaml.safe_load(raw) or {}
+    except yaml.YAMLError as e:
+        raise TaxonomyError(f"Invalid taxonomy YAML: {e}") from e
+
+    for section in SECTION_SCORING:
+        entries = taxonomy.setdefault(section, {})
+        if not isinstance(entries, dict):
+            raise TaxonomyError(f"'{section}' must map names to entries")
+        for name, entry in entries.items():
+            entry = entries[name] = entry or {}
+            keywords = entry.setdefault('keywords', [])
+            if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+                raise TaxonomyError(f"{section}.{name}.keywords must be a list of strings")
+            entry['keywords'] = [k.lower() for k in keywords]
+
+    return taxonomy
+
+
+class CompiledTaxonomy:
+    """Keyword matcher compiled from a taxonomy; picklable so it can be cached on disk."""
+
+    def __init__(self, taxonomy: Dict, content_hash: str):
+        self.content_hash = content_hash
+        self.topics = {name: _metadata(entry) for name, entry in taxonomy['topics'].items()}
+        self.geographies = {name: _metadata(entry) for name, entry in taxonomy['geographies'].items()}
+        self.keyword_tables = {
+            section: {name: entry['keywords'] for name, entry in taxonomy[section].items()}
+            for section in SECTION_SCORING
+        }
+
+        # Each distinct keyword is tested once and credits every entry that lists it;
+        # entries are numbered in file order, which breaks confidence ties
+        self.entries: List[Tuple[str, str, int]] = []
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for section, (_, phrase_weight) in SECTION_SCORING.items():
+            for name, keywords in self.keyword_tables[section].items():
+                entry = len(self.entries)
+                self.entries.append((section, name, len(keywords)))
+                for keyword in keywords:
+                    weight = phrase_weight if len(keyword.split()) > 1 else 1
+                    postings.setdefault(keyword, []).append((entry, weight))
+
+        self.keywords = tuple(postings)
+        self.postings = postings
+
+    def match(self, text: str) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Score lowercase ``text`` against every section.
+
+        Returns {'topics': [(name, confidence)], 'geographies': [...]}, each sorted
+        by descending confidence.
+        """
+        scores: Dict[int, int] = {}
+        postings = self.postings
+        for keyword in [keyword for keyword in self.keywords if keyword in text]:
+            for entry, weight in postings[keyword]:
+                scores[entry] = scores.get(entry, 0) + weight
+
+        results = {section: [] for section in SECTION_SCORING}
+        for entry in sorted(scores):
+            section, name, keyword_count = self.entries[entry]
+            confidence = min(scores[entry] / keyword_count * SECTION_SCORING[section][0], 1.0)
+            results[section].append((name, confidence))
+
+        for matches in results.values():
+            matches.sort(key=lambda x: x[1], reverse=True)
+        return results
+
+    def topic_hierarchy(self) -> Dict[str, List[str]]:
+        """Map each parent topic to its child topic names."""
+        hierarchy: Dict[str, List[str]] = {}
+        for name, metadata in self.topics.items():
+            if metadata.get('parent'):
+                hierarchy.setdefault(metadata['parent'], []).append(name)
+        return hierarchy
+
+
+def _metadata(entry: Dict) -> Dict:
+    """Entry fields other than keywords (parent, description, country_code, ...)."""
+    return {key: value for key, value in entry.items() if key != 'keywords'}
+
+
+def compile_taxonomy(path: str, cache_dir: Optional[str] = None) -> CompiledTaxonomy:
+    """Compile the taxonomy at ``path``, reusing a pickled copy for unchanged content."""
+    raw = Path(path).read_bytes()
+    content_hash = hashlib.sha1(raw).hexdigest()
+
+    cache_file = None
+    if cache_dir:
+        cache_file = Path(cache_dir) / f"taxonomy-{COMPILED_FORMAT}-{content_hash[:16]}.pickle"
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    compiled = pickle.load(f)
+                if compiled.content_hash == content_hash:
+                    return compiled
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable compiled taxonomy {cache_file}: {e}")
+
+    compiled = CompiledTaxonomy(parse_taxonomy(raw), content_hash)
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never read a partial pickle
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not cache compiled taxonomy in {cache_dir}: {e}")
+
+    return compiled
+
+
+class TaxonomyLoader:
+    """Serves the current compiled taxonomy and reloads it when the file changes."""
+
+    def __init__(self, path: str = DEFAULT_TAXONOMY_PATH, cache_dir: Optional[str] = DEFAULT_TAXONOMY_CACHE_DIR,
+                 check_interval: float = 5.0):
+        """
+        Args:
+            path: Taxonomy YAML file
+            cache_dir: Directory for compiled taxonomy pickles (None disables)
+            check_interval: Minimum seconds between mtime checks
+        """
+        self.path = str(path)
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature = self._stat()
+        self._checked_at = time.monotonic()
+        self._compiled = compile_taxonomy(self.path, self.cache_dir)
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self) -> CompiledTaxonomy:
+        """Return the compiled taxonomy, reloading it first if the file has changed."""
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self.reload()
+        return self._compiled
+
+    def reload(self, force: bool = False) -> bool:
+        """Recompile if the file changed (or ``force``). Returns True when the taxonomy changed."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                signature = self._stat()
+                if signature == self._signature and not force:
+                    return False
+
+                # Remember the signature even if loading fails, so a bad edit is reported once
+                self._signature = signature
+                compiled = compile_taxonomy(self.path, self.cache_dir)
+            except (OSError, TaxonomyError) as e:
+                logger.error(f"Keeping previous taxonomy; failed to reload {self.path}: {e}")
+                return False
+
+            if compiled.content_hash == self._compiled.content_hash:
+                return False
+
+            logger.info(f"Reloaded taxonomy {self.path} ({compiled.content_hash[:12]})")
+            self._compiled = compiled
+            return True
+
+
+_loaders: Dict[Tuple[str, Optional[str]], TaxonomyLoader] = {}
+
+
+def get_taxonomy_loader(path: str = DEFAULT_TAXONOMY_PATH,
+                        cache_dir: Optional[str] = DEFAULT_TAXONOMY_CACHE_DIR) -> TaxonomyLoader:
+    """Return the process-wide loader for ``path``."""
+    key = (str(Path(path).resolve()), str(cache_dir) if cache_dir else None)
+    if key not in _loaders:
+        _loaders[key] = TaxonomyLoader(path, cache_dir)
+    return _loaders[key]
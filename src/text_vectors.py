@@ -0,0 +1,81 @@
+"""
+Compact TF-IDF term vectors for article text.
+
+An article becomes its ``max_terms`` highest-weighted terms (title words count
+twice), L2-normalised, so vectors stay small however long the description is.
+Document frequencies are kept in a Count-Min sketch, which gives IDF weights
+in constant memory and can be updated one article at a time.
+"""
+
+import html
+import math
+from collections import Counter
+from typing import Dict, List, Optional
+
+from trends import STOPWORDS, TAG_PATTERN, WORD_PATTERN, CountMinSketch
+
+TermVector = Dict[str, float]
+
+
+def cosine(a: TermVector, b: TermVector) -> float:
+    """Dot product of two L2-normalised term vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b[term] for term, weight in a.items() if term in b)
+
+
+class TermVectorizer:
+    """Builds TF-IDF term vectors while counting document frequencies as it goes."""
+
+    def __init__(self, max_terms: int = 20, title_weight: int = 2,
+                 sketch_width: int = 16384, sketch_depth: int = 4):
+        """
+        Args:
+            max_terms: Terms kept per vector
+            title_weight: How many times a title word counts relative to description words
+            sketch_width: Count-Min sketch columns for document frequencies
+            sketch_depth: Count-Min sketch rows for document frequencies
+        """
+        self.max_terms = max_terms
+        self.title_weight = title_weight
+        self.documents = 0
+        self.document_frequencies = CountMinSketch(sketch_width, sketch_depth)
+
+    @staticmethod
+    def words(text: str) -> List[str]:
+        """Lower-cased terms of ``text`` with markup and stopwords removed."""
+        words = WORD_PATTERN.findall(html.unescape(TAG_PATTERN.sub(' ', text or '')).lower())
+        return [word for word in words if len(word) > 2 and word not in STOPWORDS]
+
+    def term_counts(self, title: str, description: str = '') -> Counter:
+        counts = Counter(self.words(description))
+        for word in self.words(title):
+            counts[word] += self.title_weight
+        return counts
+
+    def vectorize(self, title: str, description: str = '', update: bool = True) -> Optional[TermVector]:
+        """
+        Return the article's term vector, or None if it has no usable terms.
+
+        With ``update`` the article is also counted in the document frequencies,
+        which is what ingestion wants; lookups for existing articles pass False.
+        """
+        counts = self.term_counts(title, description)
+        if not counts:
+            return None
+
+        if update:
+            self.documents += 1
+            for term in counts:
+                self.document_frequencies.add(term)
+
+        documents = self.documents
+        df = self.document_frequencies
+        weights = {
+            # Sketch estimates can overcount, so df is capped at the document count
+            term: (1 + math.log(count)) * (math.log((1 + documents) / (1 + min(df.estimate(term), documents))) + 1)
+            for term, count in counts.items()
+        }
+        top = sorted(weights.items(), key=lambda x: x[1], reverse=True)[:self.max_terms]
+        norm = math.sqrt(sum(weight * weight for _, weight in top))
+        return {term: weight / norm for term, weight in top}
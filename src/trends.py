@@ -0,0 +1,313 @@
+"""
+Streaming detection of emerging phrases in ingested articles.
+
+Each article's title and description are broken into 1-3 word phrases, and
+every phrase is counted once per article in a time bucket (6 hours by
+default). A bucket holds a Space-Saving summary of its most frequent phrases
+and a Count-Min sketch that estimates the count of any phrase, so each bucket
+has a fixed size however many articles arrive. Only the buckets in the recent
+window and the baseline window before it are kept.
+
+A phrase is trending when its count in the recent window is well above what
+the baseline window predicts at the same article volume. ``TrendTracker``
+persists the detector between fetch runs so it is updated incrementally with
+each batch of new articles rather than recomputed over history.
+"""
+
+import hashlib
+import heapq
+import html
+import logging
+import math
+import re
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from state_store import load_state, save_state, update_state
+
+DEFAULT_TRENDS_PATH = "data/trends.pickle"
+
+# Phrases may not start or end with one of these words
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have
+having he her here hers him his how i if in into is it its itself just me more most my new no nor not
+now of off on once only or other our out over own said same says she should so some such than that the
+their them then there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your
+""".split())
+
+WORD_PATTERN = re.compile(r"[a-z][a-z0-9'&-]*[a-z0-9]|[a-z]")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+logger = logging.getLogger(__name__)
+
+
+def extract_phrases(text: str, max_ngram: int = 3) -> Set[str]:
+    """Distinct 1..max_ngram word phrases in ``text`` that do not start or end with a stopword."""
+    # Feed descriptions often carry markup and entities such as &nbsp;
+    words = WORD_PATTERN.findall(html.unescape(TAG_PATTERN.sub(' ', text)).lower())
+    phrases = set()
+    for i, word in enumerate(words):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 2:
+            phrases.add(word)
+        for n in range(2, max_ngram + 1):
+            last = words[i + n - 1] if i + n <= len(words) else None
+            if last is None:
+                break
+            if last not in STOPWORDS:
+                phrases.add(' '.join(words[i:i + n]))
+    return phrases
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter summary holding at most ``capacity`` counters.
+
+    A new item arriving when every counter is in use replaces the item with the
+    smallest count and inherits that count, so counts are upper bounds that
+    overestimate by at most the inherited amount (kept in ``errors``).
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # Min-heap of (count, item); entries left behind by increments are skipped lazily
+        self._heap = []
+
+    def add(self, item: str, count: int = 1):
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+        else:
+            floor = self._evict_min()
+            counts[item] = floor + count
+            self.errors[item] = floor
+
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i) for i, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def _evict_min(self) -> int:
+        """Drop the item with the smallest count and return its count."""
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                del self.counts[item]
+                del self.errors[item]
+                return count
+
+    def __getstate__(self):
+        # The heap is rebuilt on load rather than pickled with its stale entries
+        return {'capacity': self.capacity, 'counts': self.counts, 'errors': self.errors}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._heap = [(c, i) for i, c in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def top(self, limit: Optional[int] = None) -> List[tuple]:
+        """(item, count) pairs by descending count."""
+        return heapq.nlargest(limit or len(self.counts), self.counts.items(), key=lambda x: x[1])
+
+
+class CountMinSketch:
+    """Count-Min sketch with conservative update; estimates never undercount."""
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = array('I', bytes(4 * width * depth))
+
+    def _cells(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, item: str, count: int = 1):
+        table = self.table
+        cells = self._cells(item)
+        target = min(table[cell] for cell in cells) + count
+        for cell in cells:
+            if table[cell] < target:
+                table[cell] = target
+
+    def estimate(self, item: str) -> int:
+        table = self.table
+        return min(table[cell] for cell in self._cells(item))
+
+
+class _Bucket:
+    """Phrase counts for one time bucket."""
+
+    def __init__(self, capacity: int, sketch_width: int, sketch_depth: int):
+        self.articles = 0
+        self.heavy = SpaceSaving(capacity)
+        self.sketch = CountMinSketch(sketch_width, sketch_depth)
+
+
+class TrendDetector:
+    """Sliding-window phrase counts comparing a recent window against a baseline window."""
+
+    def __init__(self, bucket_hours: float = 6, recent_buckets: int = 4, baseline_buckets: int = 28,
+                 capacity: int = 1000, max_ngram: int = 3, sketch_width: int = 8192, sketch_depth: int = 4):
+        """
+        Args:
+            bucket_hours: Width of each time bucket
+            recent_buckets: Buckets in the recent window (default: last 24 hours)
+            baseline_buckets: Buckets in the baseline window before it (default: 7 days)
+            capacity: Heavy-hitter phrases tracked per bucket
+            max_ngram: Longest phrase counted, in words
+            sketch_width: Count-Min sketch columns per bucket
+            sketch_depth: Count-Min sketch rows per bucket
+        """
+        self.bucket_seconds = bucket_hours * 3600
+        self.recent_buckets = recent_buckets
+        self.baseline_buckets = baseline_buckets
+        self.capacity = capacity
+        self.max_ngram = max_ngram
+        self.sketch_width = sketch_width
+        self.sketch_depth = sketch_depth
+        self.buckets: Dict[int, _Bucket] = {}
+
+    @property
+    def recent_hours(self) -> float:
+        return self.recent_buckets * self.bucket_seconds / 3600
+
+    @property
+    def baseline_hours(self) -> float:
+        return self.baseline_buckets * self.bucket_seconds / 3600
+
+    def _bucket_index(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def _oldest_index(self, now_index: int) -> int:
+        return now_index - self.recent_buckets - self.baseline_buckets + 1
+
+    def add_article(self, article: Dict, now: Optional[float] = None) -> bool:
+        """Count an article's phrases in the bucket of its publication time. Returns False if too old."""
+        now = now if now is not None else time.time()
+        published = article.get('published')
+        timestamp = min(published.timestamp(), now) if isinstance(published, datetime) else now
+
+        index = self._bucket_index(timestamp)
+        if index < self._oldest_index(self._bucket_index(now)):
+            return False
+
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            bucket = self.buckets[index] = _Bucket(self.capacity, self.sketch_width, self.sketch_depth)
+
+        bucket.articles += 1
+        text = f"{article.get('title') or ''}. {article.get('description') or ''}"
+        for phrase in extract_phrases(text, self.max_ngram):
+            bucket.heavy.add(phrase)
+            bucket.sketch.add(phrase)
+        return True
+
+    def update(self, articles: Iterable[Dict], now: Optional[float] = None) -> int:
+        """Count a batch of newly ingested articles and drop expired buckets. Returns articles counted."""
+        now = now if now is not None else time.time()
+        added = sum(1 for article in articles if self.add_article(article, now))
+
+        oldest = self._oldest_index(self._bucket_index(now))
+        for index in [index for index in self.buckets if index < oldest]:
+            del self.buckets[index]
+        return added
+
+    def trending(self, limit: int = 20, min_count: int = 3, min_growth: float = 2.0,
+                 exclude: Iterable[str] = (), now: Optional[float] = None) -> List[Dict]:
+        """
+        Phrases whose recent count is at least ``min_count`` and ``min_growth`` times
+        the count the baseline window predicts for the recent article volume.
+
+        Returns dicts with phrase, count, expected and score, by descending score.
+        Phrases in ``exclude`` (e.g. existing taxonomy keywords) are skipped, as is
+        any phrase mostly accounted for by a longer trending phrase containing it.
+        """
+        now_index = self._bucket_index(now if now is not None else time.time())
+        recent = [self.buckets[i] for i in range(now_index - self.recent_buckets + 1, now_index + 1)
+                  if i in self.buckets]
+        baseline = [self.buckets[i] for i in range(self._oldest_index(now_index), now_index - self.recent_buckets + 1)
+                    if i in self.buckets]
+
+        recent_articles = sum(bucket.articles for bucket in recent)
+        baseline_articles = sum(bucket.articles for bucket in baseline)
+        if not recent_articles:
+            return []
+
+        exclude = set(exclude)
+        candidates = {phrase for bucket in recent for phrase in bucket.heavy.counts} - exclude
+
+        results = []
+        for phrase in candidates:
+            count = sum(bucket.sketch.estimate(phrase) for bucket in recent)
+            if count < min_count:
+                continue
+
+            expected = 0.0
+            if baseline_articles:
+                baseline_count = sum(bucket.sketch.estimate(phrase) for bucket in baseline)
+                expected = baseline_count * recent_articles / baseline_articles
+            if count < min_growth * expected:
+                continue
+
+            results.append({
+                'phrase': phrase,
+                'count': count,
+                'expected': expected,
+                'score': (count - expected) / math.sqrt(expected + 1),
+            })
+
+        # Prefer "interest rate cut" over "rate cut" when the longer phrase covers most uses
+        counts = {r['phrase']: r['count'] for r in results}
+        results = [
+            r for r in results
+            if not any(
+                longer != r['phrase'] and f" {r['phrase']} " in f" {longer} " and count >= 0.8 * r['count']
+                for longer, count in counts.items()
+            )
+        ]
+
+        results.sort(key=lambda r: (r['score'], r['count']), reverse=True)
+        return results[:limit]
+
+
+class TrendTracker:
+    """Keeps a TrendDetector on disk and updates it with each batch of newly stored articles."""
+
+    def __init__(self, path: str = DEFAULT_TRENDS_PATH, **detector_options):
+        """
+        Args:
+            path: Pickle file holding the detector state
+            detector_options: TrendDetector arguments used when no state exists yet
+        """
+        self.path = Path(path)
+        self.detector_options = detector_options
+
+    def load(self) -> TrendDetector:
+        """Return the saved detector, or a new one if there is none (or it is unreadable)."""
+        return load_state(self.path, lambda: TrendDetector(**self.detector_options))
+
+    def save(self, detector: TrendDetector):
+        """Write the detector state atomically."""
+        save_state(self.path, detector)
+
+    def __call__(self, articles: List[Dict]) -> int:
+        """Pipeline observer: add new articles to the saved trend state."""
+        # Locked so that overlapping fetch runs do not lose each other's updates
+        with update_state(self.path, lambda: TrendDetector(**self.detector_options)) as detector:
+            added = detector.update(articles)
+        logger.info(f"Trend detector updated with {added} articles")
+        return added